@@ -2,10 +2,11 @@ import tkinter as tk
 from tkinter import messagebox
 
 import customtkinter as ctk
-from settings.config import THEME_MODE
+from settings.config import PREWARM_AFTER_LOGIN, PREWARM_DELAY_MS, THEME_MODE
 from utils.widget_utils import center_dialog, center_window, open_link, set_icon
 
 from utils.mixins import FormDialogMixin
+from utils.prewarm import prewarm_modules
 
 # Constants
 PLACEHOLDER_DESCRIPTION = "Enter detailed service description..."
@@ -33,6 +34,10 @@ class App(FormDialogMixin, ctk.CTk):
         # Create Menu
         self.create_menu()
 
+        if PREWARM_AFTER_LOGIN:
+            # Load the search/export modules while the user reads the window
+            self.after(PREWARM_DELAY_MS, prewarm_modules)
+
     # Define Menu theme settings
     def create_menu(self):
         menu_bar = tk.Menu(self)
@@ -0,0 +1,90 @@
+"""
+Micro-benchmark: per-call latency of a small query with and without pooling.
+
+Usage (from the pcform directory):
+    python -m benchmarks.db_pool --calls 2000 --rows 5000
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+from statistics import median
+
+from services.database import close_all_pools, get_db_connection, open_connection
+
+
+def _seed(db_path: str, rows: int) -> None:
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE bench (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT)"
+        )
+        conn.executemany(
+            "INSERT INTO bench (name) VALUES (?)",
+            ((f"customer {i}",) for i in range(rows)),
+        )
+
+
+def _time_calls(func, calls: int) -> list:
+    samples = []
+    for i in range(calls):
+        start = time.perf_counter()
+        func(i)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def run(calls: int, rows: int) -> dict:
+    """Return median/p95 per-call latency (microseconds) for both strategies."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        _seed(db_path, rows)
+
+        def unpooled(i):
+            # What every repository call did before: connect, query, close
+            conn = open_connection(db_path, pragmas={})
+            try:
+                conn.execute(
+                    "SELECT * FROM bench WHERE id = ?", (i % rows + 1,)
+                ).fetchall()
+                conn.commit()
+            finally:
+                conn.close()
+
+        def pooled(i):
+            with get_db_connection(db_path) as conn:
+                conn.execute(
+                    "SELECT * FROM bench WHERE id = ?", (i % rows + 1,)
+                ).fetchall()
+
+        results = {}
+        try:
+            for name, func in (("unpooled", unpooled), ("pooled", pooled)):
+                func(0)  # warm up OS file cache / pool
+                samples = sorted(_time_calls(func, calls))
+                results[name] = {
+                    "median_us": median(samples) * 1e6,
+                    "p95_us": samples[int(len(samples) * 0.95) - 1] * 1e6,
+                }
+        finally:
+            close_all_pools()  # before the temporary database is removed
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--rows", type=int, default=5000)
+    args = parser.parse_args()
+
+    results = run(args.calls, args.rows)
+    print(f"{'strategy':<10} {'median (us)':>12} {'p95 (us)':>10}")
+    for name, stats in results.items():
+        print(f"{name:<10} {stats['median_us']:>12.1f} {stats['p95_us']:>10.1f}")
+    speedup = results["unpooled"]["median_us"] / results["pooled"]["median_us"]
+    print(f"\npooled is {speedup:.1f}x faster per call")
+
+
+if __name__ == "__main__":
+    main()
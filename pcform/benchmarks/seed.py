@@ -0,0 +1,168 @@
+"""
+Synthetic contracts for benchmarks and testing at scale.
+
+Records mix Persian and Latin text the way real data does: Persian and
+English names, device models, serials, problems and notes, a share of them
+typed with Arabic letters/digits (ي, ك, ٣) so normalized search gets
+exercised, dates spread over the last years and a few favorites. The same
+seed always gives the same records.
+
+Usage (from the pcform directory):
+    python -m benchmarks.seed --rows 100000                  # the app database
+    python -m benchmarks.seed --rows 1000000 --db /tmp/big.db
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator
+
+PERSIAN_FIRST_NAMES = [
+    "علی", "محمد", "حسین", "رضا", "مهدی", "امیر", "سارا", "مریم", "زهرا", "فاطمه",
+    "نرگس", "کیان", "پویا", "یاسمن", "نیلوفر", "حمید", "مجید", "شیرین", "بهاره", "آرش",
+]
+PERSIAN_LAST_NAMES = [
+    "کریمی", "محمدی", "حسینی", "رضایی", "احمدی", "موسوی", "جعفری", "کاظمی", "صادقی",
+    "یزدانی", "قاسمی", "نوری", "شریفی", "اکبری", "تهرانی", "کیانی", "رحیمی", "ملکی",
+]
+LATIN_FIRST_NAMES = [
+    "Ali", "Sara", "John", "Maria", "David", "Emma", "Reza", "Lena", "Omid", "Nina",
+    "Peter", "Anna", "Kian", "Laura", "Mehdi",
+]
+LATIN_LAST_NAMES = [
+    "Karimi", "Smith", "Mohammadi", "Miller", "Hosseini", "Brown", "Rezaei", "Wilson",
+    "Ahmadi", "Taylor", "Jafari", "Schmidt",
+]
+DEVICE_MODELS = [
+    "Dell Latitude 5420", "Dell Inspiron 15 3511", "Dell XPS 13 9310", "HP ProBook 450 G8",
+    "HP EliteBook 840 G7", "HP Pavilion 15", "Lenovo ThinkPad T14", "Lenovo IdeaPad 3",
+    "Lenovo Legion 5", "ASUS VivoBook 15", "ASUS ROG Strix G15", "ASUS ZenBook 14",
+    "Acer Aspire 7", "Acer Nitro 5", "Apple MacBook Air M1", "Apple MacBook Pro 14",
+    "MSI GF63 Thin", "Samsung Galaxy Book2", "لپ تاپ ایسوس", "کیس اسمبل شده",
+    "پرینتر اچ پی", "مانیتور سامسونگ",
+]
+SERIAL_PREFIXES = ["CN", "5CD", "PF", "SN", "C02", "K8N", "NXA", "H2N"]
+DEVICE_PROBLEMS = [
+    "صفحه نمایش شکسته", "کیبورد کار نمی‌کند", "باتری شارژ نمی‌شود", "روشن نمی‌شود",
+    "ویندوز بالا نمی‌آید", "صدای فن زیاد است", "هارد خراب شده", "ویروسی شده",
+    "شارژر سوخته", "تاچ پد کار نمی‌کند", "Broken screen", "Battery not charging",
+    "No power", "Keyboard not working", "Overheating", "Blue screen on boot",
+    "Hard drive failure", "Wi-Fi not connecting",
+]
+DESCRIPTION_PHRASES = [
+    "مشتری اعلام کرد دستگاه از دیروز مشکل دارد.",
+    "دستگاه با کیف و شارژر تحویل گرفته شد.",
+    "بدنه دستگاه خط و خش دارد.",
+    "نیاز به تعویض قطعه و سفارش از تهران.",
+    "اطلاعات مشتری باید پشتیبان‌گیری شود.",
+    "Customer needs the laptop back by next week.",
+    "Device received without charger.",
+    "Liquid damage suspected on the motherboard.",
+    "Warranty sticker intact.",
+    "Backup of user data requested before repair.",
+    "",
+]
+SERVICE_MEN = [
+    "مهندس رضایی", "مهندس کریمی", "آقای احمدی", "خانم موسوی", "Technician Smith",
+    "Technician Karimi", "مهندس یزدانی", "آقای نوری",
+]
+
+# Persian -> Arabic spellings, applied to ARABIC_VARIANT_SHARE of the records
+ARABIC_VARIANTS = str.maketrans({"ی": "ي", "ک": "ك", "۰": "٠", "۳": "٣", "۵": "٥"})
+ARABIC_VARIANT_SHARE = 0.1
+FAVORITE_SHARE = 0.03
+DATE_RANGE_DAYS = 3 * 365
+
+
+def generate_records(
+    count: int, seed: int = 42, start: datetime = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield ``count`` realistic contract records (no ids; the database assigns them).
+
+    Args:
+        count: Number of records
+        seed: Random seed; the same seed gives the same records
+        start: Newest created_at (default: now); dates go back DATE_RANGE_DAYS
+
+    Usage:
+        repo.insert_many(generate_records(10000))
+    """
+    rng = random.Random(seed)
+    newest = start or datetime.now().replace(microsecond=0)
+    alphanumeric = string.ascii_uppercase + string.digits
+    for _ in range(count):
+        if rng.random() < 0.6:
+            name = f"{rng.choice(PERSIAN_FIRST_NAMES)} {rng.choice(PERSIAN_LAST_NAMES)}"
+        else:
+            name = f"{rng.choice(LATIN_FIRST_NAMES)} {rng.choice(LATIN_LAST_NAMES)}"
+        serial = rng.choice(SERIAL_PREFIXES) + "".join(rng.choices(alphanumeric, k=8))
+        description = " ".join(
+            rng.sample(DESCRIPTION_PHRASES, rng.randint(1, 3))
+        ).strip()
+        phone = "۰۹۱۲" + "".join(rng.choices("۰۱۲۳۴۵۶۷۸۹", k=7))
+        if rng.random() < 0.3:
+            description = f"{description} تلفن: {phone}".strip()
+
+        record = {
+            "fullname": name,
+            "Device_Model": rng.choice(DEVICE_MODELS),
+            "Device_Serial": serial,
+            "ServiceMan": rng.choice(SERVICE_MEN),
+            "Device_Problem": rng.choice(DEVICE_PROBLEMS),
+            "Description": description or None,
+            "created_at": (
+                newest - timedelta(seconds=rng.randint(0, DATE_RANGE_DAYS * 86400))
+            ).strftime("%Y-%m-%d %H:%M:%S"),
+            "is_favorite": 1 if rng.random() < FAVORITE_SHARE else 0,
+        }
+        if rng.random() < ARABIC_VARIANT_SHARE:
+            for column in ("fullname", "Device_Problem", "Description"):
+                if record[column]:
+                    record[column] = record[column].translate(ARABIC_VARIANTS)
+        yield record
+
+
+def seed_database(repo, rows: int, seed: int = 42, progress=None) -> int:
+    """
+    Add ``rows`` generated records through PCFormRepository.insert_many.
+
+    Returns:
+        Number of records inserted
+    """
+    return repo.insert_many(generate_records(rows, seed), progress=progress)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000, help="records to add")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--db", help="database file (default: PCFORM_DB_PATH or the app's database)"
+    )
+    args = parser.parse_args()
+
+    if args.db:
+        # Read by settings.config, so set before the repositories are imported
+        os.environ["PCFORM_DB_PATH"] = args.db
+    from repositories.pcform_repo import PCFormRepository
+    from settings.config import PCFORM_DB_PATH
+
+    def progress(inserted):
+        print(f"\rInserted {inserted} of {args.rows}", end="", file=sys.stderr, flush=True)
+
+    start = time.perf_counter()
+    inserted = seed_database(PCFormRepository(), args.rows, args.seed, progress)
+    print(file=sys.stderr)
+    print(
+        f"Added {inserted} records to {PCFORM_DB_PATH} "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Startup import budget: time to import the login and main window modules.
+
+Each measurement runs in a fresh interpreter (cold imports, warm OS cache).
+Exits with status 1 if the fastest run is over budget or a module that
+should load lazily was imported, so CI can catch startup regressions.
+
+Usage (from the pcform directory):
+    python -m benchmarks.startup
+    python -m benchmarks.startup --runs 10 --login-budget-ms 200
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+PCFORM_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Stages of a cold start: what gets imported, and modules it must not pull in
+STAGES = {
+    # main.py up to the login window
+    "login": (
+        "main",
+        ("app", "utils.mixins", "exports.converter_service", "multiprocessing"),
+    ),
+    # after login: the main window (search, forms and exports load on first use)
+    "main_window": ("app", ()),
+}
+LAZY_MODULES = (
+    "search_form.search",
+    "search_form.database_info",
+    "create_form.form",
+    "exports.batch_export",
+    "exports.document_generator",
+    "exports.pdf_renderer",
+    "exports.table_export",
+    "services.table_import",
+    "openpyxl",
+    "docx",
+    "jdatetime",
+    "reportlab",
+)
+
+
+def measure(module: str, watch: tuple) -> dict:
+    """Import ``module`` in a fresh interpreter; return its time and watched modules loaded."""
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "ms = (time.perf_counter() - start) * 1000\n"
+        f"loaded = [m for m in {list(watch)!r} if m in sys.modules]\n"
+        "print(json.dumps({'ms': ms, 'loaded': loaded}))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PCFORM_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run(runs: int) -> dict:
+    """Fastest import time (ms) and unexpected modules per stage."""
+    results = {}
+    for stage, (module, extra_lazy) in STAGES.items():
+        watch = LAZY_MODULES + extra_lazy
+        samples = [measure(module, watch) for _ in range(runs)]
+        results[stage] = {
+            "module": module,
+            "best_ms": min(s["ms"] for s in samples),
+            "median_ms": sorted(s["ms"] for s in samples)[len(samples) // 2],
+            "eager": sorted({m for s in samples for m in s["loaded"]}),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--login-budget-ms", type=float, default=250)
+    parser.add_argument("--main-window-budget-ms", type=float, default=300)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    budgets = {"login": args.login_budget_ms, "main_window": args.main_window_budget_ms}
+    results = run(args.runs)
+
+    failures = []
+    for stage, stats in results.items():
+        stats["budget_ms"] = budgets[stage]
+        if stats["best_ms"] > budgets[stage]:
+            failures.append(
+                f"{stage}: {stats['best_ms']:.0f} ms is over the {budgets[stage]:.0f} ms budget"
+            )
+        if stats["eager"]:
+            failures.append(f"{stage}: imports {', '.join(stats['eager'])} eagerly")
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'stage':<12} {'module':<6} {'best (ms)':>10} {'median':>8} {'budget':>7}")
+        for stage, stats in results.items():
+            print(
+                f"{stage:<12} {stats['module']:<6} {stats['best_ms']:>10.1f} "
+                f"{stats['median_ms']:>8.1f} {stats['budget_ms']:>7.0f}"
+            )
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""
+Benchmark suite: repository calls, in-memory search/sort, DOCX and table export.
+
+Seeds a database with generated contracts (see benchmarks/seed.py), times
+each operation and writes the results as JSON, so runs can be compared
+across commits.
+
+By default a fresh temporary database is used. With ``--db`` an existing
+file is used instead, topped up to ``--rows`` records if it has fewer; the
+records the benchmark creates are deleted again and favorites are toggled
+back.
+
+Usage (from the pcform directory):
+    python -m benchmarks.suite --rows 100000 --output before.json
+    python -m benchmarks.suite --rows 100000 --output after.json --compare before.json
+    python -m benchmarks.suite --rows 1000000 --groups repository,memory
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from statistics import median
+from typing import Any, Callable, Dict, List
+
+GROUPS = ("repository", "memory", "docx", "export")
+
+# (name, query) searched through the repository and the in-memory index
+SEARCH_QUERIES = [
+    ("persian_word", "کریمی"),
+    ("persian_phrase", "شارژ نمی"),
+    ("arabic_spelling", "كريمي"),
+    ("latin_word", "dell"),
+    ("latin_prefix", "thin"),
+    ("two_words", "lenovo legion"),
+    ("no_match", "zzqxj"),
+]
+SORT_COLUMNS = ["fullname", "created_at", "Device_Model", "is_favorite"]
+EXPORT_FORMATS = [".csv", ".csv.gz", ".jsonl", ".xlsx"]
+
+
+class Timings:
+    """Collects per-operation samples and summarizes them."""
+
+    def __init__(self):
+        self.results: Dict[str, Dict[str, Any]] = {}
+
+    def measure(self, name: str, func: Callable[[int], Any], runs: int, **extra) -> Any:
+        """Call ``func(i)`` ``runs`` times and record the timings under ``name``."""
+        samples = []
+        result = None
+        for i in range(runs):
+            start = time.perf_counter()
+            result = func(i)
+            samples.append(time.perf_counter() - start)
+        self.add(name, samples, **extra)
+        return result
+
+    def add(self, name: str, samples: List[float], **extra) -> None:
+        samples = sorted(samples)
+        self.results[name] = {
+            "runs": len(samples),
+            "median_ms": median(samples) * 1000,
+            "p95_ms": samples[max(0, int(len(samples) * 0.95) - 1)] * 1000,
+            "min_ms": samples[0] * 1000,
+            "max_ms": samples[-1] * 1000,
+            **extra,
+        }
+        print(f"  {name:<40} {self.results[name]['median_ms']:>10.2f} ms", file=sys.stderr)
+
+
+def bench_repository(repo, timings: Timings, runs: int, seed: int) -> None:
+    from benchmarks.seed import generate_records
+
+    rng = random.Random(seed)
+    max_id = repo._execute_one("SELECT MAX(id) AS id FROM pcform")["id"]
+
+    rows = timings.measure("repository.get_all", lambda i: repo.get_all(), max(1, runs // 10))
+    timings.results["repository.get_all"]["rows"] = len(rows)
+
+    for name, query in SEARCH_QUERIES:
+        found = timings.measure(f"repository.search.{name}", lambda i: repo.search(query), runs)
+        timings.results[f"repository.search.{name}"]["rows"] = len(found)
+
+    page_filters = {"device_model": "dell", "favorites_only": False}
+    timings.measure(
+        "repository.find.page",
+        lambda i: repo.find(page_filters, "created_at DESC", limit=200),
+        runs,
+    )
+
+    ids = [rng.randint(1, max_id) for _ in range(runs * 10)]
+    timings.measure("repository.get_by_id", lambda i: repo.get_by_id(ids[i]), len(ids))
+
+    # Each toggled record is toggled back, so favorites stay as seeded
+    toggled = ids[: runs * 2]
+    timings.measure(
+        "repository.toggle_favorite",
+        lambda i: repo.toggle_favorite(toggled[i // 2]),
+        len(toggled) * 2,
+    )
+
+    records = list(generate_records(runs * 2, seed + 1))
+    created = []
+    timings.measure(
+        "repository.create", lambda i: created.append(repo.create(records[i])), len(records)
+    )
+    timings.measure("repository.delete", lambda i: repo.delete(created[i]), len(created))
+
+
+def bench_memory(repo, rows: List[Dict[str, Any]], timings: Timings, runs: int) -> None:
+    """What the search window does with the rows it holds (memory mode)."""
+    from search_form.database_info import DatabaseInfo
+    from utils.token_index import TokenIndex
+
+    index = TokenIndex()
+    timings.measure("memory.index_build", lambda i: index.add_many(rows), 1, rows=len(rows))
+
+    for name, query in SEARCH_QUERIES:
+        found = timings.measure(f"memory.search.{name}", lambda i: index.search(query), runs)
+        timings.results[f"memory.search.{name}"]["rows"] = len(found)
+
+    # Narrowing a result as the user keeps typing (query_matcher over the rows)
+    matches = repo.query_matcher("dell lat")
+    timings.measure(
+        "memory.narrow", lambda i: [r for r in rows if matches(r)], max(1, runs // 10)
+    )
+
+    for column in SORT_COLUMNS:
+        key = DatabaseInfo._sort_key(column)
+        ordered = timings.measure(
+            f"memory.sort.{column}", lambda i: sorted(rows, key=key), max(1, runs // 10)
+        )
+    timings.measure("memory.sort.reverse", lambda i: ordered[::-1], runs)
+
+
+def bench_docx(rows: List[Dict[str, Any]], timings: Timings, runs: int, folder: str) -> None:
+    from exports.batch_export import record_to_form_data
+    from exports.document_generator import DocumentGenerator
+
+    generator = DocumentGenerator()
+    sample = rows[:runs] or rows
+    first = time.perf_counter()
+    generator.generate([record_to_form_data(sample[0])], os.path.join(folder, "first"))
+    timings.add("docx.first_document", [time.perf_counter() - first])
+    timings.measure(
+        "docx.generate",
+        lambda i: generator.generate(
+            [record_to_form_data(sample[i % len(sample)])], os.path.join(folder, f"c{i}")
+        ),
+        runs,
+    )
+
+
+def bench_export(repo, timings: Timings, folder: str) -> None:
+    from exports.table_export import export_records
+
+    for extension in EXPORT_FORMATS:
+        path = os.path.join(folder, f"contracts{extension}")
+        count = timings.measure(f"export{extension}", lambda i: export_records(repo, path), 1)
+        seconds = timings.results[f"export{extension}"]["median_ms"] / 1000
+        timings.results[f"export{extension}"].update(
+            rows=count,
+            rows_per_s=round(count / seconds) if seconds else None,
+            bytes=os.path.getsize(path),
+        )
+        os.remove(path)
+
+
+def environment(rows: int, seed: int, db_path: str) -> Dict[str, Any]:
+    """Machine and code version the results belong to."""
+    def git(*args):
+        try:
+            return subprocess.run(
+                ["git", *args], capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    return {
+        "commit": git("rev-parse", "--short", "HEAD"),
+        "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "rows": rows,
+        "seed": seed,
+        "database": db_path,
+    }
+
+
+def run(rows: int, runs: int, seed: int, groups: List[str], db_path: str) -> Dict[str, Any]:
+    """Seed (or top up) the database, then run the selected benchmark groups."""
+    # Read by settings.config, so set before the repositories are imported
+    os.environ["PCFORM_DB_PATH"] = db_path
+    from benchmarks.seed import seed_database
+    from repositories.pcform_repo import PCFormRepository
+
+    timings = Timings()
+    start = time.perf_counter()
+    repo = PCFormRepository()
+    timings.add("repository.open", [time.perf_counter() - start])
+
+    existing = repo._execute_one("SELECT COUNT(*) AS n FROM pcform")["n"]
+    if existing < rows:
+        start = time.perf_counter()
+        seed_database(repo, rows - existing, seed + existing)
+        timings.add("seed.insert_many", [time.perf_counter() - start], rows=rows - existing)
+
+    results = {"environment": environment(rows, seed, db_path), "results": timings.results}
+    with tempfile.TemporaryDirectory() as folder:
+        if "repository" in groups:
+            bench_repository(repo, timings, runs, seed)
+        if "memory" in groups or "docx" in groups:
+            loaded = repo.get_all()
+            if "memory" in groups:
+                bench_memory(repo, loaded, timings, runs)
+            if "docx" in groups:
+                bench_docx(loaded, timings, runs, folder)
+            del loaded
+        if "export" in groups:
+            bench_export(repo, timings, folder)
+    from services.query_stats import query_stats
+
+    # Every statement the benchmark ran, grouped by shape (see services/query_stats.py)
+    results["queries"] = query_stats.snapshot()
+    return results
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any]) -> None:
+    """Print median times side by side with the change against a baseline run."""
+    before, after = baseline["results"], current["results"]
+    print(
+        f"\n{'operation':<40} {'before (ms)':>12} {'after (ms)':>12} {'change':>8}"
+        f"   ({baseline['environment'].get('commit')} -> "
+        f"{current['environment'].get('commit')})"
+    )
+    for name, stats in after.items():
+        if name not in before:
+            continue
+        old, new = before[name]["median_ms"], stats["median_ms"]
+        change = f"{(new - old) / old * 100:+.0f}%" if old else "n/a"
+        print(f"{name:<40} {old:>12.2f} {new:>12.2f} {change:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000, help="records in the database")
+    parser.add_argument("--runs", type=int, default=20, help="repetitions of fast operations")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--groups", default=",".join(GROUPS), help=f"comma-separated subset of {', '.join(GROUPS)}"
+    )
+    parser.add_argument("--db", help="database to use (default: a temporary file)")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    args = parser.parse_args()
+
+    groups = [g.strip() for g in args.groups.split(",") if g.strip()]
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        parser.error(f"unknown group(s): {', '.join(sorted(unknown))}")
+    if args.rows < 1 or args.runs < 1:
+        parser.error("--rows and --runs must be at least 1")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.abspath(args.db) if args.db else os.path.join(tmp, "bench.db")
+        results = run(args.rows, args.runs, args.seed, groups, db_path)
+        from services.database import close_all_pools
+
+        close_all_pools()  # before the temporary database is removed
+
+    text = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        print(f"Results written to {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(json.load(f), results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Command-line access to the contract database, no window needed.
+
+Usage (from the pcform directory):
+    python cli.py export contracts.csv
+    python cli.py export today.jsonl.gz --date-from 2024-05-01 --date-to 2024-05-01
+    python cli.py --db /data/pcform_db.db export dell.xlsx --query dell --order-by "fullname ASC"
+    python cli.py import legacy.xlsx --rejects rejected.csv
+    python cli.py --query-stats export contracts.csv
+"""
+
+import argparse
+import os
+import sys
+
+
+def _add_export_parser(subparsers) -> None:
+    parser = subparsers.add_parser(
+        "export",
+        help="stream records to CSV, JSON Lines or Excel",
+        description="Stream records (all, a search, or filtered) to a file. "
+        "The format follows the extension: .csv, .jsonl, .xlsx, "
+        "or .csv.gz / .jsonl.gz for gzip-compressed output.",
+    )
+    parser.add_argument("output", help="destination file")
+    parser.add_argument("--query", help="search text (every word must match)")
+    parser.add_argument("--fullname", help="customer name filter")
+    parser.add_argument("--device-model", help="device model filter")
+    parser.add_argument("--service-provider", help="service man filter")
+    parser.add_argument("--problem-type", help="device problem filter")
+    parser.add_argument("--date-from", help="created on or after (YYYY-MM-DD)")
+    parser.add_argument("--date-to", help="created on or before (YYYY-MM-DD)")
+    parser.add_argument("--favorites", action="store_true", help="favorites only")
+    parser.add_argument(
+        "--order-by", default="id DESC", help='sort order, e.g. "created_at ASC" (default: id DESC)'
+    )
+    parser.add_argument(
+        "--columns", help="comma-separated columns to export (default: all)"
+    )
+    parser.add_argument("--quiet", action="store_true", help="no progress output")
+    parser.set_defaults(handler=export_command)
+
+
+def export_command(args) -> int:
+    from exports.table_export import export_records
+    from repositories.pcform_repo import PCFormRepository
+    from settings.config import PCFORM_DB_PATH
+
+    if not os.path.exists(PCFORM_DB_PATH):
+        print(f"Error: database not found: {PCFORM_DB_PATH}", file=sys.stderr)
+        return 1
+
+    filters = {
+        "query": args.query,
+        "fullname": args.fullname,
+        "device_model": args.device_model,
+        "service_provider": args.service_provider,
+        "problem_type": args.problem_type,
+        "date_from": args.date_from,
+        "date_to": args.date_to,
+        "favorites_only": args.favorites,
+    }
+    columns = None
+    if args.columns:
+        columns = [c.strip() for c in args.columns.split(",") if c.strip()]
+        unknown = [c for c in columns if c not in PCFormRepository.VALID_COLUMNS]
+        if unknown:
+            print(f"Error: unknown column(s): {', '.join(unknown)}", file=sys.stderr)
+            return 2
+
+    def progress(message):
+        print(f"\r{message}", end="", file=sys.stderr, flush=True)
+
+    count = export_records(
+        PCFormRepository(),
+        args.output,
+        {k: v for k, v in filters.items() if v},
+        args.order_by,
+        columns,
+        progress=None if args.quiet else progress,
+    )
+    if not args.quiet:
+        print(file=sys.stderr)
+    print(f"Exported {count} records to {args.output}")
+    return 0
+
+
+def _add_import_parser(subparsers) -> None:
+    parser = subparsers.add_parser(
+        "import",
+        help="bulk-import records from CSV, JSON Lines or Excel",
+        description="Import contracts from a file whose first row (or JSON keys) "
+        "name the record columns (fullname, Device_Model, Device_Serial, ServiceMan, "
+        "Device_Problem, Description, created_at, is_favorite). Invalid rows are "
+        "reported and skipped.",
+    )
+    parser.add_argument("input", help=".csv, .jsonl, .xlsx, .csv.gz or .jsonl.gz file")
+    parser.add_argument(
+        "--batch-size", type=int,
+        help="records per transaction (default: IMPORT_BATCH_SIZE in settings/config.py)",
+    )
+    parser.add_argument("--rejects", help="write the rejected rows to this CSV file")
+    parser.add_argument("--quiet", action="store_true", help="no progress output")
+    parser.set_defaults(handler=import_command)
+
+
+def import_command(args) -> int:
+    from repositories.pcform_repo import PCFormRepository
+    from services.table_import import import_file
+    from settings.config import IMPORT_BATCH_SIZE
+
+    batch_size = IMPORT_BATCH_SIZE if args.batch_size is None else args.batch_size
+    if batch_size < 1:
+        print("Error: --batch-size must be at least 1", file=sys.stderr)
+        return 2
+
+    def progress(message):
+        print(f"\r{message}", end="", file=sys.stderr, flush=True)
+
+    report = import_file(
+        PCFormRepository(),
+        args.input,
+        batch_size,
+        progress=None if args.quiet else progress,
+    )
+    if not args.quiet:
+        print(file=sys.stderr)
+    print(report.summary())
+    if args.rejects and report.rejected:
+        report.save_rejected(args.rejects)
+        print(f"Rejected rows written to {args.rejects}")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--db", help="database file (default: PCFORM_DB_PATH or the app's database)"
+    )
+    parser.add_argument(
+        "--query-stats", action="store_true",
+        help="print the database statements run and their timings when done",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    _add_export_parser(subparsers)
+    _add_import_parser(subparsers)
+    args = parser.parse_args(argv)
+
+    if args.db:
+        # Read by settings.config, so set before the repositories are imported
+        os.environ["PCFORM_DB_PATH"] = args.db
+    try:
+        return args.handler(args)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if args.query_stats:
+            from services.query_stats import query_stats
+
+            print(query_stats.summary(), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,7 @@ import customtkinter as ctk
 from exports.pdf_converter import convert_docx_to_pdf, form_docx_to_pdf_handler
 from repositories.pcform_repo import PCFormRepository
 from settings.config import PERSIAN_FONT
+from utils.background import run_in_background
 from utils.widget_utils import set_icon
 
 # Constants
@@ -11,7 +12,7 @@ PLACEHOLDER_DESCRIPTION = "Enter detailed service description..."
 
 
 class FormDialog(ctk.CTkToplevel):
-    def __init__(self, parent, title, on_success_callback=None, **kwargs):
+    def __init__(self, parent, title, **kwargs):
         super().__init__(parent, **kwargs)
         self.title(title)
         self.maxsize(700, 750)
@@ -21,8 +22,9 @@ class FormDialog(ctk.CTkToplevel):
         self.entries = {}
         self.form_data = []
         self.pcform_db = PCFormRepository()
-        self.on_success_callback = on_success_callback
         self.is_saved = False
+        # Contracts still saving/exporting in the background
+        self.jobs_running = 0
 
         # Main container with padding
         main_frame = ctk.CTkFrame(self)
@@ -204,69 +206,115 @@ class FormDialog(ctk.CTkToplevel):
         )
 
     def _save_form_to_database_and_pdf(self, file_path):
-        """Save form data to database and export to PDF"""
+        """Save form data to database and export to PDF in the background
+
+        The form is cleared right away so the next contract can be entered
+        while this one is still being saved and converted; if the save
+        fails, the contract is put back into the form.
+        """
+        data_list = [item.copy() for item in self.get_data()]
+        fullname = data_list[0].get("fullname", "") if data_list else ""
+
+        self.jobs_running += 1
+        self._show_progress(f"Saving contract for {fullname}...")
+        self._clear_entries()
+
+        run_in_background(
+            self,
+            self._save_and_export,
+            data_list,
+            file_path,
+            on_success=lambda result: self._on_save_finished(fullname, *result),
+            on_error=lambda error: self._on_save_failed(error, data_list),
+            on_progress=self._show_progress,
+        )
+
+    def _save_and_export(self, data_list, file_path, progress):
+        """Background job: insert the record, then export its contract
+
+        Returns (file_path, pdf_error); pdf_error is None on success.
+        """
+        # Prepare data for database (map 'description' to 'Description')
+        db_data = self._prepare_database_data(data_list)
+
+        # Insert into database first and get inserted ID
+        # `db_data` is a list of dicts; repository.create expects a single dict
+        if not db_data:
+            raise ValueError("No data to save to database.")
+
+        progress("Saving to database...")
+        inserted_id = self.pcform_db.create(db_data[0])
+        if not inserted_id:
+            raise ValueError("Failed to save record to database.")
+
+        # Fetch freshly saved record to obtain created_at timestamp
+        record = self.pcform_db.get_by_id(inserted_id)
+        created_at = record.get("created_at") if record else None
+
+        # Build export payload from current form data and include created_at
+        export_payload = []
+        for item in data_list:
+            item_copy = item.copy()
+            if created_at:
+                item_copy["created_at"] = created_at
+            export_payload.append(item_copy)
+
+        # Try to create PDF using payload that includes saved timestamp
+        progress("Generating PDF...")
         try:
-            # Prepare data for database (map 'description' to 'Description')
-            db_data = self._prepare_database_data()
-
-            # Insert into database first and get inserted ID
-            # `db_data` is a list of dicts; repository.create expects a single dict
-            if not db_data:
-                raise ValueError("No data to save to database.")
-
-            inserted_id = self.pcform_db.create(db_data[0])
-            if not inserted_id:
-                raise ValueError("Failed to save record to database.")
-
-            # Fetch freshly saved record to obtain created_at timestamp
-            record = self.pcform_db.get_by_id(inserted_id)
-            created_at = record.get("created_at") if record else None
-
-            # Build export payload from current form data and include created_at
-            export_payload = []
-            for item in self.get_data():
-                item_copy = item.copy()
-                if created_at:
-                    item_copy["created_at"] = created_at
-                export_payload.append(item_copy)
-
-            # Try to create PDF using payload that includes saved timestamp
-            try:
-                form_docx_to_pdf_handler(export_payload, file_path)
-            except (IOError, OSError, ValueError) as pdf_error:
-                # PDF failed but DB save succeeded
+            form_docx_to_pdf_handler(export_payload, file_path)
+        except (IOError, OSError, ValueError, RuntimeError) as pdf_error:
+            # PDF failed but DB save succeeded
+            return file_path, pdf_error
+        return file_path, None
+
+    def _show_progress(self, message):
+        """Show job progress in the status label"""
+        if not self.winfo_exists():
+            return
+        if self.jobs_running > 1:
+            message += f" ({self.jobs_running} contracts in progress)"
+        self.status_label.configure(text=f"⏳ {message}", text_color="blue")
+
+    def _on_save_finished(self, fullname, file_path, pdf_error):
+        """Tk thread: the record was saved (and exported, unless pdf_error)"""
+        self.jobs_running -= 1
+        self.is_saved = True
+
+        if pdf_error is not None:
+            if self.winfo_exists():
                 self.status_label.configure(
                     text=f"⚠ Form saved to database, but PDF export failed: {str(pdf_error)}",
                     text_color="orange",
                 )
-                messagebox.showwarning(
-                    "Partial Success",
-                    f"Form data saved to database successfully.\n\nHowever, PDF export failed:\n{str(pdf_error)}\n\nPlease try exporting again from the Search window.",
-                )
-            else:
-                # Success
-                self.status_label.configure(
-                    text="✓ Form saved and contract exported successfully!",
-                    text_color="green",
-                )
-                messagebox.showinfo(
-                    "Success",
-                    f"Form saved successfully!\n\nContract exported to:\n{file_path}\n\nRecord added to database.",
-                )
-
-            # Mark as saved and cleanup
-            self.is_saved = True
-            self._callback_and_cleanup()
-
-        except (IOError, OSError, ValueError, AttributeError) as e:
-            error_msg = f"Error saving form: {str(e)}"
+            messagebox.showwarning(
+                "Partial Success",
+                f"Form data saved to database successfully.\n\nHowever, PDF export failed:\n{str(pdf_error)}\n\nPlease try exporting again from the Search window.",
+            )
+        elif self.winfo_exists():
+            text = f"✓ Contract for {fullname} saved and exported to {file_path}"
+            if self.jobs_running:
+                text += f" ({self.jobs_running} still in progress)"
+            self.status_label.configure(text=text, text_color="green")
+
+    def _on_save_failed(self, error, data_list):
+        """Tk thread: the record could not be saved; give the user their input back"""
+        self.jobs_running -= 1
+        error_msg = f"Error saving form: {str(error)}"
+        if self.winfo_exists():
             self.status_label.configure(text=error_msg, text_color="red")
-            messagebox.showerror("Error", error_msg)
-
-    def _prepare_database_data(self):
+            if data_list and self._form_is_empty():
+                self._restore_entries(data_list[0])
+            elif data_list:
+                # Don't overwrite a contract the user has started meanwhile
+                fullname = data_list[0].get("fullname", "")
+                error_msg += f"\n\nPlease enter the contract for {fullname} again."
+        messagebox.showerror("Error", error_msg)
+
+    def _prepare_database_data(self, data_list=None):
         """Prepare form data for database insertion"""
         db_data = []
-        for item in self.get_data():
+        for item in data_list if data_list is not None else self.get_data():
             db_item = item.copy()
             if "description" in db_item:
                 db_item["Description"] = db_item.pop("description")
@@ -301,25 +349,33 @@ class FormDialog(ctk.CTkToplevel):
                 Please try exporting again from the Search window.""",
             )
 
-    def _callback_and_cleanup(self):
-        """Callback and cleanup after successful save"""
-        # Callback to refresh search windows
-        if self.on_success_callback:
-            self.on_success_callback()
-
-        # Clear entry fields
+    def _clear_entries(self):
+        """Clear entry fields for the next contract"""
         for entry_widget in self.entries.values():
             if isinstance(entry_widget, ctk.CTkEntry):
                 entry_widget.delete(0, "end")
             elif isinstance(entry_widget, ctk.CTkTextbox):
                 entry_widget.delete("1.0", "end")
                 entry_widget.insert("1.0", PLACEHOLDER_DESCRIPTION)
+        self.entries["fullname"].focus_set()
+
+    def _form_is_empty(self) -> bool:
+        """True while nothing has been typed since the form was cleared"""
+        return all(
+            not value or value == PLACEHOLDER_DESCRIPTION
+            for value in self._collect_form_data().values()
+        )
 
-        # Option to close after successful save
-        if messagebox.askyesno(
-            "Close Form", "Form saved successfully. Close this window?"
-        ):
-            self.destroy()
+    def _restore_entries(self, data):
+        """Put a contract's values back into the entry fields"""
+        for entry_name, entry_widget in self.entries.items():
+            value = data.get(entry_name, "")
+            if isinstance(entry_widget, ctk.CTkEntry):
+                entry_widget.delete(0, "end")
+                entry_widget.insert(0, value)
+            elif isinstance(entry_widget, ctk.CTkTextbox):
+                entry_widget.delete("1.0", "end")
+                entry_widget.insert("1.0", value or PLACEHOLDER_DESCRIPTION)
 
     def get_data(self) -> list:
         return self.form_data
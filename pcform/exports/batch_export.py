@@ -0,0 +1,225 @@
+import csv
+import multiprocessing.util
+import os
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from settings.config import BATCH_EXPORT_WORKERS, EXPORT_TIMING_LOG
+
+EXPORT_FORMATS = ("pdf", "docx")
+
+# Characters Windows doesn't allow in file names
+INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+
+
+def record_to_form_data(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a database record to the field names the document generator expects."""
+    # Handle both 'Description' (DB) and 'description' (form) for compatibility
+    description_value = record.get("Description", "") or record.get("description", "")
+    return {
+        "fullname": record.get("fullname", ""),
+        "Device_Model": record.get("Device_Model", ""),
+        "Device_Serial": record.get("Device_Serial", ""),
+        "ServiceMan": record.get("ServiceMan", ""),
+        "Device_Problem": record.get("Device_Problem", ""),
+        "description": description_value,
+        # Pass through the original saved timestamp so exported document
+        # can show the actual save date instead of current time
+        "created_at": record.get("created_at", ""),
+    }
+
+
+def contract_filename(record: Dict[str, Any]) -> str:
+    """File name (without extension) for a record's contract."""
+    name = INVALID_FILENAME_CHARS.sub("_", str(record.get("fullname") or "Unknown"))[:80]
+    return f"Contract_{name.strip() or 'Unknown'}_{record.get('id')}"
+
+
+@dataclass
+class ExportResult:
+    """Outcome of exporting one contract."""
+
+    record_id: Any
+    fullname: str = ""
+    path: Optional[str] = None
+    error: Optional[str] = None
+    seconds: float = 0.0
+    # Milliseconds per export stage (see exports/timing.py)
+    stages: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchReport:
+    """Per-file results of a batch export."""
+
+    total: int
+    results: List[ExportResult] = field(default_factory=list)
+    cancelled: bool = False
+    seconds: float = 0.0
+
+    @property
+    def succeeded(self) -> List[ExportResult]:
+        return [r for r in self.results if r.ok]
+
+    @property
+    def failed(self) -> List[ExportResult]:
+        return [r for r in self.results if not r.ok]
+
+    @property
+    def skipped(self) -> int:
+        """Contracts never started because the batch was cancelled."""
+        return self.total - len(self.results)
+
+    def summary(self) -> str:
+        text = f"{len(self.succeeded)} of {self.total} contracts exported"
+        if self.failed:
+            text += f", {len(self.failed)} failed"
+        if self.cancelled:
+            text += f", {self.skipped} skipped (cancelled)"
+        return f"{text} in {self.seconds:.1f}s."
+
+    def stage_totals(self) -> List[tuple]:
+        """(stage, total ms) over all contracts, slowest first."""
+        totals: Dict[str, float] = {}
+        for result in self.results:
+            for name, ms in result.stages.items():
+                totals[name] = totals.get(name, 0.0) + ms
+        return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+    def timing_summary(self) -> str:
+        """Where the workers spent their time, stage by stage."""
+        worker_ms = sum(r.seconds for r in self.results) * 1000
+        lines = [f"batch export: {len(self.results)} contracts, {worker_ms:.0f} ms in workers"]
+        for name, ms in self.stage_totals():
+            share = f"{ms / worker_ms * 100:3.0f}%" if worker_ms else ""
+            lines.append(f"  {name:<32} {ms:>9.1f} ms {share}")
+        return "\n".join(lines)
+
+    def write_error_report(self, path: str) -> str:
+        """Write failed exports to a CSV file and return its path."""
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["id", "fullname", "error"])
+            for result in self.failed:
+                writer.writerow([result.record_id, result.fullname, result.error])
+        return path
+
+
+def _init_worker() -> None:
+    """Pool initializer: close this worker's converter when the process exits."""
+    from .converter_service import shutdown_converter_service
+
+    # Pool workers leave through os._exit, which skips atexit handlers;
+    # multiprocessing finalizers still run.
+    multiprocessing.util.Finalize(None, shutdown_converter_service, exitpriority=10)
+
+
+def export_contract(record: Dict[str, Any], folder: str, fmt: str = "pdf") -> ExportResult:
+    """Export one record's contract; errors are captured, never raised."""
+    from .timing import trace_export
+
+    started = time.perf_counter()
+    result = ExportResult(record.get("id"), str(record.get("fullname") or ""))
+    destination = os.path.join(folder, contract_filename(record))
+    # Not logged per contract; the stages are added up in the BatchReport
+    with trace_export(f"batch {fmt}", destination, log=False) as trace:
+        try:
+            if fmt == "docx":
+                from .document_generator import form_saveto_docx_handler
+
+                result.path = form_saveto_docx_handler([record_to_form_data(record)], destination)
+            else:
+                from .pdf_converter import form_docx_to_pdf_handler
+
+                result.path = form_docx_to_pdf_handler([record_to_form_data(record)], destination)
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+    result.stages = {name: ms for name, ms, _ in trace.stages()}
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+class BatchExporter:
+    """
+    Exports one contract file per record in parallel worker processes.
+
+    Each worker keeps its own converter engine warm for the whole batch.
+
+    Usage:
+        exporter = BatchExporter(fmt="pdf")
+        report = exporter.run(records, folder, progress=on_progress, cancel_event=event)
+        print(report.summary())
+    """
+
+    def __init__(self, fmt: str = "pdf", max_workers: Optional[int] = None):
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(
+                f"Unknown export format '{fmt}'. Choose one of: {', '.join(EXPORT_FORMATS)}"
+            )
+        self.fmt = fmt
+        self.max_workers = max_workers or BATCH_EXPORT_WORKERS or os.cpu_count() or 1
+
+    def run(
+        self,
+        records: Iterable[Dict[str, Any]],
+        folder: str,
+        progress: Optional[Callable[[int, int, ExportResult], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> BatchReport:
+        """
+        Export every record into ``folder`` and return the report.
+
+        ``progress(done, total, result)`` is called from this thread after
+        each contract. Setting ``cancel_event`` stops queued contracts;
+        the ones already rendering are allowed to finish.
+        """
+        records = list(records)
+        report = BatchReport(total=len(records))
+        started = time.perf_counter()
+        if not records:
+            return report
+
+        os.makedirs(folder, exist_ok=True)
+        workers = min(self.max_workers, len(records))
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            pending = {
+                pool.submit(export_contract, record, folder, self.fmt): record
+                for record in records
+            }
+            while pending:
+                done, _ = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    record = pending.pop(future)
+                    if future.cancelled():
+                        continue
+                    try:
+                        result = future.result()
+                    except Exception as e:  # worker process died
+                        result = ExportResult(
+                            record.get("id"),
+                            str(record.get("fullname") or ""),
+                            error=f"{type(e).__name__}: {e}",
+                        )
+                    report.results.append(result)
+                    if progress:
+                        progress(len(report.results), report.total, result)
+
+                if cancel_event is not None and cancel_event.is_set() and not report.cancelled:
+                    report.cancelled = True
+                    for future in pending:
+                        future.cancel()
+
+        report.seconds = time.perf_counter() - started
+        if EXPORT_TIMING_LOG and report.results:
+            print(f"⏱ {report.timing_summary()}")
+        return report
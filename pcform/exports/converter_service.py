@@ -0,0 +1,601 @@
+import atexit
+import os
+import queue
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from typing import Callable, Optional
+
+from settings.config import (
+    LIBREOFFICE_PATH,
+    PDF_CONVERTER_ENGINE,
+    PDF_CONVERTER_TIMEOUT,
+)
+
+from .timing import current_trace, span, use_trace
+
+
+class ConversionEngine(ABC):
+    """
+    A DOCX -> PDF engine owned by the converter worker thread.
+
+    start(), convert() and stop() are always called from the same thread;
+    kill() is called from the watchdog when a conversion hangs and must not
+    rely on the engine's own (stuck) connection.
+    """
+
+    name = "engine"
+    # Set by the watchdog: whether kill() ended the hung engine's process
+    killed = False
+
+    def start(self) -> None:
+        """Launch the engine (once per worker)."""
+
+    @abstractmethod
+    def convert(self, docx_path: str, pdf_path: str) -> None:
+        """Convert one document, raising on failure."""
+        pass
+
+    def is_alive(self) -> bool:
+        """False when the engine process has gone away."""
+        return True
+
+    def stop(self) -> None:
+        """Close the engine gracefully."""
+
+    def kill(self) -> bool:
+        """
+        Forcefully terminate a hung engine.
+
+        Returns True if its process is gone. Otherwise the retired worker
+        still calls stop() once the blocked conversion returns.
+        """
+        return False
+
+
+class WordEngine(ConversionEngine):
+    """Microsoft Word over COM, one private instance for the whole session."""
+
+    name = "word"
+    PDF_FORMAT = 17
+
+    def __init__(self):
+        self.word = None
+        self.pid = None
+
+    def start(self) -> None:
+        import pythoncom
+        import win32com.client
+
+        pythoncom.CoInitialize()
+        # DispatchEx starts a dedicated instance, so documents the user has
+        # open in their own Word window are never touched (or closed by us)
+        self.word = win32com.client.DispatchEx("Word.Application")
+        self.word.Visible = False
+        self.word.DisplayAlerts = False
+        self.pid = self._find_pid()
+        if self.pid is None:
+            print("Warning: Word's process id not found, a hung conversion can't be killed")
+
+    def _find_pid(self) -> Optional[int]:
+        """Process id of our Word instance, needed to kill it when hung."""
+        try:
+            import win32gui
+            import win32process
+
+            # Word exposes no pid, so find its main window by a unique caption
+            caption = f"pcform-converter-{uuid.uuid4().hex}"
+            self.word.Caption = caption
+            hwnd = win32gui.FindWindow("OpusApp", caption)
+            return win32process.GetWindowThreadProcessId(hwnd)[1] if hwnd else None
+        except Exception:
+            return None
+
+    def convert(self, docx_path: str, pdf_path: str) -> None:
+        doc = None
+        try:
+            doc = self.word.Documents.Open(docx_path, ReadOnly=True)
+            doc.SaveAs(pdf_path, FileFormat=self.PDF_FORMAT)
+        finally:
+            if doc:
+                try:
+                    doc.Close(SaveChanges=False)
+                except Exception:
+                    pass
+
+    def is_alive(self) -> bool:
+        try:
+            self.word.Documents.Count
+            return True
+        except Exception:
+            return False
+
+    def stop(self) -> None:
+        import pythoncom
+
+        if self.word:
+            try:
+                self.word.Quit(SaveChanges=False)
+            except Exception:
+                pass
+            self.word = None
+        pythoncom.CoUninitialize()
+
+    def kill(self) -> bool:
+        if not self.pid:
+            return False
+        try:
+            os.kill(self.pid, signal.SIGTERM)  # TerminateProcess on Windows
+        except OSError:
+            return False
+        return True
+
+
+class LibreOfficeEngine(ConversionEngine):
+    """
+    LibreOffice running headless.
+
+    With the ``uno`` bridge available a single soffice process is started and
+    every document is converted through it. Without it each conversion runs
+    ``soffice --convert-to``, still reusing one warm profile directory.
+    """
+
+    name = "libreoffice"
+    STARTUP_TIMEOUT = 30
+
+    def __init__(self):
+        self.soffice = None
+        self.profile_dir = None
+        self.process = None
+        self.desktop = None
+
+    def start(self) -> None:
+        self.soffice = (
+            LIBREOFFICE_PATH or shutil.which("soffice") or shutil.which("libreoffice")
+        )
+        if not self.soffice:
+            raise RuntimeError("LibreOffice (soffice) was not found.")
+
+        # Private profile: doesn't clash with a LibreOffice the user has open
+        self.profile_dir = tempfile.mkdtemp(prefix="pcform-lo-")
+
+        try:
+            import uno  # noqa: F401
+        except ImportError:
+            return  # command-line mode
+        self._start_listener()
+
+    def _profile_url(self) -> str:
+        return "file:///" + self.profile_dir.replace("\\", "/").lstrip("/")
+
+    def _start_listener(self) -> None:
+        import uno
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        self.process = subprocess.Popen(
+            [
+                self.soffice,
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--norestore",
+                f"--accept=socket,host=127.0.0.1,port={port};urp;",
+                f"-env:UserInstallation={self._profile_url()}",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local
+        )
+        deadline = time.monotonic() + self.STARTUP_TIMEOUT
+        while True:
+            try:
+                context = resolver.resolve(
+                    f"uno:socket,host=127.0.0.1,port={port};urp;StarOffice.ComponentContext"
+                )
+                break
+            except Exception:
+                if self.process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError("LibreOffice did not start.")
+                time.sleep(0.25)
+
+        self.desktop = context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+
+    def convert(self, docx_path: str, pdf_path: str) -> None:
+        if self.desktop is not None:
+            self._convert_uno(docx_path, pdf_path)
+        else:
+            self._convert_cli(docx_path, pdf_path)
+
+    def _convert_uno(self, docx_path: str, pdf_path: str) -> None:
+        import uno
+        from com.sun.star.beans import PropertyValue
+
+        def prop(name, value):
+            p = PropertyValue()
+            p.Name, p.Value = name, value
+            return p
+
+        doc = self.desktop.loadComponentFromURL(
+            uno.systemPathToFileUrl(docx_path), "_blank", 0, (prop("Hidden", True),)
+        )
+        try:
+            doc.storeToURL(
+                uno.systemPathToFileUrl(pdf_path),
+                (prop("FilterName", "writer_pdf_Export"),),
+            )
+        finally:
+            doc.close(True)
+
+    def _convert_cli(self, docx_path: str, pdf_path: str) -> None:
+        out_dir = tempfile.mkdtemp(dir=self.profile_dir)
+        try:
+            self.process = subprocess.Popen(
+                [
+                    self.soffice,
+                    "--headless",
+                    "--norestore",
+                    f"-env:UserInstallation={self._profile_url()}",
+                    "--convert-to",
+                    "pdf",
+                    "--outdir",
+                    out_dir,
+                    docx_path,
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            )
+            _, stderr = self.process.communicate()
+            produced = os.path.join(
+                out_dir, os.path.splitext(os.path.basename(docx_path))[0] + ".pdf"
+            )
+            if self.process.returncode != 0 or not os.path.exists(produced):
+                raise RuntimeError(stderr.decode(errors="replace").strip() or "soffice failed")
+            shutil.move(produced, pdf_path)
+        finally:
+            self.process = None
+            shutil.rmtree(out_dir, ignore_errors=True)
+
+    def is_alive(self) -> bool:
+        if self.desktop is None:
+            return True
+        return self.process is not None and self.process.poll() is None
+
+    def stop(self) -> None:
+        if self.desktop is not None:
+            try:
+                self.desktop.terminate()
+            except Exception:
+                pass
+            self.desktop = None
+        if self.process is not None:
+            try:
+                self.process.wait(5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+            self.process = None
+        if self.profile_dir:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+    def kill(self) -> bool:
+        process = self.process
+        if process is None:
+            return False
+        if process.poll() is None:
+            process.kill()
+            try:
+                process.wait(5)  # release its files before removing the profile
+            except subprocess.TimeoutExpired:
+                return False
+        # stop() is skipped for a killed engine, so clean up here
+        if self.profile_dir:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+        return True
+
+
+class StandInEngine(ConversionEngine):
+    """
+    Local stand-in for machines without an office suite (development, CI).
+
+    Renders the DOCX's text content - not its layout - with reportlab.
+    """
+
+    name = "standin"
+
+    def start(self) -> None:
+        from .pdf_renderer import NativePDFRenderer
+
+        self.renderer = NativePDFRenderer()
+
+    def convert(self, docx_path: str, pdf_path: str) -> None:
+        from docx import Document
+
+        source = Document(docx_path)
+        lines = [p.text for p in source.paragraphs]
+        for table in source.tables:
+            for row in table.rows:
+                lines.append("    ".join(cell.text for cell in row.cells))
+        self.renderer.render_text(lines, pdf_path)
+
+
+ENGINES = {
+    "word": WordEngine,
+    "libreoffice": LibreOfficeEngine,
+    "standin": StandInEngine,
+}
+
+
+def get_engine_class(name: str = None):
+    """Resolve PDF_CONVERTER_ENGINE (or ``name``) to an engine class."""
+    name = name or PDF_CONVERTER_ENGINE
+    if name == "auto":
+        if sys.platform == "win32":
+            name = "word"
+        elif LIBREOFFICE_PATH or shutil.which("soffice") or shutil.which("libreoffice"):
+            name = "libreoffice"
+        else:
+            print(
+                "Warning: no Word or LibreOffice found; PDFs from the Word backend "
+                "will be plain-text stand-ins without the contract layout "
+                '(install LibreOffice or set PDF_BACKEND = "native")'
+            )
+            name = "standin"
+    try:
+        return ENGINES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown converter engine '{name}'. "
+            f"Choose one of: auto, {', '.join(ENGINES)}"
+        ) from None
+
+
+class _Job:
+    def __init__(self, docx_path: str, pdf_path: str):
+        self.docx_path = docx_path
+        self.pdf_path = pdf_path
+        self.future = Future()
+        # Export timing: the worker records its stages into the caller's trace
+        self.trace = current_trace()
+        self.submitted = time.perf_counter()
+
+
+class ConverterService:
+    """
+    Long-lived DOCX -> PDF converter.
+
+    One worker thread owns the engine: it is started on the first conversion
+    and reused for every later one, so a batch of 50 contracts pays for one
+    application launch. A watchdog restarts the engine when a conversion
+    runs longer than ``timeout`` seconds; an engine that crashed is restarted
+    and the document retried once.
+
+    Usage:
+        service = get_converter_service()
+        service.convert("contract.docx", "contract.pdf")
+    """
+
+    def __init__(
+        self,
+        engine_factory: Callable[[], ConversionEngine] = None,
+        timeout: float = PDF_CONVERTER_TIMEOUT,
+    ):
+        self.engine_factory = engine_factory or get_engine_class()
+        self.timeout = timeout
+
+        self._queue: "queue.Queue[Optional[_Job]]" = queue.Queue()
+        self._lock = threading.Lock()
+        # Bumped to retire a worker (hung or shut down)
+        self._generation = 0
+        self._worker: Optional[threading.Thread] = None
+        self._engine: Optional[ConversionEngine] = None
+        # (job, started_at, generation) of the conversion in progress
+        self._current = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._closed = False
+        self.restarts = 0
+
+    def submit(self, docx_path: str, pdf_path: str) -> Future:
+        """Queue a conversion; the Future resolves to the PDF path."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Converter service has been shut down.")
+            if self._worker is None:
+                self._spawn_worker()
+                self._watchdog = threading.Thread(
+                    target=self._watch, name="pdf-converter-watchdog", daemon=True
+                )
+                self._watchdog.start()
+
+        job = _Job(docx_path, pdf_path)
+        self._queue.put(job)
+        return job.future
+
+    def convert(self, docx_path: str, pdf_path: str) -> str:
+        """Convert and wait for the result."""
+        return self.submit(docx_path, pdf_path).result()
+
+    def shutdown(self, wait: float = 10) -> None:
+        """Stop the worker and close the engine."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            worker = self._worker
+        self._stopped.set()
+        self._queue.put(None)
+        if worker is not None:
+            worker.join(wait)
+
+    # === WORKER ===
+
+    def _spawn_worker(self) -> None:
+        """Start a worker for a new generation (lock held)."""
+        self._generation += 1
+        self._worker = threading.Thread(
+            target=self._run,
+            args=(self._generation,),
+            name="pdf-converter",
+            daemon=True,
+        )
+        self._worker.start()
+
+    def _run(self, generation: int) -> None:
+        engine = None
+        try:
+            while generation == self._generation:
+                job = self._queue.get()
+                if job is None:
+                    break
+                if not job.future.set_running_or_notify_cancel():
+                    continue
+
+                with self._lock:
+                    self._current = (job, time.monotonic(), generation)
+                if job.trace is not None:
+                    job.trace.add_span("convert.queue", job.submitted, time.perf_counter())
+                try:
+                    with use_trace(job.trace):
+                        engine = self._convert(engine, job)
+                finally:
+                    with self._lock:
+                        if self._current and self._current[0] is job:
+                            self._current = None
+        finally:
+            # An engine the watchdog killed is left alone; the rest close
+            # cleanly, including a retired one it could not kill
+            if engine is not None and (generation == self._generation or not engine.killed):
+                try:
+                    engine.stop()
+                except Exception:
+                    pass
+
+    def _convert(self, engine, job: _Job):
+        """Run one job, restarting a crashed engine once. Returns the engine."""
+        for attempt in range(2):
+            try:
+                if engine is not None and not engine.is_alive():
+                    engine = None
+                if engine is None:
+                    new_engine = self.engine_factory()
+                    with self._lock:
+                        self._engine = new_engine
+                    with span("convert.engine_start"):
+                        new_engine.start()
+                    engine = new_engine
+
+                with span("convert.run"):
+                    engine.convert(job.docx_path, job.pdf_path)
+                self._finish(job, result=job.pdf_path)
+                return engine
+
+            except Exception as e:
+                crashed = engine is None or not engine.is_alive()
+                if crashed and attempt == 0 and not job.future.done():
+                    print(f"Warning: PDF converter crashed ({e}), restarting.")
+                    engine = None
+                    self.restarts += 1
+                    continue
+                self._finish(job, error=e)
+                return None if crashed else engine
+        return engine
+
+    def _finish(self, job: _Job, result=None, error: Exception = None) -> None:
+        """Resolve a job unless the watchdog already failed it."""
+        with self._lock:
+            if job.future.done():
+                return
+            if error is not None:
+                job.future.set_exception(error)
+            else:
+                job.future.set_result(result)
+
+    # === WATCHDOG ===
+
+    def _watch(self) -> None:
+        while not self._stopped.wait(1.0):
+            with self._lock:
+                current = self._current
+                if current is None:
+                    continue
+                job, started_at, generation = current
+                if time.monotonic() - started_at < self.timeout:
+                    continue
+
+                # Retire the hung worker and hand the queue to a fresh one
+                self._current = None
+                engine = self._engine
+                self._engine = None
+                if not job.future.done():
+                    job.future.set_exception(
+                        TimeoutError(
+                            f"PDF conversion took longer than {self.timeout}s."
+                        )
+                    )
+                self.restarts += 1
+                if not self._closed:
+                    self._spawn_worker()
+
+            print("Warning: PDF converter hung, restarting.")
+            if engine is not None:
+                try:
+                    engine.killed = engine.kill()
+                except Exception:
+                    pass
+                if not engine.killed:
+                    print("Warning: the hung PDF converter could not be killed.")
+
+
+_service: Optional[ConverterService] = None
+_service_lock = threading.Lock()
+
+
+def get_converter_service() -> ConverterService:
+    """Return the process-wide converter service, creating it once."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = ConverterService()
+        return _service
+
+
+def shutdown_converter_service() -> None:
+    """Close the shared converter (registered to run at interpreter exit)."""
+    global _service
+    with _service_lock:
+        service, _service = _service, None
+    if service is not None:
+        service.shutdown()
+
+
+def _forget_parent_service() -> None:
+    """
+    Forked child: drop the parent's converter.
+
+    Its worker and watchdog threads don't exist in the child, so jobs
+    queued on it would never run; the child starts its own on first use.
+    """
+    global _service, _service_lock
+    _service = None
+    _service_lock = threading.Lock()
+
+
+atexit.register(shutdown_converter_service)
+if hasattr(os, "register_at_fork"):  # POSIX only; Windows always spawns
+    os.register_at_fork(after_in_child=_forget_parent_service)
@@ -1,9 +1,12 @@
 import os
+import threading
 from datetime import datetime as pydatetime
+from io import BytesIO
 from typing import Any, Dict, List, Optional
 
 from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml.ns import qn
 from docx.shared import Inches, Pt
 from .sections.device_section import DeviceSection
 from .sections.parties_section import PartiesSection
@@ -11,9 +14,82 @@ from .sections.problem_section import ProblemSection, ServiceSection
 from .sections.signature_section import SignatureSection
 from .sections.terms_section import TermsSection
 from .styles import STYLES
+from .timing import span, trace_export
 from jdatetime import datetime as jdatetime
 
-from settings.config import LOGO_PATH
+from settings.config import LOGO_PATH, PDF_TERMS_AND_CONDITIONS
+
+# Shared with the native PDF renderer so both produce the same layout
+TITLE = "COMPUTER SERVICE CONTRACT"
+SUBTITLE = "Service Agreement & Work Order"
+FOOTER_TEXT = (
+    "This document serves as an official service contract and work order.\n"
+    "Thank you for your business! 🙏"
+)
+
+# Data-dependent sections, rendered in order for every contract
+CONTENT_SECTIONS = (PartiesSection, DeviceSection, ProblemSection, ServiceSection)
+
+# Placeholders in the cached skeleton, replaced for every contract
+CONTENT_MARKER = "{{contract_sections}}"
+DOCUMENT_ID_MARKER = "{{document_id}}"
+
+# Serialized skeleton documents, keyed by the settings they were built from
+_skeletons: Dict[tuple, bytes] = {}
+_skeletons_lock = threading.Lock()
+
+
+def _skeleton_key() -> tuple:
+    """Cache key: rebuild when the logo file or the terms text change."""
+    logo_mtime = None
+    if LOGO_PATH and os.path.exists(LOGO_PATH):
+        logo_mtime = os.path.getmtime(LOGO_PATH)
+    return (LOGO_PATH, logo_mtime, PDF_TERMS_AND_CONDITIONS)
+
+
+def clear_skeleton_cache() -> None:
+    """Drop cached skeletons (e.g. after changing styles at runtime)."""
+    with _skeletons_lock:
+        _skeletons.clear()
+
+
+def extract_date(data_list: List[Dict]) -> Optional[str]:
+    """Extract date from data if available."""
+    if not data_list:
+        return None
+
+    first = data_list[0]
+    return first.get("created_at") or first.get("date") or first.get("createdAt")
+
+
+def format_date(date_str: Optional[str]) -> str:
+    """Format a saved timestamp as a Jalali date for display."""
+    try:
+        if date_str:
+            for fmt in ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d"]:
+                try:
+                    dt = pydatetime.strptime(date_str, fmt)
+                    break
+                except ValueError:
+                    continue
+            else:
+                dt = pydatetime.now()
+
+            j_date = jdatetime.fromgregorian(datetime=dt)
+        else:
+            j_date = jdatetime.now()
+
+        return j_date.strftime(
+            f"%A، %d %B %Y - {j_date.hour:02d}:{j_date.minute:02d}"
+        )
+
+    except Exception:
+        return jdatetime.now().strftime("%Y/%m/%d")
+
+
+def document_id() -> str:
+    """Return the footer document ID (generation timestamp)."""
+    return f"Document ID: {pydatetime.now().strftime('%Y%m%d%H%M%S')}"
 
 
 class DocumentGenerator:
@@ -24,24 +100,85 @@ class DocumentGenerator:
 
     def generate(self, data_list: List[Dict[str, Any]], destination_path: str) -> str:
         """Generate professional DOCX document."""
+        # Static parts (margins, logo, title, signatures, terms, footer) come
+        # from a cached skeleton; only the data-dependent parts are built here
+        with span("docx.skeleton"):
+            self.document = Document(BytesIO(self._get_skeleton()))
+
+        self._fill_header(data_list)
+        self._fill_document_id()
+        self._insert_content_sections(data_list)
+
+        output_path = f"{destination_path}.docx"
+        with span("docx.save"):  # serialization and writing the file
+            self.document.save(output_path)
+
+        return output_path
+
+    # === SKELETON ===
+
+    def _get_skeleton(self) -> bytes:
+        """Serialized skeleton document, built once per settings."""
+        key = _skeleton_key()
+        with _skeletons_lock:
+            skeleton = _skeletons.get(key)
+            if skeleton is None:
+                skeleton = _skeletons[key] = self._build_skeleton()
+        return skeleton
+
+    def _build_skeleton(self) -> bytes:
+        """Build everything that is identical across contracts."""
         self.document = Document()
 
         self._setup_margins()
-        self._add_header(data_list)
+        self._add_header()
         self._add_logo()
         self._add_title()
 
-        for data in data_list:
-            self._add_content_sections(data)
+        self.document.add_paragraph(CONTENT_MARKER)
 
         self._add_signature_section()
         self._add_terms_section()
         self._add_footer()
 
-        output_path = f"{destination_path}.docx"
-        self.document.save(output_path)
+        buffer = BytesIO()
+        self.document.save(buffer)
+        self.document = None
+        return buffer.getvalue()
 
-        return output_path
+    def _fill_header(self, data_list: List[Dict]) -> None:
+        """Write the contract's date into the header run."""
+        header = self.document.sections[0].header
+        header.paragraphs[0].runs[0].text = self._format_date(
+            self._extract_date(data_list)
+        )
+
+    def _fill_document_id(self) -> None:
+        """Replace the footer's document ID placeholder."""
+        for para in reversed(self.document.paragraphs):
+            for run in para.runs:
+                if run.text == DOCUMENT_ID_MARKER:
+                    run.text = document_id()
+                    return
+
+    def _insert_content_sections(self, data_list: List[Dict[str, Any]]) -> None:
+        """Render the data sections and move them to the content marker."""
+        marker = next(
+            p._p for p in self.document.paragraphs if p.text == CONTENT_MARKER
+        )
+        body = self.document.element.body
+
+        # Sections append at the end of the body (before the final sectPr)
+        has_sect_pr = body[-1].tag == qn("w:sectPr")
+        start = len(body) - 1 if has_sect_pr else len(body)
+
+        for data in data_list:
+            self._add_content_sections(data)
+
+        end = len(body) - 1 if has_sect_pr else len(body)
+        for block in list(body)[start:end]:
+            marker.addprevious(block)
+        body.remove(marker)
 
     def _setup_margins(self) -> None:
         """Configure document margins."""
@@ -51,51 +188,24 @@ class DocumentGenerator:
             section.left_margin = STYLES.MARGINS.left
             section.right_margin = STYLES.MARGINS.right
 
-    def _add_header(self, data_list: List[Dict]) -> None:
-        """Add header with date/time."""
-        date_str = self._extract_date(data_list)
-
+    def _add_header(self) -> None:
+        """Add header run for the date/time (filled per contract)."""
         header = self.document.sections[0].header
         para = header.paragraphs[0] if header.paragraphs else header.add_paragraph()
         para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
 
-        formatted_date = self._format_date(date_str)
-        run = para.add_run(formatted_date)
+        run = para.add_run()
         run.font.size = Pt(10)
         run.font.name = "Arial"
         run.font.color.rgb = STYLES.SECONDARY_COLOR
 
     def _extract_date(self, data_list: List[Dict]) -> Optional[str]:
         """Extract date from data if available."""
-        if not data_list:
-            return None
-
-        first = data_list[0]
-        return first.get("created_at") or first.get("date") or first.get("createdAt")
+        return extract_date(data_list)
 
     def _format_date(self, date_str: Optional[str]) -> str:
         """Format date for display."""
-        try:
-            if date_str:
-                for fmt in ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d"]:
-                    try:
-                        dt = pydatetime.strptime(date_str, fmt)
-                        break
-                    except ValueError:
-                        continue
-                else:
-                    dt = pydatetime.now()
-
-                j_date = jdatetime.fromgregorian(datetime=dt)
-            else:
-                j_date = jdatetime.now()
-
-            return j_date.strftime(
-                f"%A، %d %B %Y - {j_date.hour:02d}:{j_date.minute:02d}"
-            )
-
-        except Exception:
-            return jdatetime.now().strftime("%Y/%m/%d")
+        return format_date(date_str)
 
     def _add_logo(self) -> None:
         """Add company logo if available."""
@@ -117,13 +227,13 @@ class DocumentGenerator:
 
         title_para = self.document.add_paragraph()
         title_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        title_run = title_para.add_run("COMPUTER SERVICE CONTRACT")
+        title_run = title_para.add_run(TITLE)
         STYLES.apply_font(title_run, STYLES.TITLE)
         title_run.font.color.rgb = STYLES.PRIMARY_COLOR
 
         subtitle_para = self.document.add_paragraph()
         subtitle_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        subtitle_run = subtitle_para.add_run("Service Agreement & Work Order")
+        subtitle_run = subtitle_para.add_run(SUBTITLE)
         STYLES.apply_font(subtitle_run, STYLES.SUBTITLE)
 
         line_para = self.document.add_paragraph()
@@ -136,10 +246,9 @@ class DocumentGenerator:
 
     def _add_content_sections(self, data: Dict[str, Any]) -> None:
         """Add all content sections."""
-        PartiesSection(self.document).render(data)
-        DeviceSection(self.document).render(data)
-        ProblemSection(self.document).render(data)
-        ServiceSection(self.document).render(data)
+        for section_class in CONTENT_SECTIONS:
+            with span(f"docx.section.{section_class.__name__}"):
+                section_class(self.document).render(data)
 
     def _add_signature_section(self) -> None:
         """Add signature section."""
@@ -161,17 +270,12 @@ class DocumentGenerator:
 
         footer_para = self.document.add_paragraph()
         footer_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        footer_run = footer_para.add_run(
-            "This document serves as an official service contract and work order.\n"
-            "Thank you for your business! 🙏"
-        )
+        footer_run = footer_para.add_run(FOOTER_TEXT)
         STYLES.apply_font(footer_run, STYLES.FOOTER)
 
         doc_id_para = self.document.add_paragraph()
         doc_id_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        doc_id_run = doc_id_para.add_run(
-            f"Document ID: {pydatetime.now().strftime('%Y%m%d%H%M%S')}"
-        )
+        doc_id_run = doc_id_para.add_run(DOCUMENT_ID_MARKER)
         doc_id_run.font.size = Pt(8)
         doc_id_run.font.color.rgb = STYLES.BORDER_COLOR
 
@@ -185,5 +289,6 @@ def form_saveto_docx_handler(
     data_list: List[Dict[str, Any]], destination_folder: str
 ) -> str:
     """Generate DOCX file - drop-in replacement."""
-    generator = DocumentGenerator()
-    return generator.generate(data_list, destination_folder)
+    with trace_export("contract docx", f"{destination_folder}.docx"):
+        generator = DocumentGenerator()
+        return generator.generate(data_list, destination_folder)
@@ -1,35 +1,32 @@
+import importlib.util
 import os
-from contextlib import contextmanager
 from typing import Optional
 
-from .document_generator import form_saveto_docx_handler
+from settings.config import PDF_BACKEND
+from .timing import span, trace_export
 
+PDF_BACKENDS = ("auto", "native", "word")
 
-class PDFConverter:
-    """Converts DOCX files to PDF."""
 
-    PDF_FORMAT = 17
+def get_pdf_backend() -> str:
+    """Resolve PDF_BACKEND to "native" or "word"."""
+    if PDF_BACKEND not in PDF_BACKENDS:
+        raise ValueError(
+            f"Unknown PDF backend '{PDF_BACKEND}'. "
+            f"Choose one of: {', '.join(PDF_BACKENDS)}"
+        )
+    if PDF_BACKEND == "auto":
+        return "native" if importlib.util.find_spec("reportlab") else "word"
+    return PDF_BACKEND
 
-    @contextmanager
-    def _get_word_app(self):
-        """Context manager for Word application."""
-        import win32com.client
 
-        word = None
-        try:
-            word = win32com.client.Dispatch("Word.Application")
-            word.Visible = False
-            word.DisplayAlerts = False
-            yield word
-        finally:
-            if word:
-                try:
-                    word.Quit(SaveChanges=False)
-                except Exception:
-                    pass
+class PDFConverter:
+    """Converts DOCX files to PDF through the shared converter service."""
 
     def convert(self, docx_path: str, pdf_path: Optional[str] = None) -> str:
         """Convert DOCX to PDF."""
+        from .converter_service import get_converter_service
+
         docx_path = os.path.abspath(docx_path)
         if not os.path.exists(docx_path):
             raise FileNotFoundError(f"DOCX file not found: {docx_path}")
@@ -38,19 +35,12 @@ class PDFConverter:
             pdf_path = docx_path.replace(".docx", ".pdf")
         pdf_path = os.path.abspath(pdf_path)
 
-        doc = None
-        with self._get_word_app() as word:
-            try:
-                doc = word.Documents.Open(docx_path, ReadOnly=True)
-                doc.SaveAs(pdf_path, FileFormat=self.PDF_FORMAT)
-            except Exception as e:
-                raise RuntimeError(f"PDF conversion failed: {e}")
-            finally:
-                if doc:
-                    try:
-                        doc.Close(SaveChanges=False)
-                    except Exception:
-                        pass
+        try:
+            get_converter_service().convert(docx_path, pdf_path)
+        except TimeoutError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"PDF conversion failed: {e}")
 
         if not os.path.exists(pdf_path):
             raise RuntimeError("PDF file was not created")
@@ -66,18 +56,34 @@ def convert_docx_to_pdf(docx_path: str, pdf_path: str) -> bool:
 
 
 def form_docx_to_pdf_handler(data_list: list, destination_folder: str) -> str:
-    """Generate DOCX and convert to PDF."""
+    """Generate the contract PDF with the configured backend."""
+    # Save dialogs already append ".pdf"; don't end up with "x.pdf.pdf"
+    if destination_folder.lower().endswith(".pdf"):
+        destination_folder = destination_folder[: -len(".pdf")]
 
-    docx_path = form_saveto_docx_handler(data_list, destination_folder)
+    backend = get_pdf_backend()
+    with trace_export(f"contract pdf ({backend})", destination_folder + ".pdf"):
+        if backend == "native":
+            # Imported lazily so the Word backend doesn't need reportlab
+            from .pdf_renderer import form_saveto_pdf_handler
 
-    pdf_path = destination_folder + ".pdf"
-    converter = PDFConverter()
-    converter.convert(docx_path, pdf_path)
+            pdf_path = form_saveto_pdf_handler(data_list, destination_folder)
+            print(f"✅ PDF created: {pdf_path}")
+            return pdf_path
+
+        from .document_generator import form_saveto_docx_handler
+
+        docx_path = form_saveto_docx_handler(data_list, destination_folder)
 
-    try:
-        os.remove(docx_path)
-    except OSError:
-        pass
+        pdf_path = destination_folder + ".pdf"
+        converter = PDFConverter()
+        converter.convert(docx_path, pdf_path)
 
-    print(f"✅ PDF created: {pdf_path}")
-    return pdf_path
+        with span("file.remove_docx"):
+            try:
+                os.remove(docx_path)
+            except OSError:
+                pass
+
+        print(f"✅ PDF created: {pdf_path}")
+        return pdf_path
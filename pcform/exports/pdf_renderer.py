@@ -0,0 +1,492 @@
+import os
+import re
+from typing import Any, Dict, List, Optional, Set, Tuple
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from reportlab.lib.pagesizes import LETTER
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.utils import ImageReader, simpleSplit
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.platypus import (
+    HRFlowable,
+    Image,
+    Paragraph,
+    SimpleDocTemplate,
+    Spacer,
+    Table,
+    TableStyle,
+)
+
+from .document_generator import (
+    CONTENT_SECTIONS,
+    FOOTER_TEXT,
+    SUBTITLE,
+    TITLE,
+    document_id,
+    extract_date,
+    format_date,
+)
+from .sections.signature_section import SignatureSection
+from .sections.terms_section import TermsSection
+from .styles import STYLES, FontStyle
+from .timing import span, trace_export
+from settings.config import (
+    LOGO_PATH,
+    PDF_BOLD_FONT_PATH,
+    PDF_FONT_PATH,
+    PDF_TERMS_AND_CONDITIONS,
+    PERSIAN_FONT,
+)
+
+# Arabic-script characters (Persian included) that need shaping and bidi
+RTL_PATTERN = re.compile("[\u0590-\u08ff\ufb1d-\ufdff\ufe70-\ufeff]")
+
+# Height of an empty DOCX paragraph, used for vertical spacing
+LINE_SPACING = 12
+
+# (regular, bold) TrueType files tried when no font path is configured
+FONT_CANDIDATES = [
+    (
+        os.path.join(os.environ.get("WINDIR", r"C:\Windows"), "Fonts", f"{PERSIAN_FONT.lower()}.ttf"),
+        os.path.join(os.environ.get("WINDIR", r"C:\Windows"), "Fonts", f"{PERSIAN_FONT.lower()}bd.ttf"),
+    ),
+    (
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    ),
+    (
+        "/usr/share/fonts/TTF/DejaVuSans.ttf",
+        "/usr/share/fonts/TTF/DejaVuSans-Bold.ttf",
+    ),
+    ("/Library/Fonts/Tahoma.ttf", "/Library/Fonts/Tahoma Bold.ttf"),
+]
+
+# Registered once per process: (regular name, bold name, supported code points)
+_fonts: Optional[Tuple[str, str, Optional[Set[int]]]] = None
+
+
+def register_fonts() -> Tuple[str, str, Optional[Set[int]]]:
+    """Register the contract fonts with reportlab (cached)."""
+    global _fonts
+    if _fonts is not None:
+        return _fonts
+
+    candidates = list(FONT_CANDIDATES)
+    if PDF_FONT_PATH:
+        candidates.insert(0, (PDF_FONT_PATH, PDF_BOLD_FONT_PATH or PDF_FONT_PATH))
+
+    for regular_path, bold_path in candidates:
+        if not os.path.exists(regular_path):
+            continue
+        if not os.path.exists(bold_path):
+            bold_path = regular_path
+        pdfmetrics.registerFont(TTFont("ContractFont", regular_path))
+        pdfmetrics.registerFont(TTFont("ContractFont-Bold", bold_path))
+        glyphs = set(pdfmetrics.getFont("ContractFont").face.charToGlyph)
+        _fonts = ("ContractFont", "ContractFont-Bold", glyphs)
+        return _fonts
+
+    print("Warning: No TrueType font found for PDF export, Persian text will not render.")
+    _fonts = ("Helvetica", "Helvetica-Bold", set(range(0x20, 0x100)))
+    return _fonts
+
+
+def _load_shaper():
+    """Return (reshape, get_display) or None if RTL support isn't installed."""
+    try:
+        from arabic_reshaper import reshape
+        from bidi.algorithm import get_display
+    except ImportError:
+        print(
+            "Warning: arabic-reshaper/python-bidi not installed, "
+            "Persian text in PDFs will not be shaped."
+        )
+        return None
+    return reshape, get_display
+
+
+_shaper = None
+_shaper_loaded = False
+
+
+def _color(rgb) -> colors.Color:
+    """Convert a python-docx RGBColor to a reportlab color."""
+    return colors.HexColor(f"#{rgb}")
+
+
+class NativePDFRenderer:
+    """
+    Renders the contract straight to PDF, without Word or an intermediate DOCX.
+
+    Mirrors DocumentGenerator's layout: the same sections, texts and STYLES.
+
+    Usage:
+        renderer = NativePDFRenderer()
+        pdf_path = renderer.generate(data_list, "/path/to/Contract_1")
+    """
+
+    def __init__(self):
+        global _shaper, _shaper_loaded
+        self.font, self.bold_font, self.glyphs = register_fonts()
+        if not _shaper_loaded:
+            _shaper = _load_shaper()
+            _shaper_loaded = True
+        self.shaper = _shaper
+
+        page_width = LETTER[0]
+        self.frame_width = (
+            page_width - STYLES.MARGINS.left.pt - STYLES.MARGINS.right.pt
+        )
+
+    def generate(self, data_list: List[Dict[str, Any]], destination_path: str) -> str:
+        """Generate the contract PDF and return its path."""
+        output_path = f"{destination_path}.pdf"
+        header_text = format_date(extract_date(data_list))
+
+        doc = SimpleDocTemplate(
+            output_path,
+            pagesize=LETTER,
+            topMargin=STYLES.MARGINS.top.pt,
+            bottomMargin=STYLES.MARGINS.bottom.pt,
+            leftMargin=STYLES.MARGINS.left.pt,
+            rightMargin=STYLES.MARGINS.right.pt,
+            title=TITLE,
+        )
+
+        story = []
+        with span("pdf.header"):
+            story += self._logo()
+            story += self._title()
+        for data in data_list:
+            for section_class in CONTENT_SECTIONS:
+                with span(f"pdf.section.{section_class.__name__}"):
+                    story += self._content_section(section_class(), data)
+        with span("pdf.signature_terms"):
+            story += self._signature_section()
+            story += self._terms_section()
+            story += self._footer()
+
+        def draw_header(canvas, document):
+            canvas.saveState()
+            canvas.setFont(self.font, 10)
+            canvas.setFillColor(_color(STYLES.SECONDARY_COLOR))
+            canvas.drawRightString(
+                document.pagesize[0] - document.rightMargin,
+                document.pagesize[1] - document.topMargin / 2,
+                self._plain(header_text),
+            )
+            canvas.restoreState()
+
+        with span("pdf.build"):  # page layout and writing the file
+            doc.build(story, onFirstPage=draw_header, onLaterPages=draw_header)
+        return output_path
+
+    def render_text(self, lines: List[str], output_path: str) -> str:
+        """
+        Write plain text to ``output_path``, one paragraph per non-blank line.
+
+        No contract layout; Persian lines are shaped like in generate().
+        """
+        style = self._style(STYLES.BODY)
+        story = [
+            self._paragraph(line, style, width=self.frame_width)
+            for line in lines
+            if line.strip()
+        ]
+        SimpleDocTemplate(output_path, pagesize=LETTER).build(story)
+        return output_path
+
+    # === TEXT ===
+
+    def _style(
+        self,
+        font_style: FontStyle,
+        alignment=TA_LEFT,
+        color=None,
+        bold: Optional[bool] = None,
+    ) -> ParagraphStyle:
+        """ParagraphStyle equivalent of a docx FontStyle."""
+        is_bold = font_style.bold if bold is None else bold
+        text_color = color or font_style.color
+        size = font_style.size.pt
+        return ParagraphStyle(
+            name=f"{font_style.name}-{size}",
+            fontName=self.bold_font if is_bold else self.font,
+            fontSize=size,
+            leading=size * 1.25,
+            alignment=alignment,
+            textColor=_color(text_color) if text_color else colors.black,
+        )
+
+    def _supported(self, text: str) -> str:
+        """Drop characters (emoji, variation selectors) the font can't draw."""
+        if self.glyphs is None:
+            return text
+        return "".join(ch for ch in text if ch == "\n" or ord(ch) in self.glyphs)
+
+    def _plain(self, text: str) -> str:
+        """Text for direct canvas drawing: supported glyphs, shaped if RTL."""
+        text = self._supported(str(text)).strip()
+        if self.shaper and RTL_PATTERN.search(text):
+            reshape, get_display = self.shaper
+            text = get_display(reshape(text))
+        return text
+
+    def _paragraph(
+        self, text: Any, style: ParagraphStyle, width: Optional[float] = None
+    ) -> Paragraph:
+        """
+        Build a Paragraph, shaping Persian text.
+
+        RTL text is wrapped to ``width`` in logical order first and each line
+        is reordered separately, otherwise wrapped lines come out in reverse.
+        """
+        text = self._supported(str(text)).strip()
+
+        if not RTL_PATTERN.search(text):
+            return Paragraph(escape(text).replace("\n", "<br/>"), style)
+
+        style = ParagraphStyle(name=f"{style.name}-rtl", parent=style, alignment=TA_RIGHT)
+        if not self.shaper:
+            return Paragraph(escape(text).replace("\n", "<br/>"), style)
+
+        reshape, get_display = self.shaper
+        lines = []
+        for logical_line in reshape(text).split("\n"):
+            if width:
+                wrapped = simpleSplit(
+                    logical_line, style.fontName, style.fontSize, width
+                ) or [""]
+            else:
+                wrapped = [logical_line]
+            lines.extend(get_display(line) for line in wrapped)
+        return Paragraph("<br/>".join(escape(line) for line in lines), style)
+
+    def _spacing(self, lines: int = 1) -> list:
+        return [Spacer(1, LINE_SPACING * lines)]
+
+    def _line(self, color, thickness: float = 1, width="100%", align="CENTER") -> list:
+        return [
+            HRFlowable(
+                width=width,
+                thickness=thickness,
+                color=_color(color),
+                hAlign=align,
+                spaceBefore=2,
+                spaceAfter=4,
+            )
+        ]
+
+    # === LAYOUT (mirrors DocumentGenerator) ===
+
+    def _logo(self) -> list:
+        """Company logo if available."""
+        if not LOGO_PATH or not os.path.exists(LOGO_PATH):
+            return []
+
+        try:
+            width = 1.8 * 72
+            image_width, image_height = ImageReader(LOGO_PATH).getSize()
+            logo = Image(LOGO_PATH, width=width, height=width * image_height / image_width)
+            return [logo] + self._spacing(1)
+        except Exception as e:
+            print(f"Warning: Could not add logo: {e}")
+            return []
+
+    def _title(self) -> list:
+        """Document title section."""
+        return (
+            self._spacing(1)
+            + [
+                self._paragraph(
+                    TITLE,
+                    self._style(STYLES.TITLE, TA_CENTER, color=STYLES.PRIMARY_COLOR),
+                ),
+                self._paragraph(SUBTITLE, self._style(STYLES.SUBTITLE, TA_CENTER)),
+            ]
+            + self._line(STYLES.SECONDARY_COLOR, thickness=2)
+            + self._spacing(2)
+        )
+
+    def _content_section(self, section, data: Dict[str, Any]) -> list:
+        """Numbered section heading plus its table or text box."""
+        heading = self._paragraph(
+            f"{section.section_number}. {section.section_title}",
+            self._style(STYLES.SECTION_HEADING),
+        )
+        flowables = [heading]
+        flowables += self._line(
+            STYLES.SECONDARY_COLOR, thickness=0.5, width="80%", align="LEFT"
+        )
+        flowables += self._spacing(1)
+
+        rows = section.info_rows(data)
+        if rows is not None:
+            flowables.append(self._info_table(rows))
+        else:
+            prefix, text = section.text_box(data)
+            flowables.append(self._text_box(text, prefix, "#F8F9FA"))
+
+        return flowables + self._spacing(2)
+
+    def _info_table(self, rows_data: list) -> Table:
+        """Two-column label/value table."""
+        label_width = STYLES.TABLE_LABEL_WIDTH.pt
+        value_width = STYLES.TABLE_VALUE_WIDTH.pt
+        label_style = self._style(STYLES.LABEL)
+        value_style = self._style(STYLES.BODY)
+
+        rows = [
+            [
+                self._paragraph(label, label_style),
+                self._paragraph(
+                    value if value else "N/A", value_style, width=value_width - 12
+                ),
+            ]
+            for label, value in rows_data
+        ]
+
+        table = Table(rows, colWidths=[label_width, value_width], hAlign="LEFT")
+        table.setStyle(
+            TableStyle(
+                [
+                    ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+                    ("BACKGROUND", (0, 0), (0, -1), colors.HexColor("#F5F5F5")),
+                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
+                ]
+            )
+        )
+        return table
+
+    def _text_box(
+        self, text: str, prefix: str, fill: str, style: ParagraphStyle = None
+    ) -> Table:
+        """Text in a shaded, bordered box (optionally with a prefix line)."""
+        style = style or self._style(STYLES.BODY)
+        rows = []
+        if prefix:
+            prefix_style = ParagraphStyle(
+                name="box-prefix",
+                fontName=self.bold_font,
+                fontSize=10,
+                leading=12.5,
+                textColor=_color(STYLES.SECONDARY_COLOR),
+            )
+            rows.append([self._paragraph(prefix, prefix_style)])
+        rows.append(
+            [self._paragraph(text if text else "N/A", style, width=self.frame_width - 20)]
+        )
+
+        table = Table(rows, colWidths=[self.frame_width], hAlign="LEFT")
+        table.setStyle(
+            TableStyle(
+                [
+                    ("BOX", (0, 0), (-1, -1), 0.5, colors.black),
+                    ("BACKGROUND", (0, 0), (-1, -1), colors.HexColor(fill)),
+                    ("LEFTPADDING", (0, 0), (-1, -1), 10),
+                    ("RIGHTPADDING", (0, 0), (-1, -1), 10),
+                    ("BOTTOMPADDING", (0, -1), (-1, -1), 8),
+                ]
+            )
+        )
+        return table
+
+    def _signature_section(self) -> list:
+        """Agreement & signatures table (see SignatureSection)."""
+        heading = self._paragraph(
+            SignatureSection.HEADING, self._style(STYLES.SECTION_HEADING, TA_CENTER)
+        )
+        header_style = ParagraphStyle(
+            name="signature-header",
+            fontName=self.bold_font,
+            fontSize=12,
+            leading=15,
+            alignment=TA_CENTER,
+            textColor=_color(STYLES.BORDER_COLOR),
+        )
+        field_style = self._style(STYLES.LABEL)
+
+        rows = [[self._paragraph(party, header_style) for party in SignatureSection.PARTIES]]
+        for label in SignatureSection.FIELDS:
+            field = self._paragraph(f"{label}  " + "_" * 25, field_style)
+            rows.append([field, field])
+
+        table = Table(rows, colWidths=[3.5 * 72, 3.5 * 72])
+        table.setStyle(
+            TableStyle(
+                [
+                    ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+                    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#003366")),
+                    ("TOPPADDING", (0, 1), (-1, -1), 12),
+                    ("BOTTOMPADDING", (0, 1), (-1, -1), 12),
+                ]
+            )
+        )
+
+        date_line = self._paragraph(
+            SignatureSection.DATE_LABEL + "_" * 30, self._style(STYLES.LABEL, TA_CENTER)
+        )
+
+        return (
+            self._line(STYLES.PRIMARY_COLOR, thickness=2)
+            + [heading]
+            + self._spacing(1)
+            + [table]
+            + self._spacing(1)
+            + [date_line]
+        )
+
+    def _terms_section(self) -> list:
+        """Terms & conditions box and acceptance line (see TermsSection)."""
+        heading = self._paragraph(
+            TermsSection.HEADING,
+            self._style(STYLES.SECTION_HEADING, TA_CENTER, color=STYLES.PRIMARY_COLOR),
+        )
+        terms_style = self._style(STYLES.SMALL)
+        acceptance = self._paragraph(
+            "☐ " + TermsSection.ACCEPTANCE, self._style(STYLES.BODY)
+        )
+        acceptance.style = ParagraphStyle(
+            name="acceptance", parent=acceptance.style, leftIndent=0.3 * 72
+        )
+
+        return (
+            self._spacing(2)
+            + self._line(STYLES.BORDER_COLOR, thickness=0.5, width="85%")
+            + [heading]
+            + [self._text_box(PDF_TERMS_AND_CONDITIONS, "", "#FFFEF5", terms_style)]
+            + self._spacing(1)
+            + [acceptance]
+        )
+
+    def _footer(self) -> list:
+        """Closing line, thank-you note and document ID."""
+        doc_id_style = ParagraphStyle(
+            name="doc-id",
+            fontName=self.font,
+            fontSize=8,
+            leading=10,
+            alignment=TA_CENTER,
+            textColor=_color(STYLES.BORDER_COLOR),
+        )
+        return (
+            self._spacing(2)
+            + self._line(STYLES.BORDER_COLOR, thickness=1)
+            + [
+                self._paragraph(FOOTER_TEXT, self._style(STYLES.FOOTER, TA_CENTER)),
+                self._paragraph(document_id(), doc_id_style),
+            ]
+        )
+
+
+def form_saveto_pdf_handler(
+    data_list: List[Dict[str, Any]], destination_folder: str
+) -> str:
+    """Render the contract PDF directly - counterpart of form_saveto_docx_handler."""
+    with trace_export("contract pdf", f"{destination_folder}.pdf"):
+        with span("pdf.fonts"):
+            renderer = NativePDFRenderer()
+        return renderer.generate(data_list, destination_folder)
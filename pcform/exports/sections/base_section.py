@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Any, List, Optional, Tuple
 
 from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
@@ -8,11 +9,16 @@ from docx.shared import Inches, Pt
 
 from ..styles import STYLES
 
+# Style id of the built-in "Table Grid" style
+TABLE_GRID_STYLE_ID = "TableGrid"
+
 
 class BaseSection(ABC):
     """Abstract base class for document sections."""
 
-    def __init__(self, document: Document):
+    def __init__(self, document: Document = None):
+        # document may be None when only the section's data is needed
+        # (e.g. by the native PDF renderer)
         self.document = document
 
     @property
@@ -32,6 +38,14 @@ class BaseSection(ABC):
         """Add section-specific content."""
         pass
 
+    def info_rows(self, data: dict) -> Optional[List[Tuple[str, Any]]]:
+        """(label, value) rows for table sections, None otherwise."""
+        return None
+
+    def text_box(self, data: dict) -> Optional[Tuple[str, str]]:
+        """(prefix, text) for boxed-text sections, None otherwise."""
+        return None
+
     def render(self, data: dict) -> None:
         """Render the complete section."""
         self._add_heading()
@@ -63,10 +77,17 @@ class BaseSection(ABC):
         for _ in range(lines):
             self.document.add_paragraph()
 
+    @staticmethod
+    def _set_grid_style(table) -> None:
+        """Same as ``table.style = "Table Grid"``, without the style-name lookup."""
+        # Looking styles up by name scans styles.xml on every call, and these
+        # tables are built for every contract
+        table._tbl.tblPr.style = TABLE_GRID_STYLE_ID
+
     def _create_info_table(self, rows_data: list) -> None:
         """Create a professional information table."""
         table = self.document.add_table(rows=len(rows_data), cols=2)
-        table.style = "Table Grid"
+        self._set_grid_style(table)
 
         table.columns[0].width = STYLES.TABLE_LABEL_WIDTH
         table.columns[1].width = STYLES.TABLE_VALUE_WIDTH
@@ -97,7 +118,7 @@ class BaseSection(ABC):
         Moved here so ALL sections can use it!
         """
         table = self.document.add_table(rows=1, cols=1)
-        table.style = "Table Grid"
+        self._set_grid_style(table)
 
         cell = table.rows[0].cells[0]
 
@@ -12,11 +12,12 @@ class DeviceSection(BaseSection):
     def section_title(self) -> str:
         return "DEVICE INFORMATION"
 
+    def info_rows(self, data: dict) -> list:
+        return [
+            ("Device Model:", data.get("Device_Model", "N/A")),
+            ("Serial Number:", data.get("Device_Serial", "N/A")),
+        ]
+
     def _add_content(self, data: dict) -> None:
         """Add device information table."""
-        self._create_info_table(
-            [
-                ("Device Model:", data.get("Device_Model", "N/A")),
-                ("Serial Number:", data.get("Device_Serial", "N/A")),
-            ]
-        )
+        self._create_info_table(self.info_rows(data))
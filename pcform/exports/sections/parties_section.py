@@ -12,11 +12,12 @@ class PartiesSection(BaseSection):
     def section_title(self) -> str:
         return "PARTIES INFORMATION"
 
+    def info_rows(self, data: dict) -> list:
+        return [
+            ("Customer Name:", data.get("fullname", "N/A")),
+            ("Service Provider:", data.get("ServiceMan", "N/A")),
+        ]
+
     def _add_content(self, data: dict) -> None:
         """Add parties information table."""
-        self._create_info_table(
-            [
-                ("Customer Name:", data.get("fullname", "N/A")),
-                ("Service Provider:", data.get("ServiceMan", "N/A")),
-            ]
-        )
+        self._create_info_table(self.info_rows(data))
@@ -12,11 +12,15 @@ class ProblemSection(BaseSection):
     def section_title(self) -> str:
         return "REPORTED PROBLEM"
 
+    def text_box(self, data: dict) -> tuple:
+        problem_text = data.get("Device_Problem", "No problem description provided.")
+        return "⚠️ Issue Reported:", problem_text
+
     def _add_content(self, data: dict) -> None:
         """Add problem description in a styled box."""
-        problem_text = data.get("Device_Problem", "No problem description provided.")
+        prefix, problem_text = self.text_box(data)
         # Now _add_text_box is inherited from BaseSection!
-        self._add_text_box(problem_text, "⚠️ Issue Reported:")
+        self._add_text_box(problem_text, prefix)
 
 
 class ServiceSection(BaseSection):
@@ -30,8 +34,12 @@ class ServiceSection(BaseSection):
     def section_title(self) -> str:
         return "SERVICE DESCRIPTION & WORK PERFORMED"
 
-    def _add_content(self, data: dict) -> None:
-        """Add service description in a styled box."""
+    def text_box(self, data: dict) -> tuple:
         # Support both 'Description' and 'description' keys
         service_text = data.get("Description") or data.get("description", "N/A")
-        self._add_text_box(service_text, "🔧 Work Details:")
+        return "🔧 Work Details:", service_text
+
+    def _add_content(self, data: dict) -> None:
+        """Add service description in a styled box."""
+        prefix, service_text = self.text_box(data)
+        self._add_text_box(service_text, prefix)
@@ -8,7 +8,12 @@ from exports.styles import STYLES
 class SignatureSection:
     """Signature section for the contract."""
 
-    def __init__(self, document):
+    HEADING = "✍️ AGREEMENT & SIGNATURES"
+    PARTIES = ("👤 CUSTOMER", "🔧 SERVICE PROVIDER")
+    FIELDS = ("Name:", "Signature:", "Date:")
+    DATE_LABEL = "Agreement Date: "
+
+    def __init__(self, document=None):
         self.document = document
 
     def render(self) -> None:
@@ -29,7 +34,7 @@ class SignatureSection:
 
         heading_para = self.document.add_paragraph()
         heading_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        heading_run = heading_para.add_run("✍️ AGREEMENT & SIGNATURES")
+        heading_run = heading_para.add_run(self.HEADING)
         STYLES.apply_font(heading_run, STYLES.SECTION_HEADING)
 
     def _add_signature_table(self) -> None:
@@ -42,16 +47,13 @@ class SignatureSection:
 
         # Header row
         header_row = table.rows[0]
-        self._style_header_cell(header_row.cells[0], "👤 CUSTOMER")
-        self._style_header_cell(header_row.cells[1], "🔧 SERVICE PROVIDER")
+        self._style_header_cell(header_row.cells[0], self.PARTIES[0])
+        self._style_header_cell(header_row.cells[1], self.PARTIES[1])
 
         # Data rows
-        self._add_signature_field(table.rows[1].cells[0], "Name:")
-        self._add_signature_field(table.rows[1].cells[1], "Name:")
-        self._add_signature_field(table.rows[2].cells[0], "Signature:")
-        self._add_signature_field(table.rows[2].cells[1], "Signature:")
-        self._add_signature_field(table.rows[3].cells[0], "Date:")
-        self._add_signature_field(table.rows[3].cells[1], "Date:")
+        for row, label in enumerate(self.FIELDS, start=1):
+            self._add_signature_field(table.rows[row].cells[0], label)
+            self._add_signature_field(table.rows[row].cells[1], label)
 
     def _style_header_cell(self, cell, text: str) -> None:
         """Style a header cell with background color."""
@@ -84,7 +86,7 @@ class SignatureSection:
         para = self.document.add_paragraph()
         para.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
-        run = para.add_run("Agreement Date: ")
+        run = para.add_run(self.DATE_LABEL)
         STYLES.apply_font(run, STYLES.LABEL)
 
         line_run = para.add_run("_" * 30)
@@ -10,7 +10,10 @@ from settings.config import PDF_TERMS_AND_CONDITIONS
 class TermsSection:
     """Terms and Conditions section."""
 
-    def __init__(self, document):
+    HEADING = "📋 TERMS & CONDITIONS"
+    ACCEPTANCE = "I have read and agree to the above Terms & Conditions"
+
+    def __init__(self, document=None):
         self.document = document
 
     def render(self) -> None:
@@ -30,7 +33,7 @@ class TermsSection:
 
         heading_para = self.document.add_paragraph()
         heading_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        heading_run = heading_para.add_run("📋 TERMS & CONDITIONS")
+        heading_run = heading_para.add_run(self.HEADING)
         STYLES.apply_font(heading_run, STYLES.SECTION_HEADING)
         heading_run.font.color.rgb = STYLES.PRIMARY_COLOR
 
@@ -65,7 +68,7 @@ class TermsSection:
         checkbox_run = para.add_run("☐ ")
         checkbox_run.font.size = Pt(14)
 
-        text_run = para.add_run("I have read and agree to the above Terms & Conditions")
+        text_run = para.add_run(self.ACCEPTANCE)
         STYLES.apply_font(text_run, STYLES.BODY)
 
     def _add_spacing(self, lines: int = 1) -> None:
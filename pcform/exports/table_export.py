@@ -0,0 +1,258 @@
+import csv
+import gzip
+import json
+import os
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# File types by extension; ".gz" compresses the text formats
+TABLE_FORMATS = {
+    ".csv": "csv",
+    ".csv.gz": "csv",
+    ".jsonl": "jsonl",
+    ".jsonl.gz": "jsonl",
+    ".xlsx": "xlsx",
+}
+
+MAX_COLUMN_WIDTH = 50  # Excel column width cap (characters)
+# Control characters Excel rejects in cell text (same set as openpyxl's check)
+ILLEGAL_CHARACTERS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def column_lengths(columns: List[str], rows: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+    """Length of the longest value of each column (one pass over the rows)."""
+    longest = dict.fromkeys(columns, 0)
+    for row in rows:
+        for column in columns:
+            value = row.get(column)
+            if value is not None:
+                length = len(str(value))
+                if length > longest[column]:
+                    longest[column] = length
+    return longest
+
+
+def table_format(path: str) -> str:
+    """Export format ("csv", "jsonl" or "xlsx") for a file name, from its extension."""
+    name = path.lower()
+    for extension, fmt in TABLE_FORMATS.items():
+        if name.endswith(extension):
+            return fmt
+    raise ValueError(
+        f"Unsupported export file type: {os.path.basename(path)} "
+        f"(use {', '.join(TABLE_FORMATS)})"
+    )
+
+
+def export_records(
+    repo,
+    path: str,
+    filters: Optional[Dict[str, Any]] = None,
+    order_by: str = "id DESC",
+    columns: Optional[List[str]] = None,
+    progress: Optional[Callable[[str], None]] = None,
+) -> int:
+    """
+    Stream the records matching ``filters`` from the repository into a file.
+
+    Covers the whole table (no filters), a search ({"query": ...}) and the
+    advanced filters, with the format picked from the file extension. Needs
+    no window, so scheduled jobs can use it (see cli.py).
+
+    Args:
+        repo: PCFormRepository to read from
+        path: Destination file (.csv, .jsonl, .xlsx; .csv.gz / .jsonl.gz compressed)
+        filters: Filter dict as accepted by PCFormRepository.find
+        order_by: Column name with optional ASC/DESC
+        columns: Columns to export (default: every record column)
+        progress: Called with a status message after each batch
+
+    Returns:
+        Number of records written
+
+    Usage:
+        export_records(PCFormRepository(), "contracts.csv.gz", {"query": "dell"})
+    """
+    columns = list(columns or repo.VALID_COLUMNS)
+    fmt = table_format(path)
+    # The count (and for Excel the column widths) come from one aggregate query
+    total, lengths = repo.column_lengths(filters, columns)
+    batches = repo.iter_find(filters, order_by)
+    return write_table(path, columns, batches, fmt, lengths, total, progress)
+
+
+def write_table(
+    path: str,
+    columns: List[str],
+    batches: Iterable[List[Dict[str, Any]]],
+    fmt: Optional[str] = None,
+    lengths: Optional[Dict[str, int]] = None,
+    total: Optional[int] = None,
+    progress: Optional[Callable[[str], None]] = None,
+) -> int:
+    """
+    Write batches of records to ``path`` in ``fmt`` (default: from the extension).
+
+    The file is written under a temporary name and renamed when complete,
+    so readers never see a half-written export.
+
+    Returns:
+        Number of records written
+    """
+    fmt = fmt or table_format(path)
+    partial = f"{path}.part"
+    try:
+        if fmt == "xlsx":
+            written = write_xlsx(partial, columns, batches, lengths, total, progress)
+        else:
+            writer = write_csv if fmt == "csv" else write_jsonl
+            with _open_text(partial, compress=path.lower().endswith(".gz")) as stream:
+                written = writer(stream, columns, batches, total, progress)
+        os.replace(partial, path)
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    return written
+
+
+def write_csv(
+    stream,
+    columns: List[str],
+    batches: Iterable[List[Dict[str, Any]]],
+    total: Optional[int] = None,
+    progress: Optional[Callable[[str], None]] = None,
+) -> int:
+    """Write a header line and one CSV line per record to a text stream."""
+    writer = csv.writer(stream)
+    writer.writerow(columns)
+    written = 0
+    for batch in batches:
+        writer.writerows([row.get(column) for column in columns] for row in batch)
+        written += len(batch)
+        if progress is not None:
+            progress(_progress_text(written, total))
+    return written
+
+
+def write_jsonl(
+    stream,
+    columns: List[str],
+    batches: Iterable[List[Dict[str, Any]]],
+    total: Optional[int] = None,
+    progress: Optional[Callable[[str], None]] = None,
+) -> int:
+    """Write one JSON object per line (JSON Lines) per record to a text stream."""
+    written = 0
+    for batch in batches:
+        stream.writelines(
+            json.dumps({column: row.get(column) for column in columns}, ensure_ascii=False)
+            + "\n"
+            for row in batch
+        )
+        written += len(batch)
+        if progress is not None:
+            progress(_progress_text(written, total))
+    return written
+
+
+def write_xlsx(
+    path: str,
+    columns: List[str],
+    batches: Iterable[List[Dict[str, Any]]],
+    lengths: Optional[Dict[str, int]] = None,
+    total: Optional[int] = None,
+    progress: Optional[Callable[[str], None]] = None,
+    sheet_title: str = "Contracts",
+) -> int:
+    """
+    Stream records into an .xlsx file with a write-only workbook.
+
+    Rows go straight to disk as they arrive, so memory stays flat however
+    many records are exported. Column widths must be known before the
+    first row is written; pass ``lengths`` (e.g. from
+    PCFormRepository.column_lengths or column_lengths above).
+
+    Args:
+        path: Destination file
+        columns: Record keys to export, in column order (also the headers)
+        batches: Lists of record dicts, e.g. PCFormRepository.iter_find(...)
+        lengths: Longest value per column (None = default widths)
+        total: Number of records, for progress messages
+        progress: Called with a status message after each batch
+
+    Returns:
+        Number of records written
+
+    Usage:
+        count, lengths = repo.column_lengths(filters, columns)
+        write_xlsx(path, columns, repo.iter_find(filters), lengths, total=count)
+    """
+    # openpyxl is only loaded for Excel output (CSV/JSONL and startup skip it)
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.utils import get_column_letter
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(sheet_title)
+
+    if lengths is not None:
+        for index, column in enumerate(columns, 1):
+            longest = max(len(column), lengths.get(column, 0))
+            ws.column_dimensions[get_column_letter(index)].width = min(
+                longest + 2, MAX_COLUMN_WIDTH
+            )
+
+    font, fill, alignment = _header_style()
+    header = []
+    for column in columns:
+        cell = WriteOnlyCell(ws, value=column)
+        cell.font = font
+        cell.fill = fill
+        cell.alignment = alignment
+        header.append(cell)
+    ws.append(header)
+
+    written = 0
+    for batch in batches:
+        for row in batch:
+            ws.append([_cell_value(row.get(column)) for column in columns])
+        written += len(batch)
+        if progress is not None:
+            progress(_progress_text(written, total))
+
+    wb.save(path)
+    return written
+
+
+def _cell_value(value: Any) -> Any:
+    """Cell-safe value: text without the control characters Excel rejects"""
+    if isinstance(value, str) and ILLEGAL_CHARACTERS.search(value):
+        return ILLEGAL_CHARACTERS.sub("", value)
+    return value
+
+
+@lru_cache(maxsize=1)
+def _header_style() -> tuple:
+    """Header font, fill and alignment, built once and shared by every header cell"""
+    from openpyxl.styles import Alignment, Font, PatternFill
+
+    return (
+        Font(bold=True, color="FFFFFF"),
+        PatternFill(start_color="366092", end_color="366092", fill_type="solid"),
+        Alignment(horizontal="center", vertical="center"),
+    )
+
+
+def _open_text(path: str, compress: bool = False):
+    """Open a UTF-8 text file for writing, gzip-compressed if asked"""
+    if compress:
+        return gzip.open(path, "wt", encoding="utf-8", newline="")
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+def _progress_text(written: int, total: Optional[int]) -> str:
+    if total:
+        return f"Exported {written} of {total} records ({written * 100 // total}%)"
+    return f"Exported {written} records"
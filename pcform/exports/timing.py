@@ -0,0 +1,269 @@
+"""
+Per-stage timing of contract exports, with optional profiling.
+
+An export runs inside ``trace_export``; the pipeline marks its stages with
+``span`` (section rendering, DOCX serialization, converter start-up,
+conversion, file clean-up). Spans outside an export cost next to nothing.
+The converter works on its own thread, so jobs carry the trace there (see
+``use_trace``).
+
+Finished traces are kept for the search window's "Export Timings" view
+(``recent_traces``); printing them (EXPORT_TIMING_LOG) and appending them
+to a JSON Lines file (EXPORT_TIMING_LOG_PATH) are opt-in.
+
+Profiling (cProfile and/or tracemalloc) is opt-in: for every export with
+EXPORT_PROFILE, or for the next one with ``profile_next_export``. cProfile
+sees the exporting thread only; the converter thread shows up in the spans.
+"""
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, ContextManager, Deque, Dict, Generator, List, Optional
+
+from settings.config import (
+    EXPORT_PROFILE,
+    EXPORT_PROFILE_DIR,
+    EXPORT_TIMING_HISTORY,
+    EXPORT_TIMING_LOG,
+    EXPORT_TIMING_LOG_PATH,
+)
+
+PROFILE_MODES = ("cprofile", "tracemalloc", "both")
+PROFILE_TOP = 15  # Functions / allocation sites listed in a profile summary
+
+_current: ContextVar[Optional["ExportTrace"]] = ContextVar("export_trace", default=None)
+_recent: Deque["ExportTrace"] = deque(maxlen=EXPORT_TIMING_HISTORY)
+_lock = threading.Lock()
+_profile_next: Optional[str] = None
+
+
+class ExportTrace:
+    """Timing spans (name, start offset, duration, thread) of one export."""
+
+    def __init__(self, name: str, target: str = ""):
+        self.name = name
+        self.target = target
+        self.started_at = datetime.now()
+        self.start = time.perf_counter()
+        self.seconds: Optional[float] = None
+        self.error: Optional[str] = None
+        self.spans: List[Dict[str, Any]] = []
+        self.profile: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def add_span(self, name: str, start: float, end: float) -> None:
+        """Record a stage that ran from ``start`` to ``end`` (perf_counter times)."""
+        with self._lock:
+            self.spans.append(
+                {
+                    "name": name,
+                    "start_ms": (start - self.start) * 1000,
+                    "ms": (end - start) * 1000,
+                    "thread": threading.current_thread().name,
+                }
+            )
+
+    def stages(self) -> List[tuple]:
+        """(name, total ms, count) per span name, in the order stages first ran."""
+        totals: Dict[str, list] = {}
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s["start_ms"])
+        for s in spans:
+            total = totals.setdefault(s["name"], [0.0, 0])
+            total[0] += s["ms"]
+            total[1] += 1
+        return [(name, ms, count) for name, (ms, count) in totals.items()]
+
+    def summary(self) -> str:
+        """A few readable lines: total time and each stage's share of it."""
+        total_ms = (self.seconds or 0) * 1000
+        status = f" FAILED ({self.error})" if self.error else ""
+        lines = [
+            f"{self.started_at:%H:%M:%S} {self.name} {os.path.basename(self.target)}: "
+            f"{total_ms:.0f} ms{status}"
+        ]
+        for name, ms, count in self.stages():
+            share = f"{ms / total_ms * 100:3.0f}%" if total_ms else ""
+            times = f" x{count}" if count > 1 else ""
+            lines.append(f"  {name:<32} {ms:>9.1f} ms {share}{times}")
+        if self.profile.get("peak_kib") is not None:
+            lines.append(f"  peak traced memory: {self.profile['peak_kib']:.0f} KiB")
+        if self.profile.get("cprofile_path"):
+            lines.append(f"  cProfile data: {self.profile['cprofile_path']}")
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "export": self.name,
+            "target": self.target,
+            "time": self.started_at.isoformat(timespec="seconds"),
+            "ms": (self.seconds or 0) * 1000,
+            "error": self.error,
+            "stages": [
+                {"name": name, "ms": ms, "count": count} for name, ms, count in self.stages()
+            ],
+            "spans": self.spans,
+            "profile": self.profile,
+        }
+
+
+def current_trace() -> Optional[ExportTrace]:
+    """The export being traced on this thread, if any."""
+    return _current.get()
+
+
+@contextmanager
+def use_trace(trace: Optional[ExportTrace]) -> Generator[None, None, None]:
+    """Record this thread's spans into ``trace`` (e.g. a worker serving an export)."""
+    token = _current.set(trace)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def span(name: str) -> Generator[None, None, None]:
+    """Time one export stage (a no-op when no export is being traced)."""
+    trace = _current.get()
+    if trace is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add_span(name, start, time.perf_counter())
+
+
+def profile_next_export(mode: str = "both") -> None:
+    """Profile the next export only ("cprofile", "tracemalloc" or "both")."""
+    global _profile_next
+    if mode not in PROFILE_MODES:
+        raise ValueError(
+            f"Unknown profile mode '{mode}'. Choose one of: {', '.join(PROFILE_MODES)}"
+        )
+    with _lock:
+        _profile_next = mode
+
+
+def recent_traces() -> List[ExportTrace]:
+    """Finished export traces, newest first."""
+    with _lock:
+        return list(reversed(_recent))
+
+
+def trace_export(name: str, target: str = "", log: bool = True) -> ContextManager:
+    """
+    Trace an export: collect its spans, then log and keep the result.
+
+    Nested calls (e.g. the DOCX step of a PDF export) join the outer trace.
+    With ``log=False`` the trace is neither logged nor kept; the caller uses
+    it directly (batch export adds up the stages of many contracts).
+
+    Usage:
+        with trace_export("contract pdf", pdf_path):
+            ...
+    """
+    if _current.get() is not None:
+        return nullcontext(_current.get())
+    return _traced(name, target, log)
+
+
+@contextmanager
+def _traced(name: str, target: str, log: bool) -> Generator[ExportTrace, None, None]:
+    global _profile_next
+    with _lock:
+        mode, _profile_next = _profile_next or EXPORT_PROFILE, None
+
+    trace = ExportTrace(name, target)
+    profiler, tracing = _start_profile(mode)
+    token = _current.set(trace)
+    try:
+        yield trace
+    except BaseException as e:
+        trace.error = str(e) or type(e).__name__
+        raise
+    finally:
+        _current.reset(token)
+        trace.seconds = time.perf_counter() - trace.start
+        _stop_profile(trace, profiler, tracing)
+        if log:
+            with _lock:
+                _recent.append(trace)
+            _log(trace)
+
+
+def _start_profile(mode: Optional[str]) -> tuple:
+    """(cProfile profiler or None, whether tracemalloc was started here)"""
+    if mode not in PROFILE_MODES:
+        if mode:
+            print(f"Warning: unknown EXPORT_PROFILE '{mode}', not profiling")
+        return None, False
+    profiler = None
+    if mode in ("cprofile", "both"):
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError as e:  # another profiler is active
+            print(f"Warning: cProfile not started: {e}")
+            profiler = None
+    tracing = mode in ("tracemalloc", "both") and not tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.start()
+    return profiler, tracing
+
+
+def _stop_profile(trace: ExportTrace, profiler, tracing: bool) -> None:
+    if profiler is not None:
+        profiler.disable()
+
+    if tracing:
+        # Snapshot before the cProfile report allocates; leave out the profilers' own frames
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [
+                tracemalloc.Filter(False, path)
+                for path in (cProfile.__file__, pstats.__file__, tracemalloc.__file__, __file__)
+            ]
+        )
+        tracemalloc.stop()
+        trace.profile["peak_kib"] = peak / 1024
+        trace.profile["allocations"] = [
+            {"where": str(stat.traceback[0]), "kib": stat.size / 1024, "count": stat.count}
+            for stat in snapshot.statistics("lineno")[:PROFILE_TOP]
+        ]
+
+    if profiler is not None:
+        folder = EXPORT_PROFILE_DIR or tempfile.gettempdir()
+        path = os.path.join(folder, f"export-{trace.started_at:%Y%m%d-%H%M%S-%f}.prof")
+        try:
+            profiler.dump_stats(path)  # open with pstats or snakeviz
+            trace.profile["cprofile_path"] = path
+        except OSError as e:
+            print(f"Warning: could not save the export profile: {e}")
+        text = io.StringIO()
+        pstats.Stats(profiler, stream=text).sort_stats("cumulative").print_stats(PROFILE_TOP)
+        trace.profile["cprofile_top"] = text.getvalue()
+
+
+def _log(trace: ExportTrace) -> None:
+    if EXPORT_TIMING_LOG:
+        print(f"⏱ {trace.summary()}")
+    if EXPORT_TIMING_LOG_PATH:
+        try:
+            with _lock, open(EXPORT_TIMING_LOG_PATH, "a", encoding="utf-8") as f:
+                f.write(json.dumps(trace.to_dict(), ensure_ascii=False) + "\n")
+        except OSError as e:
+            print(f"Warning: could not write the export timing log: {e}")
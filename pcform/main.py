@@ -1,10 +1,25 @@
+import sys
+
 from authentications import AuthWindow
 
 
 def main():
     app = AuthWindow()
-    app.mainloop()
+    try:
+        app.mainloop()
+    finally:
+        # Close Word/LibreOffice if an export started it (the converter
+        # module is only loaded by a PDF export)
+        converter_service = sys.modules.get("exports.converter_service")
+        if converter_service is not None:
+            converter_service.shutdown_converter_service()
 
 
 if __name__ == "__main__":
+    if getattr(sys, "frozen", False):
+        # Bulk export workers in frozen builds; multiprocessing is slow to
+        # import, so plain `python main.py` skips it
+        import multiprocessing
+
+        multiprocessing.freeze_support()
     main()
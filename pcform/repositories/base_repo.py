@@ -1,6 +1,10 @@
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
-from services.database import get_db_connection
+from typing import Any, Dict, Iterator, List, Optional
+from services.database import CancelToken, cancellable, get_db_connection
+from services.query_stats import track_query
+from settings.config import DB_ITER_BATCH_SIZE
+from .migrations import ensure_schema
 
 
 class BaseRepository(ABC):
@@ -9,7 +13,9 @@ class BaseRepository(ABC):
 
     All repositories must implement:
     - table_name property
-    - _create_table method
+
+    Tables, indexes and other schema changes are migrations (see
+    repositories/migrations.py), applied once per process.
     """
 
     @property
@@ -18,33 +24,61 @@ class BaseRepository(ABC):
         """Return the table name for this repository."""
         pass
 
-    @abstractmethod
-    def _create_table(self) -> None:
-        """Create the table if it doesn't exist."""
-        pass
-
     def __init__(self):
-        """Initialize repository and ensure table exists."""
-        self._create_table()
+        """Initialize repository (the schema is migrated on first use only)."""
+        ensure_schema()
 
-    def _execute(self, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
+    def _execute(
+        self, query: str, params: tuple = (), cancel: Optional[CancelToken] = None
+    ) -> List[Dict[str, Any]]:
         """
         Execute a SELECT query and return results as list of dicts.
 
         Args:
             query: SQL query string
             params: Query parameters (use ? placeholders)
+            cancel: Token that aborts the query when set (raises QueryCancelled)
 
         Returns:
             List of dictionaries, one per row
         """
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
+        requested = time.perf_counter()
+        with get_db_connection() as conn, cancellable(conn, cancel):
+            with track_query(conn, query, params, requested) as trace:
+                cursor = conn.cursor()
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+                trace.rows = len(rows)
             # Convert Row objects to dictionaries
             return [dict(row) for row in rows]
 
+    def _iter(
+        self, query: str, params: tuple = (), batch_size: int = DB_ITER_BATCH_SIZE
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Execute a SELECT query and yield results in batches of dicts.
+
+        Only one batch is materialized at a time. The connection is borrowed
+        when iteration starts and returned once the generator is exhausted
+        or closed, so don't keep a half-consumed iterator around.
+
+        Usage:
+            for batch in self._iter("SELECT * FROM pcform", batch_size=500):
+                for row in batch:
+                    ...
+        """
+        requested = time.perf_counter()
+        with get_db_connection() as conn, track_query(conn, query, params, requested) as trace:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                trace.rows += len(rows)
+                with trace.paused():  # the consumer's time isn't the query's
+                    yield [dict(row) for row in rows]
+
     def _execute_one(self, query: str, params: tuple = ()) -> Optional[Dict[str, Any]]:
         """Execute query and return single result or None."""
         results = self._execute(query, params)
@@ -57,7 +91,9 @@ class BaseRepository(ABC):
         Returns:
             lastrowid for INSERT, rowcount for UPDATE/DELETE
         """
-        with get_db_connection() as conn:
+        requested = time.perf_counter()
+        with get_db_connection() as conn, track_query(conn, query, params, requested) as trace:
             cursor = conn.cursor()
             cursor.execute(query, params)
+            trace.rows = cursor.rowcount
             return cursor.lastrowid
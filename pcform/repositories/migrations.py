@@ -0,0 +1,255 @@
+"""
+Versioned schema migrations for the application database.
+
+The schema version lives in the database header (``PRAGMA user_version``).
+Each migration runs in its own transaction together with the version bump,
+so a database is never left half-migrated, and ensure_schema() does the
+work once per process and database file: after that, creating a
+repository costs nothing.
+
+To change the schema, append a migration to MIGRATIONS with the next
+version number. Never edit a migration that has shipped; databases that
+already ran it won't run it again.
+"""
+
+import os
+import sqlite3
+import threading
+from typing import Callable, List, Tuple
+
+from services.database import get_db_connection
+from settings.config import PCFORM_DB_PATH
+from utils.text_normalization import normalize_text
+
+# Searchable columns and their normalized copies, as of migration 2. Spelled
+# out here rather than read from PCFormRepository: a shipped migration must
+# keep doing what it did even if the repository's columns change later.
+_SEARCH_COLUMNS = (
+    "fullname",
+    "Device_Model",
+    "Device_Serial",
+    "ServiceMan",
+    "Device_Problem",
+    "Description",
+)
+_NORM_COLUMNS = tuple(f"{column}_norm" for column in _SEARCH_COLUMNS)
+
+
+def _create_tables(conn: sqlite3.Connection) -> None:
+    """Contract and user tables (databases from before versioning already have them)."""
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS pcform_auth (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE NOT NULL,
+            password_hash TEXT NOT NULL,
+            created_at TEXT DEFAULT (strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime'))
+        )
+    """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS pcform (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            fullname TEXT,
+            Device_Model TEXT,
+            Device_Serial TEXT,
+            ServiceMan TEXT,
+            Device_Problem TEXT,
+            Description TEXT,
+            created_at TEXT DEFAULT (strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')),
+            is_favorite INTEGER DEFAULT 0
+        )
+    """
+    )
+    # Databases from before favorites were added
+    if "is_favorite" not in _columns(conn, "pcform"):
+        conn.execute("ALTER TABLE pcform ADD COLUMN is_favorite INTEGER DEFAULT 0")
+
+
+def _add_normalized_columns(conn: sqlite3.Connection) -> None:
+    """Normalized shadow columns for search (see normalize_text), filled for existing rows."""
+    existing = _columns(conn, "pcform")
+    for column in _NORM_COLUMNS:
+        if column not in existing:
+            conn.execute(f"ALTER TABLE pcform ADD COLUMN {column} TEXT")
+
+    conn.create_function("normalize_text", 1, normalize_text, deterministic=True)
+    assignments = ", ".join(
+        f"{norm} = normalize_text({column})"
+        for column, norm in zip(_SEARCH_COLUMNS, _NORM_COLUMNS)
+    )
+    missing = " OR ".join(f"{norm} IS NULL" for norm in _NORM_COLUMNS)
+    conn.execute(f"UPDATE pcform SET {assignments} WHERE {missing}")
+
+
+def _create_indexes(conn: sqlite3.Connection) -> None:
+    """Indexes for the date-range / favorite filters and column sorting."""
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_pcform_created_at ON pcform(created_at)")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_pcform_is_favorite ON pcform(is_favorite, created_at)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_pcform_serviceman ON pcform(ServiceMan)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_pcform_device_model ON pcform(Device_Model)")
+    # Remaining sortable columns (ORDER BY column, id walks the index);
+    # Description is left out, an index would copy the longest column
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_pcform_fullname ON pcform(fullname)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_pcform_device_serial ON pcform(Device_Serial)")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_pcform_device_problem ON pcform(Device_Problem)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_pcform_favorite_id ON pcform(is_favorite, id)")
+
+
+def _create_fts_index(conn: sqlite3.Connection) -> None:
+    """
+    FTS5 index over the normalized columns, kept in sync by triggers.
+
+    Skipped when SQLite is built without FTS5; search then falls back to
+    LIKE (PCFormRepository.fts_available is False).
+    """
+    columns = ", ".join(_NORM_COLUMNS)
+    new_columns = ", ".join(f"new.{c}" for c in _NORM_COLUMNS)
+    old_columns = ", ".join(f"old.{c}" for c in _NORM_COLUMNS)
+
+    existing = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'pcform_fts'"
+    ).fetchone()
+    if existing and _NORM_COLUMNS[0] not in existing[0]:
+        # Index over the raw columns (older databases): rebuild it
+        for trigger in ("pcform_fts_ai", "pcform_fts_ad", "pcform_fts_au"):
+            conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        conn.execute("DROP TABLE pcform_fts")
+        existing = None
+
+    if not existing:
+        try:
+            conn.execute(
+                f"""
+                CREATE VIRTUAL TABLE pcform_fts USING fts5(
+                    {columns},
+                    content='pcform',
+                    content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2',
+                    prefix='2 3'
+                )
+            """
+            )
+        except sqlite3.OperationalError:
+            print("Warning: SQLite has no FTS5, search will use LIKE")
+            return
+        # Index rows that existed before the index did
+        conn.execute("INSERT INTO pcform_fts(pcform_fts) VALUES ('rebuild')")
+
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS pcform_fts_ai AFTER INSERT ON pcform BEGIN
+            INSERT INTO pcform_fts(rowid, {columns})
+            VALUES (new.id, {new_columns});
+        END
+    """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS pcform_fts_ad AFTER DELETE ON pcform BEGIN
+            INSERT INTO pcform_fts(pcform_fts, rowid, {columns})
+            VALUES ('delete', old.id, {old_columns});
+        END
+    """
+    )
+    # Only searchable columns: toggling a favorite must not touch the index
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS pcform_fts_au
+        AFTER UPDATE OF {columns} ON pcform BEGIN
+            INSERT INTO pcform_fts(pcform_fts, rowid, {columns})
+            VALUES ('delete', old.id, {old_columns});
+            INSERT INTO pcform_fts(rowid, {columns})
+            VALUES (new.id, {new_columns});
+        END
+    """
+    )
+
+
+# (version, description, migration), applied in order. Versions 1-4 are
+# written to also bring databases from before versioning up to date.
+MIGRATIONS: List[Tuple[int, str, Callable[[sqlite3.Connection], None]]] = [
+    (1, "contract and user tables", _create_tables),
+    (2, "normalized search columns", _add_normalized_columns),
+    (3, "filter and sort indexes", _create_indexes),
+    (4, "full-text search index", _create_fts_index),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+# Database files already migrated by this process
+_migrated = set()
+_migrate_lock = threading.Lock()
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    """The database's schema version (0 for a new or pre-versioning database)."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """
+    Apply the migrations newer than the database's version, in order.
+
+    Each one runs in its own write transaction with the version bump, and
+    the version is re-read inside it, so two processes starting together
+    don't both apply the same migration.
+
+    Returns:
+        The database's schema version afterwards
+    """
+    version = schema_version(conn)
+    if version > SCHEMA_VERSION:
+        print(
+            f"Warning: database schema version {version} is newer than this "
+            f"version of the app ({SCHEMA_VERSION})"
+        )
+        return version
+
+    for target, description, migration in MIGRATIONS:
+        if target <= version:
+            continue
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = schema_version(conn)
+            if target > version:
+                migration(conn)
+                conn.execute(f"PRAGMA user_version = {int(target)}")
+                version = target
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            raise sqlite3.DatabaseError(
+                f"Schema migration {target} ({description}) failed: {e}"
+            ) from e
+    return version
+
+
+def ensure_schema(db_path: str = None) -> None:
+    """
+    Bring a database up to SCHEMA_VERSION, once per process.
+
+    Called by every repository constructor; only the first call for a
+    database file touches it, later calls return immediately.
+
+    Usage:
+        ensure_schema()  # the app database (PCFORM_DB_PATH)
+    """
+    key = os.path.abspath(db_path or str(PCFORM_DB_PATH))
+    if key in _migrated:
+        return
+    with _migrate_lock:
+        if key in _migrated:
+            return
+        with get_db_connection(key) as conn:
+            migrate(conn)
+        _migrated.add(key)
+
+
+def _columns(conn: sqlite3.Connection, table: str) -> set:
+    return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
@@ -1,6 +1,13 @@
-from typing import List, Dict, Any, Optional
+import re
+import time
+import unicodedata
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 from .base_repo import BaseRepository
-from services.database import get_db_connection
+from services.database import CancelToken, get_db_connection
+from services.events import DELETE, INSERT, RELOAD, UPDATE, ChangeEvent, change_events
+from services.query_stats import track_query
+from settings.config import DB_ITER_BATCH_SIZE, IMPORT_BATCH_SIZE
+from utils.text_normalization import normalize_text
 
 
 class PCFormRepository(BaseRepository):
@@ -28,37 +35,47 @@ class PCFormRepository(BaseRepository):
         "Description",
     ]
 
+    # Normalized copy of each searchable column (see normalize_text); search
+    # and the full-text index use these so spelling variants match
+    NORMALIZED_COLUMNS = {column: f"{column}_norm" for column in SEARCHABLE_COLUMNS}
+
+    # Advanced filter keys (see OpenFiltersDialog) -> column they match
+    FILTER_COLUMNS = {
+        "fullname": "fullname",
+        "device_model": "Device_Model",
+        "service_provider": "ServiceMan",
+        "problem_type": "Device_Problem",
+    }
+
+    # Full-text index over NORMALIZED_COLUMNS (external content, synced by triggers)
+    FTS_TABLE = "pcform_fts"
+    FTS_INSERT_TRIGGER = "pcform_fts_ai"
+
+    # Record columns returned by queries (not the normalized copies)
+    SELECT_COLUMNS = ", ".join(f"pcform.{column}" for column in VALID_COLUMNS)
+
+    # A word as the index's unicode61 tokenizer sees it (letters and digits)
+    WORD_PATTERN = re.compile(r"[^\W_]+")
+
+    # Set once per process by the first instance; False when SQLite lacks FTS5
+    fts_available: Optional[bool] = None
+
     @property
     def table_name(self) -> str:
         return "pcform"
 
-    def _create_table(self) -> None:
-        """Create pcform table if not exists."""
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS pcform (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    fullname TEXT,
-                    Device_Model TEXT,
-                    Device_Serial TEXT,
-                    ServiceMan TEXT,
-                    Device_Problem TEXT,
-                    Description TEXT,
-                    created_at TEXT DEFAULT (strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')),
-                    is_favorite INTEGER DEFAULT 0
-                )
-            """
-            )
+    def __init__(self):
+        super().__init__()
+        if PCFormRepository.fts_available is None:
+            # The index migration skips it when SQLite has no FTS5
+            PCFormRepository.fts_available = self._has_table(self.FTS_TABLE)
 
-            # Add is_favorite column if missing (for existing databases)
-            try:
-                cursor.execute(
-                    "ALTER TABLE pcform ADD COLUMN is_favorite INTEGER DEFAULT 0"
-                )
-            except Exception:
-                pass  # Column already exists
+    def _normalized_values(self, data: Dict[str, Any]) -> Dict[str, str]:
+        """Shadow column values for a record being written."""
+        return {
+            norm: normalize_text(data.get(column))
+            for column, norm in self.NORMALIZED_COLUMNS.items()
+        }
 
     def create(self, data: Dict[str, Any]) -> int:
         """
@@ -78,48 +95,603 @@ class PCFormRepository(BaseRepository):
         if not safe_data:
             raise ValueError("No valid columns provided")
 
+        safe_data.update(self._normalized_values(safe_data))
         columns = ", ".join(safe_data.keys())
         placeholders = ", ".join("?" * len(safe_data))
 
-        return self._execute_write(
+        record_id = self._execute_write(
             f"INSERT INTO pcform ({columns}) VALUES ({placeholders})",
             tuple(safe_data.values()),
         )
+        self._publish(INSERT, record_id)
+        return record_id
+
+    def insert_many(
+        self,
+        records: Iterable[Dict[str, Any]],
+        batch_size: int = IMPORT_BATCH_SIZE,
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        """
+        Insert many records with executemany, one transaction per batch.
+
+        Much faster than calling create() for each record: a batch shares
+        one transaction, and its rows go into the full-text index with a
+        single statement at the end instead of row by row through the
+        insert trigger. Batches commit one by one, so other windows can
+        still save between them; if a batch fails, the earlier ones stay.
+
+        Keys outside VALID_COLUMNS (and "id") are ignored; a missing
+        created_at or is_favorite gets the column default. Open views are
+        told to reload once, not per record.
+
+        Args:
+            records: Record dicts (see services/table_import.py for validation)
+            batch_size: Records per transaction
+            progress: Called with the number inserted so far after each batch
+
+        Returns:
+            Number of records inserted
+
+        Usage:
+            repo.insert_many(rows, batch_size=10000)
+        """
+        columns = [c for c in self.VALID_COLUMNS if c != "id"]
+        norm_columns = list(self.NORMALIZED_COLUMNS.values())
+        placeholders = [
+            "COALESCE(?, strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime'))"
+            if column == "created_at"
+            else "COALESCE(?, 0)" if column == "is_favorite" else "?"
+            for column in columns
+        ]
+        sql = (
+            f"INSERT INTO pcform ({', '.join(columns + norm_columns)}) "
+            f"VALUES ({', '.join(placeholders + ['?'] * len(norm_columns))})"
+        )
+
+        inserted = 0
+        batch = []
+        try:
+            for record in records:
+                values = [record.get(column) for column in columns]
+                batch.append(values + list(self._normalized_values(record).values()))
+                if len(batch) >= batch_size:
+                    inserted += self._insert_batch(sql, batch)
+                    batch = []
+                    if progress is not None:
+                        progress(inserted)
+            if batch:
+                inserted += self._insert_batch(sql, batch)
+                if progress is not None:
+                    progress(inserted)
+        finally:
+            if inserted:
+                self._publish(RELOAD, None)
+        return inserted
+
+    def _insert_batch(self, sql: str, rows: List[list]) -> int:
+        """Insert one batch in its own transaction, indexing it for search in bulk."""
+        requested = time.perf_counter()
+        with get_db_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            if not self.fts_available:
+                with track_query(conn, sql, rows[0], requested, log_slow=False) as trace:
+                    trace.rows = conn.executemany(sql, rows).rowcount
+                return len(rows)
+
+            # Skip the per-row index trigger for this transaction only (the
+            # write lock is held, so no other insert can miss it)
+            trigger = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = ?",
+                (self.FTS_INSERT_TRIGGER,),
+            ).fetchone()
+            last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM pcform").fetchone()[0]
+            if trigger:
+                conn.execute(f"DROP TRIGGER {self.FTS_INSERT_TRIGGER}")
+            with track_query(conn, sql, rows[0], requested, log_slow=False) as trace:
+                trace.rows = conn.executemany(sql, rows).rowcount
+            columns = ", ".join(self.NORMALIZED_COLUMNS.values())
+            index_sql = (
+                f"INSERT INTO {self.FTS_TABLE}(rowid, {columns}) "
+                f"SELECT id, {columns} FROM pcform WHERE id > ?"
+            )
+            with track_query(conn, index_sql, (last_id,), log_slow=False) as trace:
+                trace.rows = conn.execute(index_sql, (last_id,)).rowcount
+            if trigger:
+                conn.execute(trigger[0])  # restored as the migration created it
+            return len(rows)
+
+    def _has_table(self, name: str) -> bool:
+        return self._execute_one(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+        ) is not None
 
     def get_all(self) -> List[Dict[str, Any]]:
         """Get all records."""
-        return self._execute("SELECT * FROM pcform ORDER BY id DESC")
+        return self._execute(f"SELECT {self.SELECT_COLUMNS} FROM pcform ORDER BY id DESC")
+
+    def iter_all(
+        self, batch_size: int = DB_ITER_BATCH_SIZE
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream all records (newest first) in batches of dicts."""
+        return self._iter(
+            f"SELECT {self.SELECT_COLUMNS} FROM pcform ORDER BY id DESC", (), batch_size
+        )
 
     def get_by_id(self, record_id: int) -> Optional[Dict[str, Any]]:
         """Get single record by ID."""
-        return self._execute_one("SELECT * FROM pcform WHERE id = ?", (record_id,))
+        return self._execute_one(
+            f"SELECT {self.SELECT_COLUMNS} FROM pcform WHERE id = ?", (record_id,)
+        )
 
-    def search(self, query: str, columns: List[str]) -> List[Dict[str, Any]]:
+    def search(
+        self,
+        query: str,
+        columns: Optional[List[str]] = None,
+        cancel: Optional[CancelToken] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Search records.
 
+        Every whitespace-separated token must match (AND semantics). With the
+        full-text index a token matches the start of any word ("del" finds
+        "Dell"), results are ranked by relevance; without it, tokens are
+        matched as substrings with LIKE.
+
         Args:
             query: Search text
             columns: Columns to search (default: all searchable)
+            cancel: Token that aborts the query (raises QueryCancelled)
 
         Returns:
             List of matching records
         """
-        if not query or not query.strip():
-            return self.get_all()
+        statement = self._search_statement(query, columns)
+        if statement is None:
+            return []
+        return self._execute(*statement, cancel=cancel)
+
+    def iter_search(
+        self,
+        query: str,
+        columns: Optional[List[str]] = None,
+        batch_size: int = DB_ITER_BATCH_SIZE,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream search results in batches (same matching rules as search)."""
+        statement = self._search_statement(query, columns)
+        if statement is None:
+            return iter(())
+        return self._iter(*statement, batch_size=batch_size)
+
+    def _search_statement(
+        self, query: str, columns: Optional[List[str]] = None
+    ) -> Optional[tuple]:
+        """Build the (sql, params) of a search, or None if nothing can match."""
+        tokens = self._tokenize(query)
+        if not tokens:
+            return f"SELECT {self.SELECT_COLUMNS} FROM pcform ORDER BY id DESC", ()
 
         # Use only valid, searchable columns
         search_cols = columns or self.SEARCHABLE_COLUMNS
         valid_cols = [c for c in search_cols if c in self.SEARCHABLE_COLUMNS]
 
         if not valid_cols:
+            return None
+
+        if self.fts_available:
+            return self._full_text_statement(query, valid_cols)
+
+        # Fallback: every token must appear in at least one (normalized) column
+        token_clause = (
+            "(" + " OR ".join(f"{self.NORMALIZED_COLUMNS[c]} LIKE ?" for c in valid_cols) + ")"
+        )
+        conditions = " AND ".join(token_clause for _ in tokens)
+        params = tuple(f"%{token}%" for token in tokens for _ in valid_cols)
+
+        return (
+            f"SELECT {self.SELECT_COLUMNS} FROM pcform WHERE {conditions} ORDER BY id DESC",
+            params,
+        )
+
+    def full_text_search(
+        self,
+        query: str,
+        columns: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Ranked full-text search using the FTS5 index.
+
+        Args:
+            query: Search text; every token must match a word prefix
+            columns: Restrict matching to these searchable columns
+            limit: Maximum number of results (best matches first)
+
+        Returns:
+            List of matching records, most relevant first
+        """
+        statement = self._full_text_statement(query, columns, limit)
+        if statement is None:
             return []
+        return self._execute(*statement)
+
+    def _full_text_statement(
+        self,
+        query: str,
+        columns: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+    ) -> Optional[tuple]:
+        """Build the (sql, params) of a ranked FTS5 query."""
+        match = self._fts_match_expression(query, columns)
+        if not match:
+            return None
+
+        sql = f"""
+            SELECT {self.SELECT_COLUMNS} FROM {self.FTS_TABLE}
+            JOIN pcform ON pcform.id = {self.FTS_TABLE}.rowid
+            WHERE {self.FTS_TABLE} MATCH ?
+            ORDER BY {self.FTS_TABLE}.rank, pcform.id DESC
+        """
+        params = (match,)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params += (int(limit),)
+        return sql, params
+
+    def find(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: str = "id DESC",
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[tuple] = None,
+        before: Optional[tuple] = None,
+        cancel: Optional[CancelToken] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Query records matching advanced filters, entirely in SQL.
+
+        For paging through large results prefer keyset pagination over
+        ``offset``: pass the ``keyset_key`` of the last row of the previous
+        page as ``after`` (or of the first row as ``before`` to page back).
+
+        Args:
+            filters: Filter dict as built by OpenFiltersDialog (fullname,
+                device_model, service_provider, problem_type, date_from,
+                date_to, favorites_only) plus an optional free-text "query"
+            order_by: Column name with optional ASC/DESC, e.g. "created_at DESC"
+            limit: Maximum number of rows
+            offset: Number of rows to skip
+            after: Only rows that sort after this keyset key
+            before: Only rows that sort before this keyset key
+            cancel: Token that aborts the query (raises QueryCancelled)
+
+        Returns:
+            List of matching records, in ``order_by`` order
+        """
+        column, direction = self._parse_order_by(order_by)
+        where, params = self._build_filter_clause(filters or {})
+        conditions = [where] if where else []
+
+        # Paging backwards = paging forwards in the opposite direction
+        backwards = before is not None and after is None
+        if backwards:
+            direction = "ASC" if direction == "DESC" else "DESC"
+
+        key = before if backwards else after
+        filter_conditions, filter_params = list(conditions), list(params)
+        if key is not None:
+            condition, key_params = self._keyset_condition(column, direction, key)
+            conditions.append(condition)
+            params.extend(key_params)
+
+        rows = self._select(conditions, params, column, direction, limit, offset, cancel)
+
+        # NULLs sort last in DESC order but the keyset condition leaves them out
+        # (so the index can seek); continue with them once the values run out
+        if (
+            key is not None
+            and direction == "DESC"
+            and column != "id"
+            and key[0] is not None
+            and (limit is None or len(rows) < limit)
+        ):
+            rows += self._select(
+                filter_conditions + [f"{column} IS NULL"],
+                filter_params,
+                column,
+                direction,
+                None if limit is None else limit - len(rows),
+                None,
+                cancel,
+            )
+
+        if backwards:
+            rows.reverse()
+        return rows
 
-        # Build WHERE clause
-        conditions = " OR ".join(f"{col} LIKE ?" for col in valid_cols)
-        params = tuple(f"%{query}%" for _ in valid_cols)
+    def _select(
+        self,
+        conditions: List[str],
+        params: List[Any],
+        column: str,
+        direction: str,
+        limit: Optional[int],
+        offset: Optional[int],
+        cancel: Optional[CancelToken],
+    ) -> List[Dict[str, Any]]:
+        """Run the SELECT built by ``find``."""
+        params = list(params)
+        sql = f"SELECT {self.SELECT_COLUMNS} FROM pcform"
+        if conditions:
+            sql += " WHERE " + " AND ".join(f"({c})" for c in conditions)
+        sql += f" ORDER BY {self._order_by_clause(column, direction)}"
 
-        return self._execute(f"SELECT * FROM pcform WHERE {conditions}", params)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        elif offset:
+            sql += " LIMIT -1"
+        if offset:
+            sql += " OFFSET ?"
+            params.append(int(offset))
+
+        return self._execute(sql, tuple(params), cancel=cancel)
+
+    def iter_find(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: str = "id DESC",
+        batch_size: int = DB_ITER_BATCH_SIZE,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream every record ``find`` would return, in batches of dicts."""
+        column, direction = self._parse_order_by(order_by)
+        where, params = self._build_filter_clause(filters or {})
+        sql = f"SELECT {self.SELECT_COLUMNS} FROM pcform"
+        if where:
+            sql += f" WHERE {where}"
+        sql += f" ORDER BY {self._order_by_clause(column, direction)}"
+        return self._iter(sql, tuple(params), batch_size=batch_size)
+
+    def column_lengths(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None,
+    ) -> tuple:
+        """
+        Count the records matching ``filters`` and measure their longest values.
+
+        One aggregate query, so exports can size their columns up front
+        without holding the rows.
+
+        Returns:
+            (row count, {column: length of its longest value})
+        """
+        columns = [c for c in (columns or self.VALID_COLUMNS) if c in self.VALID_COLUMNS]
+        where, params = self._build_filter_clause(filters or {})
+        lengths = ", ".join(f"MAX(LENGTH(pcform.{c}))" for c in columns)
+        sql = f"SELECT COUNT(*), {lengths} FROM pcform"
+        if where:
+            sql += f" WHERE {where}"
+        requested = time.perf_counter()
+        with get_db_connection() as conn, track_query(conn, sql, params, requested) as trace:
+            count, *longest = conn.execute(sql, tuple(params)).fetchone()
+            trace.rows = 1
+        return count, {c: n or 0 for c, n in zip(columns, longest)}
+
+    def get_matching(
+        self, record_id: int, filters: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Get a record by ID if it passes ``filters`` (same rules as ``find``)."""
+        where, params = self._build_filter_clause(filters or {})
+        sql = f"SELECT {self.SELECT_COLUMNS} FROM pcform WHERE id = ?"
+        if where:
+            sql += f" AND ({where})"
+        return self._execute_one(sql, (record_id, *params))
+
+    def keyset_key(self, row: Dict[str, Any], order_by: str = "id DESC") -> tuple:
+        """Return the keyset pagination key of a row for the given order."""
+        column, _ = self._parse_order_by(order_by)
+        if column == "id":
+            return (row["id"],)
+        return (row.get(column), row["id"])
+
+    def _build_filter_clause(self, filters: Dict[str, Any]) -> tuple:
+        """
+        Translate a filter dict into a WHERE clause and its parameters.
+
+        Text filters go through the FTS index (one MATCH for all of them),
+        dates and favorites through their b-tree indexes.
+        """
+        conditions = []
+        params = []
+        match_parts = []
+
+        query = filters.get("query")
+        if query and self._tokenize(query):
+            if self.fts_available:
+                match_parts.append(f"({self._fts_match_expression(query)})")
+            else:
+                for token in self._tokenize(query):
+                    conditions.append(
+                        "("
+                        + " OR ".join(f"{c} LIKE ?" for c in self.NORMALIZED_COLUMNS.values())
+                        + ")"
+                    )
+                    params.extend(f"%{token}%" for _ in self.SEARCHABLE_COLUMNS)
+
+        for key, column in self.FILTER_COLUMNS.items():
+            value = str(filters.get(key) or "").strip()
+            if not value:
+                continue
+            if self.fts_available:
+                expression = self._fts_match_expression(value, [column])
+                if expression:
+                    match_parts.append(expression)
+            else:
+                conditions.append(f"{self.NORMALIZED_COLUMNS[column]} LIKE ?")
+                params.append(f"%{normalize_text(value)}%")
+
+        if match_parts:
+            conditions.insert(
+                0, f"id IN (SELECT rowid FROM {self.FTS_TABLE} WHERE {self.FTS_TABLE} MATCH ?)"
+            )
+            params.insert(0, " AND ".join(match_parts))
+
+        date_from = str(filters.get("date_from") or "").strip()
+        if date_from:
+            conditions.append("created_at >= ?")
+            params.append(date_from)
+
+        date_to = str(filters.get("date_to") or "").strip()
+        if date_to:
+            if len(date_to) == len("YYYY-MM-DD"):
+                date_to += " 23:59:59"  # Include the whole last day
+            conditions.append("created_at <= ?")
+            params.append(date_to)
+
+        if filters.get("favorites_only"):
+            conditions.append("is_favorite = 1")
+
+        return " AND ".join(conditions), params
+
+    def _parse_order_by(self, order_by: Optional[str]) -> tuple:
+        """Validate a "column [ASC|DESC]" string into (column, direction)."""
+        parts = (order_by or "id DESC").split()
+        column = parts[0]
+        direction = parts[1].upper() if len(parts) > 1 else "ASC"
+
+        if (
+            len(parts) > 2
+            or column not in self.VALID_COLUMNS
+            or direction not in ("ASC", "DESC")
+        ):
+            raise ValueError(f"Invalid sort order: {order_by}")
+        return column, direction
+
+    @staticmethod
+    def _order_by_clause(column: str, direction: str) -> str:
+        """ORDER BY terms for a validated column; ties are broken by id."""
+        if column == "id":
+            return f"id {direction}"
+        return f"{column} {direction}, id {direction}"
+
+    @staticmethod
+    def _keyset_condition(column: str, direction: str, key: tuple) -> tuple:
+        """
+        WHERE condition selecting rows that sort after ``key``.
+
+        SQLite sorts NULL before every value, so NULLs come first in ASC
+        order and last in DESC order. Row-value comparisons let SQLite seek
+        in the column's index; in DESC order the trailing NULL rows are left
+        to ``find``.
+        """
+        op = ">" if direction == "ASC" else "<"
+
+        if column == "id":
+            return f"id {op} ?", [key[-1]]
+
+        value, record_id = key
+        if value is None:
+            if direction == "ASC":
+                return f"({column} IS NULL AND id > ?) OR {column} IS NOT NULL", [
+                    record_id
+                ]
+            return f"{column} IS NULL AND id < ?", [record_id]
+
+        return f"({column}, id) {op} (?, ?)", [value, record_id]
+
+    @staticmethod
+    def _tokenize(query: Optional[str]) -> List[str]:
+        """Normalize a query and split it into tokens, dropping punctuation-only tokens."""
+        return [
+            token
+            for token in normalize_text(query).split()
+            if any(ch.isalnum() for ch in token)
+        ]
+
+    def _fts_match_expression(
+        self, query: str, columns: Optional[List[str]] = None
+    ) -> str:
+        """
+        Build an FTS5 MATCH expression: prefix-matched tokens joined by AND.
+
+        Each token is quoted so user input can never be parsed as FTS syntax.
+        """
+        tokens = self._tokenize(query)
+        if not tokens:
+            return ""
+
+        terms = " AND ".join('"{}"*'.format(t.replace('"', '""')) for t in tokens)
+
+        cols = [self.NORMALIZED_COLUMNS[c] for c in (columns or []) if c in self.NORMALIZED_COLUMNS]
+        if cols and len(cols) < len(self.SEARCHABLE_COLUMNS):
+            return "{%s}: (%s)" % (" ".join(cols), terms)
+        return terms
+
+    @classmethod
+    def refines_query(cls, previous: str, query: str) -> bool:
+        """
+        True if ``query`` can only match a subset of what ``previous`` matched.
+
+        That holds when every previous token is a prefix of some new token
+        (the user kept typing), so results can be narrowed in memory.
+        """
+        old = cls._tokenize(previous)
+        new = cls._tokenize(query)
+        return bool(old) and all(any(n.startswith(o) for n in new) for o in old)
+
+    def query_matcher(self, query: str) -> Callable[[Dict[str, Any]], bool]:
+        """
+        Return a function that checks fetched records against ``query`` in Python.
+
+        Mirrors the rules of ``search``: word-prefix matching (case and
+        diacritics ignored) with the full-text index, substrings without it.
+        """
+        columns = self.SEARCHABLE_COLUMNS
+
+        if self.fts_available:
+            fold = self.fold_text
+            tests = [self.phrase_pattern(words).search for words in self.query_phrases(query)]
+        else:
+            # LIKE '%token%' on the normalized columns (Latin diacritics matter)
+            fold = normalize_text
+            tests = [lambda text, token=token: token in text for token in self._tokenize(query)]
+
+        def matches(record: Dict[str, Any]) -> bool:
+            text = fold("\0".join(str(record.get(c) or "") for c in columns))
+            return all(test(text) for test in tests)
+
+        return matches
+
+    @classmethod
+    def query_phrases(cls, query: str) -> List[List[str]]:
+        """Words of each query token, folded the way the full-text index matches them."""
+        phrases = (cls.WORD_PATTERN.findall(cls.fold_text(t)) for t in cls._tokenize(query))
+        return [words for words in phrases if words]
+
+    @classmethod
+    def text_words(cls, value: Any) -> List[str]:
+        """Words of a column value, folded the way the full-text index stores them."""
+        return cls.WORD_PATTERN.findall(cls.fold_text(value))
+
+    @staticmethod
+    def phrase_pattern(words: List[str]) -> "re.Pattern":
+        """
+        Regex for a token's words in a row, the last one as a prefix.
+
+        Words never match across a "\\0", used to join several columns.
+        """
+        return re.compile(r"(?<![^\W_])" + r"(?:[^\w\0]|_)+".join(map(re.escape, words)))
+
+    @staticmethod
+    def fold_text(value: Any) -> str:
+        """Normalized text without diacritics, as the full-text index sees it."""
+        text = normalize_text(value)
+        if text.isascii():
+            return text  # fast path: nothing to strip
+        text = unicodedata.normalize("NFKD", text)
+        return "".join(ch for ch in text if not unicodedata.combining(ch))
 
     def toggle_favorite(self, record_id: int) -> Optional[int]:
         """Toggle favorite status, return new status."""
@@ -129,18 +701,27 @@ class PCFormRepository(BaseRepository):
 
         new_status = 0 if record["is_favorite"] else 1
 
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "UPDATE pcform SET is_favorite = ? WHERE id = ?",
-                (new_status, record_id),
-            )
+        self._execute_write(
+            "UPDATE pcform SET is_favorite = ? WHERE id = ?", (new_status, record_id)
+        )
 
+        self._publish(UPDATE, record_id, {"is_favorite": new_status})
         return new_status
 
     def delete(self, record_id: int) -> bool:
         """Delete record by ID."""
-        with get_db_connection() as conn:
+        sql = "DELETE FROM pcform WHERE id = ?"
+        requested = time.perf_counter()
+        with get_db_connection() as conn, track_query(conn, sql, (record_id,), requested) as trace:
             cursor = conn.cursor()
-            cursor.execute("DELETE FROM pcform WHERE id = ?", (record_id,))
-            return cursor.rowcount > 0
+            cursor.execute(sql, (record_id,))
+            trace.rows = cursor.rowcount
+            deleted = cursor.rowcount > 0
+
+        if deleted:
+            self._publish(DELETE, record_id)
+        return deleted
+
+    def _publish(self, action: str, record_id: int, changes: Dict[str, Any] = None) -> None:
+        """Announce a committed change so open views can patch just that row."""
+        change_events.publish(ChangeEvent(self.table_name, action, record_id, changes))
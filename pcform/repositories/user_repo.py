@@ -1,6 +1,5 @@
 from typing import Optional, Dict, Any
 from repositories.base_repo import BaseRepository
-from services.database import get_db_connection
 
 
 class UserRepository(BaseRepository):
@@ -10,21 +9,6 @@ class UserRepository(BaseRepository):
     def table_name(self) -> str:
         return "pcform_auth"
 
-    def _create_table(self) -> None:
-        """Create users table if not exists."""
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS pcform_auth (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    username TEXT UNIQUE NOT NULL,
-                    password_hash TEXT NOT NULL,
-                    created_at TEXT DEFAULT (strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime'))
-                )
-            """
-            )
-
     def create(self, username: str, password_hash: str) -> int:
         """Create new user.
         Note:
@@ -0,0 +1,120 @@
+import os
+import queue
+import threading
+from tkinter import messagebox
+
+import customtkinter as ctk
+
+from exports.batch_export import BatchExporter
+from settings.config import BATCH_EXPORT_FORMAT
+from utils.widget_utils import center_dialog, set_icon
+
+
+class BulkExportDialog(ctk.CTkToplevel):
+    """Progress window for exporting many contracts at once
+
+    The batch runs on a helper thread (which drives the process pool);
+    progress comes back through a queue polled with after().
+    """
+
+    POLL_MS = 100
+
+    def __init__(self, parent, records: list, folder: str, fmt: str = BATCH_EXPORT_FORMAT):
+        super().__init__(parent)
+        self.title("Bulk Export")
+        self.resizable(False, False)
+        set_icon(self)
+        center_dialog(self, 420, 180)
+        self.transient(parent)
+
+        self.records = records
+        self.folder = folder
+        self.total = len(records)
+        self.cancel_event = threading.Event()
+        self.updates = queue.Queue()
+        self.failed = 0
+
+        self.status_label = ctk.CTkLabel(
+            self,
+            text=f"Exporting 0 of {self.total} contracts...",
+            font=ctk.CTkFont(size=13, weight="bold"),
+        )
+        self.status_label.pack(padx=20, pady=(20, 10))
+
+        self.progress_bar = ctk.CTkProgressBar(self, width=360)
+        self.progress_bar.set(0)
+        self.progress_bar.pack(padx=20, pady=5)
+
+        self.cancel_button = ctk.CTkButton(
+            self, text="Cancel", command=self.cancel, fg_color="red", hover_color="darkred"
+        )
+        self.cancel_button.pack(pady=15)
+        self.protocol("WM_DELETE_WINDOW", self.cancel)
+
+        self.exporter = BatchExporter(fmt=fmt)
+        self.worker = threading.Thread(target=self._run, daemon=True)
+        self.worker.start()
+        self.after(self.POLL_MS, self._poll)
+
+    def _run(self):
+        """Helper thread: run the batch, report through the queue"""
+        try:
+            report = self.exporter.run(
+                self.records,
+                self.folder,
+                progress=lambda done, total, result: self.updates.put(
+                    ("progress", done, result)
+                ),
+                cancel_event=self.cancel_event,
+            )
+            self.updates.put(("done", report))
+        except Exception as e:
+            self.updates.put(("error", e))
+
+    def _poll(self):
+        """Apply queued progress updates on the Tk thread"""
+        try:
+            while True:
+                update = self.updates.get_nowait()
+                if update[0] == "progress":
+                    _, done, result = update
+                    if not result.ok:
+                        self.failed += 1
+                    text = f"Exporting {done} of {self.total} contracts..."
+                    if self.failed:
+                        text += f" ({self.failed} failed)"
+                    self.status_label.configure(text=text)
+                    self.progress_bar.set(done / self.total)
+                elif update[0] == "done":
+                    self._finish(update[1])
+                    return
+                else:
+                    self.destroy()
+                    messagebox.showerror("Error", f"Bulk export failed:\n{update[1]}")
+                    return
+        except queue.Empty:
+            pass
+        self.after(self.POLL_MS, self._poll)
+
+    def cancel(self):
+        """Stop queued contracts; ones in progress still finish"""
+        if not self.cancel_event.is_set():
+            self.cancel_event.set()
+            self.status_label.configure(text="Cancelling...")
+            self.cancel_button.configure(state="disabled")
+
+    def _finish(self, report):
+        """Show the summary (and where the error report was written)"""
+        self.destroy()
+        message = report.summary()
+        if report.failed:
+            try:
+                report_path = report.write_error_report(
+                    os.path.join(self.folder, "export_errors.csv")
+                )
+                message += f"\n\nFailed contracts are listed in:\n{report_path}"
+            except OSError as e:
+                message += f"\n\nCould not write error report: {e}"
+            messagebox.showwarning("Bulk Export", message)
+        else:
+            messagebox.showinfo("Bulk Export", f"{message}\n\nFiles saved to:\n{self.folder}")
@@ -1,12 +1,22 @@
 from tkinter import filedialog, messagebox, ttk
 
 import customtkinter as ctk
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, Font, PatternFill
 
-from settings.config import PERSIAN_FONT
+from settings.config import (
+    DB_ITER_BATCH_SIZE,
+    PERSIAN_FONT,
+    SEARCH_LOAD_BATCH_SIZE,
+    SEARCH_MAX_LOADED_ROWS,
+    SEARCH_NARROW_MAX_ROWS,
+    SEARCH_PAGE_SIZE,
+    SEARCH_VIRTUAL_SCROLL,
+)
 from repositories.pcform_repo import PCFormRepository
 from exports.pdf_converter import form_docx_to_pdf_handler
+from services.database import CancelToken, QueryCancelled
+from services.events import DELETE, RELOAD, change_events
+from utils.background import get_dispatcher, run_in_background
+from utils.token_index import TokenIndex
 from utils.widget_utils import set_icon
 
 
@@ -23,7 +33,7 @@ class DatabaseInfo(ctk.CTkFrame):
         self.parent_window = parent_window
         self.selected_record_id = None
         self.sort_column = "id"
-        self.sort_ascending = True
+        self.sort_ascending = False  # Newest records first
         # Repository instance
         self.db = PCFormRepository()
 
@@ -45,6 +55,19 @@ class DatabaseInfo(ctk.CTkFrame):
         )
         self.export_button.pack(side="left", padx=5, pady=5)
 
+        # Bulk export: selected rows, or the whole current view
+        self.bulk_export_button = ctk.CTkButton(
+            self.button_frame,
+            text="📦 Bulk Export",
+            command=self.export_bulk_contracts,
+            width=120,
+            font=ctk.CTkFont(size=12, weight="bold"),
+            height=40,
+            fg_color="green",
+            hover_color="darkgreen",
+        )
+        self.bulk_export_button.pack(side="left", padx=5, pady=5)
+
         self.view_details_button = ctk.CTkButton(
             self.button_frame,
             text="👁️ View Details",
@@ -120,6 +143,27 @@ class DatabaseInfo(ctk.CTkFrame):
         )
         self.csv_button.pack(side="left", padx=5, pady=5)
 
+        self.import_button = ctk.CTkButton(
+            self.button_frame,
+            text="📤 Import",
+            command=self.import_records,
+            width=100,
+            font=ctk.CTkFont(family=PERSIAN_FONT, size=12, weight="bold"),
+            height=40,
+        )
+        self.import_button.pack(side="left", padx=5, pady=5)
+
+        self.timings_button = ctk.CTkButton(
+            self.button_frame,
+            text="⏱ Timings",
+            command=self.show_export_timings,
+            width=100,
+            font=ctk.CTkFont(family=PERSIAN_FONT, size=12, weight="bold"),
+            height=40,
+            fg_color="gray",
+        )
+        self.timings_button.pack(side="left", padx=5, pady=5)
+
         self.refresh_button = ctk.CTkButton(
             self.button_frame,
             text="🔄 Refresh",
@@ -130,6 +174,19 @@ class DatabaseInfo(ctk.CTkFrame):
         )
         self.refresh_button.pack(side="right", padx=5, pady=5)
 
+        # Progress of background exports
+        self.status_label = ctk.CTkLabel(
+            self.button_frame, text="", font=ctk.CTkFont(size=12)
+        )
+        self.status_label.pack(side="right", padx=5, pady=5)
+        self.exports_running = 0
+
+        # Shown while records load in the background
+        self.loading_label = ctk.CTkLabel(
+            self.button_frame, text="", font=ctk.CTkFont(size=12), text_color="gray"
+        )
+        self.loading_label.pack(side="right", padx=5, pady=5)
+
         # Create scrollable frame for treeview
         self.tree_frame = ctk.CTkFrame(self)
         self.tree_frame.pack(fill="both", expand=True, padx=5, pady=5)
@@ -143,13 +200,47 @@ class DatabaseInfo(ctk.CTkFrame):
         self.rows = []
         self.filtered_rows = []
         self._filters_active = False
+        self._active_filters = {}
+        self._search_query = ""  # memory mode: query of the shown results
+
+        # Virtual scrolling state: the grid holds a window of rows fetched
+        # page by page with keyset pagination (see _load_next_page)
+        self.virtual_scroll = SEARCH_VIRTUAL_SCROLL
+        self._view_filters = {}
+        self._view_order = "id DESC"
+        self._loaded_rows = {}  # Treeview iid -> row dict
+        self._has_more_before = False
+        self._has_more_after = False
+        self._page_request = None
+
+        # Background loading state: results of an older load are ignored
+        self._load_generation = 0
+        self._load_cancel = None  # CancelToken of the running load
+        self._loading = False
+
+        # Memory-mode searches run in the background; older ones are cancelled
+        self._search_generation = 0
+        self._search_cancel = None
+        # Query whose complete results are in the grid (lets typing narrow them)
+        self._results_query = None
+        # Memory mode: rows in ascending order per sort column, and the
+        # (column, ascending) order filtered_rows is in (None = unsorted)
+        self._sort_cache = {}
+        self._sorted_as = None
+        # Memory mode: word index of self.rows, built once every row has loaded
+        self._token_index = None
+        # Changes seen while loading; the streamed rows may predate them
+        self._changes_during_load = []
+        # Memory mode: append streamed rows to the grid (False once a search
+        # or filter replaced the view while loading)
+        self._stream_to_grid = False
 
         # Adjust columns as needed
         self.tree = ttk.Treeview(
             self.tree_frame,
             columns=self.title_list,
             show="headings",
-            selectmode="browse",
+            selectmode="extended",  # Ctrl/Shift-click for bulk export
         )
 
         # Configure column headings with larger font - make sortable
@@ -166,19 +257,19 @@ class DatabaseInfo(ctk.CTkFrame):
             self.tree.column(column, width=width, anchor="w")
 
         # Add scrollbars
-        scrollbar_y = ttk.Scrollbar(
+        self.scrollbar_y = ttk.Scrollbar(
             self.tree_frame, orient="vertical", command=self.tree.yview
         )
         scrollbar_x = ttk.Scrollbar(
             self.tree_frame, orient="horizontal", command=self.tree.xview
         )
         self.tree.configure(
-            yscrollcommand=scrollbar_y.set, xscrollcommand=scrollbar_x.set
+            yscrollcommand=self._on_tree_scroll, xscrollcommand=scrollbar_x.set
         )
 
         # Pack treeview and scrollbars
         self.tree.grid(row=0, column=0, sticky="nsew")
-        scrollbar_y.grid(row=0, column=1, sticky="ns")
+        self.scrollbar_y.grid(row=0, column=1, sticky="ns")
         scrollbar_x.grid(row=1, column=0, sticky="ew")
         self.tree_frame.grid_rowconfigure(0, weight=1)
         self.tree_frame.grid_columnconfigure(0, weight=1)
@@ -187,9 +278,20 @@ class DatabaseInfo(ctk.CTkFrame):
         self.tree.bind("<<TreeviewSelect>>", self.on_select)
         self.tree.bind("<Double-1>", lambda e: self.export_selected_contract())
 
-        # Populate Treeview with data
+        # Patch single rows when records change (saved forms, other windows)
+        self._dispatcher = get_dispatcher(self)
+        self._unsubscribe_changes = change_events.subscribe(self._on_record_changed)
+
+        # Populate Treeview with data (loads in the background)
         self.populate_treeview()
 
+    def destroy(self):
+        self._unsubscribe_changes()
+        for cancel in (self._load_cancel, self._search_cancel):
+            if cancel is not None:
+                cancel.set()
+        super().destroy()
+
     def on_select(self, _event):
         """Handle row selection"""
         # _event parameter required by tkinter bind
@@ -215,48 +317,102 @@ class DatabaseInfo(ctk.CTkFrame):
             self.selected_record_id = None
 
     def export_to_csv(self):
-        """Export current treeview data to CSV (fallback if openpyxl missing)"""
-        import csv
-
-        try:
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".csv",
-                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
-                initialfile="contracts_export.csv",
-            )
-            if not file_path:
-                return
-
-            with open(file_path, "w", newline="", encoding="utf-8") as csvfile:
-                writer = csv.writer(csvfile)
-                # headers
-                writer.writerow(self.title_list)
-                for item in self.tree.get_children():
-                    item_data = self.tree.item(item)
-                    row = list(item_data.get("values", []))
-                    writer.writerow(row)
-
-            messagebox.showinfo("Success", f"Exported to CSV:\n{file_path}")
-        except (IOError, OSError, ValueError) as e:
-            messagebox.showerror("Error", f"CSV export failed:\n{str(e)}")
+        """Export the current view to CSV or JSON Lines (optionally gzipped) in the background"""
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[
+                ("CSV files", "*.csv"),
+                ("Compressed CSV", "*.csv.gz"),
+                ("JSON Lines", "*.jsonl"),
+                ("Compressed JSON Lines", "*.jsonl.gz"),
+                ("All files", "*.*"),
+            ],
+            initialfile="contracts_export.csv",
+        )
+        if file_path:
+            self._start_table_export(file_path)
 
     def sort_by_column(self, column):
-        if self.sort_column == column:
+        same_column = self.sort_column == column
+        if same_column:
             self.sort_ascending = not self.sort_ascending
         else:
             self.sort_column = column
             self.sort_ascending = True
 
-        def sort_key(r):
-            value = r.get(column)
-            return (value is None, str(value).lower())
-
-        self.filtered_rows.sort(
-            key=sort_key,
-            reverse=not self.sort_ascending
-        )
+        if self.virtual_scroll:
+            direction = "ASC" if self.sort_ascending else "DESC"
+            self._view_order = f"{column} {direction}"
+            if same_column and not (
+                self._loading or self._has_more_before or self._has_more_after
+            ):
+                # Every row is in the grid: flipping the order is just a reversal
+                self.tree.set_children("", *reversed(self.tree.get_children()))
+                self.tree.yview_moveto(0)
+                return
+            # Let the database sort (indexed); pages follow the new order
+            self._reload_pages()
+            return
 
-        self._render_tree(self.filtered_rows)
+        if same_column and self._sorted_as == (column, not self.sort_ascending):
+            # Already sorted by this column: reuse the order, reversed
+            self.filtered_rows.reverse()
+            self.tree.set_children("", *reversed(self.tree.get_children()))
+        else:
+            self._sort_filtered_rows()
+            self._reorder_tree()
+        self._sorted_as = (column, self.sort_ascending)
+
+    def _sort_filtered_rows(self):
+        """Sort the in-memory view by the current sort column"""
+        column = self.sort_column
+        order = None if self._loading else self._sorted_rows(column)
+        if order is not None and len(self.filtered_rows) == len(self.rows):
+            rows = list(order)
+        elif order is not None:
+            shown = {r.get("id"): r for r in self.filtered_rows}
+            rows = [shown[r.get("id")] for r in order if r.get("id") in shown]
+        if order is None or len(rows) != len(self.filtered_rows):
+            # Rows that aren't (yet) in self.rows, e.g. while loading
+            rows = sorted(self.filtered_rows, key=self._sort_key(column))
+        if not self.sort_ascending:
+            rows.reverse()
+        self.filtered_rows = rows
+
+    def _sorted_rows(self, column: str) -> list:
+        """Memory mode: every row in ascending ``column`` order (cached per column)"""
+        rows = self._sort_cache.get(column)
+        if rows is None:
+            rows = self._sort_cache[column] = sorted(self.rows, key=self._sort_key(column))
+        return rows
+
+    @staticmethod
+    def _sort_key(column: str):
+        """
+        Sort key matching the database order: NULLs first, numbers by value,
+        text by code point (SQLite's default BINARY collation, so case-
+        sensitive), ties by id.
+
+        Keys are unique, so the descending order is exactly the reversal.
+        """
+        def key(row):
+            value = row.get(column)
+            record_id = row.get("id") or 0
+            if value is None:
+                return (0, 0, record_id)
+            if isinstance(value, (int, float)):
+                return (1, value, record_id)
+            return (2, str(value), record_id)
+
+        return key
+
+    def _reorder_tree(self):
+        """Show filtered_rows in their new order (moves rows already in the grid)"""
+        iids = [str(r.get("id")) for r in self.filtered_rows]
+        if len(iids) != len(self._loaded_rows) or not all(i in self._loaded_rows for i in iids):
+            self._render_tree(self.filtered_rows)
+            return
+        self.tree.set_children("", *iids)
 
 
     def toggle_favorite(self):
@@ -270,11 +426,11 @@ class DatabaseInfo(ctk.CTkFrame):
         except Exception:
             new_status = None
         if new_status is not None:
+            # The grid row is patched by the change event
             messagebox.showinfo(
                 "Success",
                 f"Record marked as {'favorite ⭐' if new_status else 'not favorite'}",
             )
-            self.populate_treeview()
         else:
             messagebox.showerror("Error", "Failed to update favorite status.")
 
@@ -346,109 +502,137 @@ class DatabaseInfo(ctk.CTkFrame):
         messagebox.showinfo("Success", "Record copied to clipboard!")
 
     def export_to_excel(self):
-        """Export all records or filtered results to Excel"""
+        """Export the current view (every row, in display order) to Excel in the background"""
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".xlsx",
+            filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")],
+            initialfile="contracts_export.xlsx",
+        )
+        if file_path:
+            self._start_table_export(file_path)
+
+    def _start_table_export(self, file_path):
+        """Write the current view to file_path on a worker thread (format from the extension)"""
+        # The export stack (and openpyxl) loads on first use
+        from exports.table_export import export_records, table_format
 
         try:
-            # Get current data from treeview
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Contracts"
+            table_format(file_path)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
 
-            # Add headers with styling
-            self._add_excel_headers(ws)
+        columns = list(self.title_list)
+        if self.virtual_scroll:
+            # The grid only holds a window; stream the whole view from the database
+            job = (export_records, self.db, file_path,
+                   dict(self._view_filters), self._view_order, columns)
+        else:
+            job = (self._write_loaded_rows, file_path, columns, list(self.filtered_rows))
+
+        self._set_table_export_buttons("disabled")
+        self.status_label.configure(text="⏳ Exporting...", text_color="blue")
+        run_in_background(
+            self,
+            *job,
+            on_progress=self._on_table_job_progress,
+            on_success=lambda count: self._on_table_exported(file_path, count),
+            on_error=self._on_table_export_failed,
+        )
 
-            # Add data from treeview
-            self._add_excel_data(ws)
+    def _write_loaded_rows(self, path, columns, rows, progress):
+        """Worker thread: write the rows already loaded in memory mode"""
+        from exports.table_export import column_lengths, write_table
 
-            # Adjust column widths
-            self._adjust_excel_columns(ws)
+        lengths = column_lengths(columns, rows) if path.lower().endswith(".xlsx") else None
+        batches = (
+            rows[i:i + DB_ITER_BATCH_SIZE] for i in range(0, len(rows), DB_ITER_BATCH_SIZE)
+        )
+        return write_table(path, columns, batches, None, lengths, len(rows), progress)
+
+    def _set_table_export_buttons(self, state):
+        for button in (self.excel_button, self.csv_button):
+            button.configure(state=state)
+
+    def _on_table_job_progress(self, message):
+        """Tk thread: show how far the export (or import) got"""
+        if self.winfo_exists():
+            self.status_label.configure(text=f"⏳ {message}", text_color="blue")
+
+    def _on_table_exported(self, file_path, count):
+        """Tk thread: the export finished"""
+        if self.winfo_exists():
+            self._set_table_export_buttons("normal")
+            self._show_export_status()
+        messagebox.showinfo("Success", f"Exported {count} records to:\n{file_path}")
+
+    def _on_table_export_failed(self, error):
+        """Tk thread: the export failed"""
+        if self.winfo_exists():
+            self._set_table_export_buttons("normal")
+            self._show_export_status()
+        messagebox.showerror("Error", f"Export failed:\n{str(error)}")
+
+    def import_records(self):
+        """Bulk-import contracts from a CSV, JSON Lines or Excel file in the background"""
+        from services.table_import import import_file
+
+        file_path = filedialog.askopenfilename(
+            title="Import contracts",
+            filetypes=[
+                ("Contract files", "*.csv *.csv.gz *.jsonl *.jsonl.gz *.xlsx"),
+                ("All files", "*.*"),
+            ],
+        )
+        if not file_path:
+            return
 
-            # Ask for save location and save
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".xlsx",
-                filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")],
-                initialfile="contracts_export.xlsx",
-            )
+        self.import_button.configure(state="disabled")
+        self.status_label.configure(text="⏳ Importing...", text_color="blue")
+        run_in_background(
+            self,
+            import_file,
+            self.db,
+            file_path,
+            on_progress=self._on_table_job_progress,
+            on_success=self._on_import_finished,
+            on_error=self._on_import_failed,
+        )
 
-            if file_path:
-                wb.save(file_path)
-                messagebox.showinfo("Success", f"Exported to Excel:\n{file_path}")
-        except (IOError, OSError, ValueError) as e:
-            messagebox.showerror("Error", f"Excel export failed:\n{str(e)}")
-
-    def _add_excel_headers(self, ws):
-        """Add headers to Excel worksheet with styling"""
-        headers = self.title_list
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(
-                start_color="366092", end_color="366092", fill_type="solid"
-            )
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-
-    def _add_excel_data(self, ws):
-        """Add treeview data to Excel worksheet"""
-        for row_idx, item in enumerate(self.tree.get_children(), 2):
-            item_data = self.tree.item(item)
-            row_values = list(item_data.get("values", []))
-            for col, value in enumerate(row_values, 1):
-                ws.cell(row=row_idx, column=col, value=value)
-
-    def _adjust_excel_columns(self, ws):
-        """Adjust column widths in Excel worksheet"""
-        for column in ws.columns:
-            max_length = 0
+    def _on_import_finished(self, report):
+        """Tk thread: show the import report (open views reload by themselves)"""
+        if self.winfo_exists():
+            self.import_button.configure(state="normal")
+            self._show_export_status()
+        if not report.rejected:
+            messagebox.showinfo("Import", report.summary())
+            return
+        if not messagebox.askyesno(
+            "Import", report.summary() + "\n\nSave the rejected rows to a CSV file?"
+        ):
+            return
+        path = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv")],
+            initialfile="rejected_rows.csv",
+        )
+        if path:
             try:
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except (AttributeError, TypeError):
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
-            except (AttributeError, TypeError):
-                pass
+                report.save_rejected(path)
+            except OSError as e:
+                messagebox.showerror("Error", f"Could not save rejected rows:\n{str(e)}")
 
-    def apply_advanced_filters(self, filters: dict):
-        def match(r: dict) -> bool:
-            if filters.get("fullname"):
-                if filters["fullname"].lower() not in str(r.get("fullname", "")).lower():
-                    return False
-
-            if filters.get("device_model"):
-                if filters["device_model"].lower() not in str(r.get("Device_Model", "")).lower():
-                    return False
-
-            if filters.get("service_provider"):
-                if filters["service_provider"].lower() not in str(r.get("ServiceMan", "")).lower():
-                    return False
-
-            if filters.get("problem_type"):
-                if filters["problem_type"].lower() not in str(r.get("Device_Problem", "")).lower():
-                    return False
-
-            if filters.get("favorites_only") and not r.get("is_favorite"):
-                return False
-
-            if filters.get("date_from"):
-                try:
-                    if r.get("created_at") < filters["date_from"]:
-                        return False
-                except Exception:
-                    pass
-
-            if filters.get("date_to"):
-                try:
-                    if r.get("created_at") > filters["date_to"]:
-                        return False
-                except Exception:
-                    pass
-
-            return True
+    def _on_import_failed(self, error):
+        """Tk thread: the import stopped (batches committed before the error stay)"""
+        if self.winfo_exists():
+            self.import_button.configure(state="normal")
+            self._show_export_status()
+        messagebox.showerror("Error", f"Import failed:\n{str(error)}")
 
+    def apply_advanced_filters(self, filters: dict):
+        """Show records matching the advanced filters dialog values"""
+        self._cancel_search()
+        self._search_query = ""
         # Determine if any meaningful filter is set
         meaningful = any(
             bool(v)
@@ -459,29 +643,402 @@ class DatabaseInfo(ctk.CTkFrame):
         if not meaningful:
             # No filters: reset to full dataset
             self._filters_active = False
+            self._active_filters = {}
+            if self.virtual_scroll:
+                self._view_filters = {}
+                self._reload_pages()
+                return
             self.filtered_rows = self.rows.copy()
+            self._stream_to_grid = self._loading
             self._render_tree(self.filtered_rows)
             return
 
-        self.filtered_rows = [r for r in self.rows if match(r)]
+        if self.virtual_scroll:
+            self._filters_active = True
+            self._active_filters = dict(filters)
+            self._view_filters = dict(filters)
+            self._reload_pages()
+            return
+
+        # Filtering runs in SQL, so cost follows the result size
+        try:
+            self.filtered_rows = self.db.find(filters)
+        except Exception as e:
+            messagebox.showerror("Error", f"Filtering failed:\n{str(e)}")
+            return
         self._filters_active = True
+        self._active_filters = dict(filters)
+        self._stream_to_grid = False
         self._render_tree(self.filtered_rows)
 
 
     def _render_tree(self, rows: list[dict]):
         self.tree.delete(*self.tree.get_children())
+        self._loaded_rows = {}
+        self._results_query = None
+        self._sorted_as = None
 
         for r in rows:
-            values = [r.get(col, "") for col in self.title_list]
-            self.tree.insert("", "end", values=values)
+            self._insert_row(r, "end")
+
+    def _insert_row(self, row: dict, index):
+        """Insert a record into the grid, keyed by its database id"""
+        iid = str(row.get("id"))
+        values = [row.get(col, "") for col in self.title_list]
+        if iid in self._loaded_rows:
+            # Already added by a change event; just refresh it
+            self.tree.item(iid, values=values)
+        else:
+            self.tree.insert("", index, iid=iid, values=values)
+        self._loaded_rows[iid] = row
 
     def populate_treeview(self):
-        self.rows = self.db.get_all()
-        self.filtered_rows = self.rows.copy()
+        self._cancel_search()
         self._filters_active = False
-        self._render_tree(self.filtered_rows)
+        self._active_filters = {}
+        self._search_query = ""
+
+        if self.virtual_scroll:
+            self._view_filters = {}
+            self._reload_pages()
+            return
+
+        self._load_all_rows()
+
+    # === BACKGROUND LOADING ===
+
+    def _start_load(self) -> tuple:
+        """Cancel any running load; return (generation, cancel event) for a new one"""
+        if self._load_cancel is not None:
+            self._load_cancel.set()
+        self._load_generation += 1
+        self._load_cancel = CancelToken()
+        self._set_loading(True)
+        return self._load_generation, self._load_cancel
+
+    def _finish_load(self, generation) -> bool:
+        """Mark a load as done; False if it was superseded (or the window closed)"""
+        if generation != self._load_generation or not self.winfo_exists():
+            return False
+        self._load_cancel = None
+        self._set_loading(False)
+        return True
+
+    def _set_loading(self, loading: bool, count: int = None):
+        """Show or hide the loading indicator"""
+        self._loading = loading
+        if not loading:
+            self.loading_label.configure(text="")
+        elif count:
+            self.loading_label.configure(text=f"⏳ Loading records... {count}")
+        else:
+            self.loading_label.configure(text="⏳ Loading records...")
+
+    def _load_all_rows(self):
+        """Memory mode: stream every record into the grid from a worker thread"""
+        generation, cancel = self._start_load()
+        self.rows = []
+        self.filtered_rows = []
+        self._sort_cache = {}
+        self._token_index = None
+        self._changes_during_load = []
+        self._stream_to_grid = True
+        self._render_tree([])
+
+        run_in_background(
+            self,
+            self._read_all_rows,
+            cancel,
+            on_progress=lambda batch: self._on_rows_loaded(generation, batch),
+            on_success=lambda index: self._on_all_rows_loaded(generation, index),
+            on_error=lambda e: self._on_load_failed(generation, e),
+        )
+
+    def _read_all_rows(self, cancel, progress):
+        """Worker thread: read all records in batches, then index them (no Tk calls here)"""
+        rows = []
+        batches = self.db.iter_all(SEARCH_LOAD_BATCH_SIZE)
+        try:
+            for batch in batches:
+                if cancel.is_set():
+                    return None
+                rows.extend(batch)
+                progress(batch)
+        finally:
+            batches.close()  # returns the connection to the pool
+
+        index = TokenIndex()
+        index.add_many(rows)
+        return index
+
+    def _on_rows_loaded(self, generation, batch):
+        """Tk thread: append a streamed batch"""
+        if generation != self._load_generation or not self.winfo_exists():
+            return
+        self.rows.extend(batch)
+        self._sort_cache = {}
+        if self._stream_to_grid:
+            self._sorted_as = None
+            self.filtered_rows.extend(batch)
+            for r in batch:
+                self._insert_row(r, "end")
+        self._set_loading(True, len(self.rows))
+
+    def _on_all_rows_loaded(self, generation, index):
+        """Tk thread: every record has arrived (and is indexed)"""
+        if not self._finish_load(generation):
+            return
+        self._stream_to_grid = False
+        self._token_index = index
+        # Re-apply changes made while loading (rows and index catch up)
+        changes, self._changes_during_load = self._changes_during_load, []
+        for event in changes:
+            self._apply_change(event)
+        # A sort chosen while loading only covered the rows loaded so far
+        if self.sort_column != "id" or self.sort_ascending:
+            if self.filtered_rows and len(self.filtered_rows) == len(self.rows):
+                self._sort_filtered_rows()
+                self._reorder_tree()
+                self._sorted_as = (self.sort_column, self.sort_ascending)
+
+    def _on_load_failed(self, generation, error):
+        """Tk thread: the background load failed"""
+        if not self._finish_load(generation):
+            return
+        messagebox.showerror("Error", f"Could not load records:\n{str(error)}")
+
+    def _reload_pages(self):
+        """Clear the grid and load the first page of the current view (in the background)"""
+        self.tree.delete(*self.tree.get_children())
+        self._loaded_rows = {}
+        self._has_more_before = False
+        self._has_more_after = False  # no scroll paging until the first page arrives
+
+        generation, cancel = self._start_load()
+        run_in_background(
+            self,
+            self.db.find,
+            dict(self._view_filters),
+            order_by=self._view_order,
+            limit=SEARCH_PAGE_SIZE,
+            cancel=cancel,
+            on_success=lambda rows: self._on_first_page(generation, rows),
+            on_error=lambda e: self._on_load_failed(generation, e),
+        )
+
+    def _on_first_page(self, generation, rows):
+        """Tk thread: show the first page of a reloaded view"""
+        if not self._finish_load(generation):
+            return
+        self._has_more_after = len(rows) == SEARCH_PAGE_SIZE
+        for r in rows:
+            self._insert_row(r, "end")
+        self._results_query = self._search_query
+        self.tree.yview_moveto(0)
+
+    def _fetch_page(self, after=None, before=None) -> list:
+        """Fetch one page of the current view from the database"""
+        try:
+            return self.db.find(
+                self._view_filters,
+                order_by=self._view_order,
+                limit=SEARCH_PAGE_SIZE,
+                after=after,
+                before=before,
+            )
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not load records:\n{str(e)}")
+            return []
+
+    def _load_next_page(self):
+        """Append the page after the last loaded row, dropping rows far above"""
+        children = self.tree.get_children()
+        after = None
+        if children:
+            after = self.db.keyset_key(
+                self._loaded_rows[children[-1]], self._view_order
+            )
+
+        rows = self._fetch_page(after=after)
+        self._has_more_after = len(rows) == SEARCH_PAGE_SIZE
+        if not rows:
+            return
+
+        top_index = round(self.tree.yview()[0] * len(children))
+        for r in rows:
+            self._insert_row(r, "end")
+
+        children = self.tree.get_children()
+        overflow = len(children) - SEARCH_MAX_LOADED_ROWS
+        if overflow > 0:
+            self._drop_rows(children[:overflow])
+            self._has_more_before = True
+            # Keep the same rows on screen after removing the ones above
+            remaining = len(children) - overflow
+            self.tree.yview_moveto(max(top_index - overflow, 0) / remaining)
+
+    def _load_previous_page(self):
+        """Prepend the page before the first loaded row, dropping rows far below"""
+        children = self.tree.get_children()
+        if not children:
+            return
+
+        before = self.db.keyset_key(self._loaded_rows[children[0]], self._view_order)
+        rows = self._fetch_page(before=before)
+        self._has_more_before = len(rows) == SEARCH_PAGE_SIZE
+        if not rows:
+            return
+
+        top_index = round(self.tree.yview()[0] * len(children))
+        for index, r in enumerate(rows):
+            self._insert_row(r, index)
+
+        children = self.tree.get_children()
+        overflow = len(children) - SEARCH_MAX_LOADED_ROWS
+        if overflow > 0:
+            self._drop_rows(children[-overflow:])
+            self._has_more_after = True
+        self.tree.yview_moveto((top_index + len(rows)) / len(self.tree.get_children()))
+
+    def _drop_rows(self, iids):
+        """Remove rows that scrolled out of the buffer"""
+        for iid in iids:
+            self._loaded_rows.pop(iid, None)
+        self.tree.delete(*iids)
+
+    def _on_tree_scroll(self, first, last):
+        """Scrollbar callback: fetch more pages when nearing either end"""
+        self.scrollbar_y.set(first, last)
+        if not self.virtual_scroll or self._page_request is not None:
+            return
+
+        if float(last) >= 0.9 and self._has_more_after:
+            loader = self._load_next_page
+        elif float(first) <= 0.1 and self._has_more_before:
+            loader = self._load_previous_page
+        else:
+            return
+
+        # Defer: this callback fires while the Treeview is redrawing
+        def run():
+            self._page_request = None
+            loader()
+
+        self._page_request = self.after_idle(run)
+
+    # === CHANGE EVENTS ===
+
+    def _on_record_changed(self, event):
+        """Any thread: hand a repository change event to the Tk thread"""
+        if event.table == self.db.table_name:
+            self._dispatcher.post(self._apply_change, event)
+
+    def _apply_change(self, event):
+        """Tk thread: patch the one affected row instead of reloading"""
+        if not self.winfo_exists():
+            return
+
+        if event.action == RELOAD:
+            self._reload_view()
+            return
+
+        if not self.virtual_scroll and self._loading:
+            self._changes_during_load.append(event)  # replayed once every row is in
+
+        iid = str(event.record_id)
+        row = None
+        if event.action != DELETE:
+            try:
+                row = self.db.get_matching(event.record_id, self._current_view_filters())
+                if not self.virtual_scroll:
+                    self._patch_all_rows(event.record_id, self.db.get_by_id(event.record_id))
+            except Exception as e:
+                print(f"Warning: could not refresh record {event.record_id}: {e}")
+                return
+        elif not self.virtual_scroll:
+            self._patch_all_rows(event.record_id, None)
+
+        if iid in self._loaded_rows:
+            if row is None:
+                # Deleted, or no longer matches the search/filters
+                self._drop_rows([iid])
+            else:
+                self._insert_row(row, "end")  # updates in place
+        elif row is not None:
+            index = self._insertion_index(row)
+            if index is not None:
+                self._insert_row(row, index)
+
+        if not self.virtual_scroll:
+            self.filtered_rows = [self._loaded_rows[i] for i in self.tree.get_children()]
+
+    def _reload_view(self):
+        """Tk thread: reload the grid after a bulk change, keeping search and filters"""
+        if self.virtual_scroll:
+            self._reload_pages()
+            return
+        query = self._search_query
+        filters = dict(self._active_filters) if self._filters_active else None
+        self._load_all_rows()
+        if filters:
+            self.apply_advanced_filters(filters)
+        if query:
+            self.search(query)
+
+    def _patch_all_rows(self, record_id, record):
+        """Memory mode: keep the unfiltered row list (and its index) in sync"""
+        self._sort_cache = {}
+        if self._token_index is not None:
+            self._token_index.remove(record_id)
+            if record is not None:
+                self._token_index.add(record)
+        for index, r in enumerate(self.rows):
+            if r.get("id") == record_id:
+                if record is None:
+                    del self.rows[index]
+                else:
+                    self.rows[index] = record
+                return
+        if record is not None and not self._loading:
+            self.rows.insert(0, record)  # newest first
+
+    def _current_view_filters(self) -> dict:
+        """Filters (incl. search query) that define the rows in the grid"""
+        if self.virtual_scroll:
+            return self._view_filters
+        filters = dict(self._active_filters) if self._filters_active else {}
+        if self._search_query:
+            filters["query"] = self._search_query
+        return filters
+
+    def _insertion_index(self, row: dict):
+        """Grid position of a new row in the current order (None = outside the loaded window)"""
+        if self.virtual_scroll:
+            column, _, direction = self._view_order.partition(" ")
+            descending = direction.upper() == "DESC"
+        else:
+            column, descending = self.sort_column, not self.sort_ascending
+
+        order_key = self._sort_key(column)
+        key = order_key(row)
+        children = self.tree.get_children()
+        index = len(children)
+        for i, iid in enumerate(children):
+            other = order_key(self._loaded_rows[iid])
+            if (other < key) if descending else (other > key):
+                index = i
+                break
+
+        if self.virtual_scroll:
+            # Rows beyond the loaded window arrive with the next page instead
+            if (index == 0 and self._has_more_before) or (
+                index == len(children) and self._has_more_after
+            ):
+                return None
+        return index
 
     def search(self, query: str):
+        """Show records matching the query (within active filters), in the background"""
         # Normalize and tokenize query so multiple words (e.g. model + name)
         q = (query or "").strip().lower()
 
@@ -496,48 +1053,133 @@ class DatabaseInfo(ctk.CTkFrame):
         except Exception:
             pass
 
-        # Ensure rows loaded
-        if not self.rows:
+        if self.virtual_scroll:
+            # Search (within active filters) runs as a paged database query
+            narrow = self._can_narrow(q)
+            self._search_query = q
+            self._view_filters = dict(self._active_filters)
+            if q:
+                self._view_filters["query"] = q
+            if narrow:
+                self._narrow_loaded_rows(q)
+            else:
+                self._reload_pages()
+            return
+
+        # Ensure rows loaded (or loading)
+        if not self.rows and not self._loading:
             self.populate_treeview()
 
-        # Decide base rows: if filters active, search within filtered_rows
-        base_rows = self.filtered_rows if self._filters_active else self.rows
+        narrow = self._can_narrow(q)
+        self._search_query = q
+
+        if q and self._token_index is not None and not self._filters_active and self.db.fts_available:
+            # Every record is loaded and indexed: search in memory, no worker needed
+            self._cancel_search()
+            self.filtered_rows = self._token_index.search(q)
+            self._stream_to_grid = False
+            self._render_tree(self.filtered_rows)
+            self._results_query = q
+            return
+
+        if not q and not self._filters_active:
+            # If query empty, just show all rows
+            self._cancel_search()
+            self.filtered_rows = self.rows.copy()
+            # Keep streaming the rest of the records into the grid
+            self._stream_to_grid = self._loading
+            self._render_tree(self.filtered_rows)
+            return
 
+        generation, cancel = self._start_search()
         if not q:
-            # If query empty, just show base rows
-            self._render_tree(base_rows)
-            return
-
-        tokens = [t for t in q.split() if t]
-        search_columns = [
-            "fullname",
-            "Device_Model",
-            "Device_Serial",
-            "ServiceMan",
-            "Device_Problem",
-            "Description",
-        ]
-
-        def match_row_tokens(row: dict) -> bool:
-            # Require that ALL tokens are found somewhere in the searchable columns (AND semantics)
-            for token in tokens:
-                found = False
-                for col in search_columns:
-                    try:
-                        if token in str(row.get(col, "")).lower():
-                            found = True
-                            break
-                    except Exception:
-                        continue
-                if not found:
-                    return False
-            return True
-
-        results = [r for r in base_rows if match_row_tokens(r)]
+            # Back to the filtered rows
+            self._run_search(generation, cancel, self.db.find, dict(self._active_filters))
+        elif narrow:
+            # The query only grew: filter the current results, no database trip
+            self._run_search(generation, cancel, self._narrow_rows, list(self.filtered_rows), q)
+        elif self._filters_active:
+            # Keep only results that also pass the active filters
+            self._run_search(
+                generation, cancel, self.db.find, dict(self._active_filters, query=q)
+            )
+        else:
+            # Indexed search in the database (all tokens must match)
+            self._run_search(generation, cancel, self.db.search, q)
+
+    def _can_narrow(self, q: str) -> bool:
+        """True if the grid holds every result of the previous query and q refines it"""
+        if self._results_query is None or self._results_query != self._search_query:
+            return False
+        if self.virtual_scroll and (
+            self._loading or self._has_more_before or self._has_more_after
+        ):
+            return False
+        if len(self._loaded_rows) > SEARCH_NARROW_MAX_ROWS:
+            return False  # the index is faster than filtering this many rows
+        return self.db.refines_query(self._results_query, q)
+
+    def _narrow_loaded_rows(self, q: str):
+        """Virtual mode: drop the loaded rows that stop matching (order is kept)"""
+        matches = self.db.query_matcher(q)
+        self._drop_rows(
+            [iid for iid in self.tree.get_children() if not matches(self._loaded_rows[iid])]
+        )
+        self._results_query = q
+
+    def _narrow_rows(self, rows: list, q: str, cancel) -> list:
+        """Worker thread: keep the rows that still match the longer query"""
+        matches = self.db.query_matcher(q)
+        narrowed = []
+        for index, row in enumerate(rows):
+            if index % 1000 == 0 and cancel.is_set():
+                raise QueryCancelled()
+            if matches(row):
+                narrowed.append(row)
+        return narrowed
+
+    def _start_search(self) -> tuple:
+        """Cancel the running search; return (generation, cancel token) for a new one"""
+        self._cancel_search()
+        self._search_cancel = CancelToken()
+        return self._search_generation, self._search_cancel
+
+    def _cancel_search(self):
+        """Stop the running search (if any) and ignore its results"""
+        if self._search_cancel is not None:
+            self._search_cancel.set()  # interrupts its query
+            self._search_cancel = None
+        self._search_generation += 1
+
+    def _run_search(self, generation, cancel, func, *args):
+        """Memory mode: run a search function off the UI thread"""
+        query = self._search_query
+        run_in_background(
+            self,
+            func,
+            *args,
+            cancel=cancel,
+            on_success=lambda rows: self._on_search_results(generation, query, rows),
+            on_error=lambda e: self._on_search_failed(generation, e),
+        )
+
+    def _on_search_results(self, generation, query, rows):
+        """Tk thread: show the results unless a newer search replaced them"""
+        if generation != self._search_generation or not self.winfo_exists():
+            return
+        self._search_cancel = None
         # Update filtered_rows to show search results (but keep filters_active state)
-        self.filtered_rows = results
+        self.filtered_rows = rows
+        self._stream_to_grid = False
         self._render_tree(self.filtered_rows)
+        self._results_query = query
 
+    def _on_search_failed(self, generation, error):
+        """Tk thread: report a failed search (cancelled ones are expected)"""
+        if generation != self._search_generation or isinstance(error, QueryCancelled):
+            return
+        self._search_cancel = None
+        messagebox.showerror("Error", f"Search failed:\n{str(error)}")
 
     def export_selected_contract(self):
         """Export contract for selected record"""
@@ -580,22 +1222,9 @@ class DatabaseInfo(ctk.CTkFrame):
                 )
 
         # Convert record to format expected by form handler
-        # Map database column names to form field names
-        # Handle both 'Description' (DB) and 'description' (form) for compatibility
-        description_value = record.get("Description", "") or record.get(
-            "description", ""
-        )
-        form_data = {
-            "fullname": record.get("fullname", ""),
-            "Device_Model": record.get("Device_Model", ""),
-            "Device_Serial": record.get("Device_Serial", ""),
-            "ServiceMan": record.get("ServiceMan", ""),
-            "Device_Problem": record.get("Device_Problem", ""),
-            "description": description_value,
-            # Pass through the original saved timestamp so exported document
-            # can show the actual save date instead of current time
-            "created_at": record.get("created_at", ""),
-        }
+        from exports.batch_export import record_to_form_data
+
+        form_data = record_to_form_data(record)
 
         # Ask for save location
         file_path = filedialog.asksaveasfilename(
@@ -605,16 +1234,152 @@ class DatabaseInfo(ctk.CTkFrame):
         )
 
         if file_path:
-            try:
-                form_docx_to_pdf_handler([form_data], file_path)
-                messagebox.showinfo(
-                    "Success",
-                    f"Contract exported successfully!\n\nFile saved to:\n{file_path}\n\nData is saved in database.",
-                )
-                # Refresh the treeview to show updated data
-                self.populate_treeview()
-            except (IOError, OSError, ValueError) as e:
-                messagebox.showerror("Error", f"Failed to export contract:\n{str(e)}")
+            # Generate and convert in the background; the grid stays usable
+            self.exports_running += 1
+            self._show_export_status()
+            run_in_background(
+                self,
+                form_docx_to_pdf_handler,
+                [form_data],
+                file_path,
+                on_success=lambda _path: self._on_export_finished(file_path),
+                on_error=self._on_export_failed,
+            )
+
+    def _show_export_status(self):
+        """Show how many contracts are still exporting"""
+        if self.exports_running:
+            self.status_label.configure(
+                text=f"⏳ Exporting {self.exports_running} contract(s)...",
+                text_color="blue",
+            )
+        else:
+            self.status_label.configure(text="")
+
+    def _on_export_finished(self, file_path):
+        """Tk thread: a background contract export succeeded"""
+        self.exports_running -= 1
+        if not self.winfo_exists():
+            return
+        self._show_export_status()
+        messagebox.showinfo(
+            "Success",
+            f"Contract exported successfully!\n\nFile saved to:\n{file_path}\n\nData is saved in database.",
+        )
+
+    def _on_export_failed(self, error):
+        """Tk thread: a background contract export failed"""
+        self.exports_running -= 1
+        if self.winfo_exists():
+            self._show_export_status()
+        messagebox.showerror("Error", f"Failed to export contract:\n{str(error)}")
+
+    def show_export_timings(self):
+        """Show how long the recent exports' stages took; optionally profile the next one"""
+        from exports.timing import profile_next_export, recent_traces
+
+        timings_window = ctk.CTkToplevel(self.parent_window)
+        timings_window.title("Export Timings")
+        timings_window.geometry("640x420")
+        set_icon(timings_window)
+
+        timings_text = ctk.CTkTextbox(
+            timings_window, font=ctk.CTkFont(family="Courier", size=12), wrap="none"
+        )
+        timings_text.pack(fill="both", expand=True, padx=10, pady=10)
+
+        def refresh():
+            traces = recent_traces()
+            timings_text.configure(state="normal")
+            timings_text.delete("1.0", "end")
+            timings_text.insert(
+                "1.0",
+                "\n\n".join(trace.summary() for trace in traces)
+                if traces
+                else "No exports yet in this session.",
+            )
+            timings_text.configure(state="disabled")
+
+        def profile_next():
+            profile_next_export("both")
+            status_label.configure(
+                text="The next export will be profiled (cProfile and memory)."
+            )
+
+        button_row = ctk.CTkFrame(timings_window, fg_color="transparent")
+        button_row.pack(fill="x", padx=10, pady=(0, 10))
+        ctk.CTkButton(button_row, text="🔄 Refresh", command=refresh, width=100).pack(
+            side="left", padx=5
+        )
+        ctk.CTkButton(
+            button_row, text="Profile next export", command=profile_next, width=140
+        ).pack(side="left", padx=5)
+        ctk.CTkButton(
+            button_row, text="Close", command=timings_window.destroy, width=100
+        ).pack(side="right", padx=5)
+        status_label = ctk.CTkLabel(button_row, text="", font=ctk.CTkFont(size=12))
+        status_label.pack(side="left", padx=5)
+        refresh()
+
+    def export_bulk_contracts(self):
+        """Export one contract per selected row (or per row of the current view)"""
+        selection = self.tree.selection()
+        if len(selection) > 1:
+            self._choose_bulk_export_folder([self._loaded_rows[iid] for iid in selection])
+        elif self.virtual_scroll:
+            # The grid only holds a window; load the whole view in the background
+            self.bulk_export_button.configure(state="disabled")
+            self.status_label.configure(text="⏳ Loading records to export...", text_color="blue")
+            run_in_background(
+                self,
+                self.db.find,
+                self._view_filters,
+                order_by=self._view_order,
+                on_success=self._on_bulk_records_loaded,
+                on_error=self._on_bulk_records_failed,
+            )
+        else:
+            self._confirm_bulk_export(
+                [self._loaded_rows[iid] for iid in self.tree.get_children()]
+            )
+
+    def _on_bulk_records_loaded(self, records):
+        """Tk thread: the current view's records are loaded for a bulk export"""
+        if not self.winfo_exists():
+            return
+        self.bulk_export_button.configure(state="normal")
+        self._show_export_status()
+        self._confirm_bulk_export(records)
+
+    def _on_bulk_records_failed(self, error):
+        """Tk thread: loading the records for a bulk export failed"""
+        if self.winfo_exists():
+            self.bulk_export_button.configure(state="normal")
+            self._show_export_status()
+        messagebox.showerror("Error", f"Could not load records:\n{str(error)}")
+
+    def _confirm_bulk_export(self, records):
+        """Ask before exporting every contract in the current view"""
+        if not records:
+            messagebox.showwarning("No Records", "There are no records to export.")
+            return
+        if messagebox.askyesno(
+            "Bulk Export",
+            f"Export all {len(records)} contracts in the current view?\n\n"
+            "(Select several rows with Ctrl/Shift-click to export only those.)",
+        ):
+            self._choose_bulk_export_folder(records)
+
+    def _choose_bulk_export_folder(self, records):
+        """Ask for the target folder, then open the bulk export progress window"""
+        folder = filedialog.askdirectory(title="Choose a folder for the contracts")
+        if not folder:
+            return
+
+        from search_form.bulk_export import BulkExportDialog
+
+        dialog = BulkExportDialog(self.parent_window, records, folder)
+        dialog.grab_set()
 
     def view_selected_details(self):
         """Show detailed view of selected record"""
@@ -1,7 +1,7 @@
 import customtkinter as ctk
 from search_form.database_info import DatabaseInfo
 
-from settings.config import PERSIAN_FONT
+from settings.config import PERSIAN_FONT, SEARCH_DEBOUNCE_MS
 from utils.widget_utils import set_icon
 
 
@@ -64,6 +64,8 @@ class SearchForm(ctk.CTkFrame):
         )
         self.entry.pack(side="left", padx=10, pady=15)
         self.entry.bind("<Return>", lambda e: self.search())  # Search on Enter key
+        # Search as you type, once typing pauses
+        self.entry.bind("<KeyRelease>", self._on_key_release)
 
         self.search_button = ctk.CTkButton(
             self,
@@ -98,6 +100,25 @@ class SearchForm(ctk.CTkFrame):
         self.filter_button.pack(side="left", padx=10, pady=15)
 
         self.filters = {}
+        self._debounce_id = None  # pending after() of a live search
+        self._last_query = ""
+
+    def _on_key_release(self, _event):
+        """Restart the debounce timer when the search text changed"""
+        if self.entry.get() == self._last_query:
+            return  # arrows, modifiers, Enter...
+        if any(self.filters.values()):
+            return  # advanced filters ignore the text; Enter still searches
+        if self._debounce_id is not None:
+            self.after_cancel(self._debounce_id)
+        self._debounce_id = self.after(SEARCH_DEBOUNCE_MS, self.search)
+
+    def _database_frame(self):
+        """Results frame of the SearchMainFrame this form lives in"""
+        host = self.parent_window
+        while host is not None and not hasattr(host, "database_frame"):
+            host = getattr(host, "master", None)
+        return host.database_frame if host is not None else None
 
     def open_advanced_filters(self):
         """Open the advanced filters dialog"""
@@ -106,32 +127,34 @@ class SearchForm(ctk.CTkFrame):
 
     def search(self):
         """Perform search based on entry text and advanced filters"""
+        if self._debounce_id is not None:
+            self.after_cancel(self._debounce_id)
+            self._debounce_id = None
         query = self.entry.get()
-        # Find ancestor that has database_frame (the SearchMainFrame)
-        host = self.parent_window
-        while host is not None and not hasattr(host, "database_frame"):
-            host = getattr(host, "master", None)
+        self._last_query = query
+        database_frame = self._database_frame()
 
         # If advanced filters are set, prefer them (filters override simple query)
         if hasattr(self, "filters") and any(self.filters.values()):
-            if host is not None and hasattr(host, "database_frame"):
-                host.database_frame.apply_advanced_filters(self.filters)
+            if database_frame is not None:
+                database_frame.apply_advanced_filters(self.filters)
         else:
-            if host is not None and hasattr(host, "database_frame"):
-                host.database_frame.search(query)
-        print("Searching for:", query)
+            if database_frame is not None:
+                # Returns at once; results arrive from a worker thread
+                database_frame.search(query)
 
     def clear_search(self):
         """Clear search entry and reset filters"""
+        if self._debounce_id is not None:
+            self.after_cancel(self._debounce_id)
+            self._debounce_id = None
         self.entry.delete(0, "end")
+        self._last_query = ""
         self.filters = {}
-        # Find ancestor that has database_frame and reset it
-        host = self.parent_window
-        while host is not None and not hasattr(host, "database_frame"):
-            host = getattr(host, "master", None)
 
-        if host is not None and hasattr(host, "database_frame"):
-            host.database_frame.populate_treeview()
+        database_frame = self._database_frame()
+        if database_frame is not None:
+            database_frame.populate_treeview()
 
 
 class OpenFiltersDialog(ctk.CTkToplevel):
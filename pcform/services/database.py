@@ -1,8 +1,324 @@
+import atexit
+import os
 import sqlite3
-from contextlib import contextmanager
-from typing import Generator
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Deque, Dict, Generator, Optional, Set, Tuple
 
-from settings.config import PCFORM_DB_PATH
+from settings.config import (
+    DB_POOL_IDLE_TIMEOUT,
+    DB_POOL_MAX_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_PRAGMA_PROFILE,
+    DB_PRAGMA_PROFILES,
+    PCFORM_DB_PATH,
+)
+
+# Pragmas that may be set from a profile (names are interpolated into SQL)
+ALLOWED_PRAGMAS = (
+    "busy_timeout",
+    "journal_mode",
+    "synchronous",
+    "cache_size",
+    "mmap_size",
+    "temp_store",
+    "foreign_keys",
+    "wal_autocheckpoint",
+)
+
+
+def get_pragma_profile(name: str = None) -> Dict[str, Any]:
+    """Return the pragma settings for a profile (default: DB_PRAGMA_PROFILE)."""
+    name = name or DB_PRAGMA_PROFILE
+    try:
+        return DB_PRAGMA_PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown pragma profile '{name}'. "
+            f"Choose one of: {', '.join(DB_PRAGMA_PROFILES)}"
+        ) from None
+
+
+def apply_pragmas(conn: sqlite3.Connection, pragmas: Dict[str, Any]) -> None:
+    """Apply pragma settings to a connection, busy_timeout first."""
+    # A busy timeout must be in place before journal_mode, which needs a lock
+    for name in sorted(pragmas, key=lambda n: n != "busy_timeout"):
+        if name not in ALLOWED_PRAGMAS:
+            raise ValueError(f"Pragma '{name}' is not allowed in a profile")
+        value = pragmas[name]
+        if not isinstance(value, int) and not str(value).isalnum():
+            raise ValueError(f"Invalid value for pragma '{name}': {value!r}")
+        conn.execute(f"PRAGMA {name} = {value}")
+
+
+def open_connection(db_path: str, pragmas: Dict[str, Any] = None) -> sqlite3.Connection:
+    """Open a configured SQLite connection (shared by the pool and manual use)."""
+    # Pooled connections are handed from thread to thread, but only ever
+    # used by one borrower at a time, so the same-thread check is disabled.
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn.row_factory = sqlite3.Row  # Access columns by name
+    try:
+        apply_pragmas(conn, get_pragma_profile() if pragmas is None else pragmas)
+    except Exception:
+        conn.close()
+        raise
+    return conn
+
+
+class ConnectionPool:
+    """
+    Bounded, thread-safe pool of long-lived SQLite connections.
+
+    Connections are opened lazily up to ``max_size``. A borrowed connection
+    has a single user, on any thread, until it is released; idle connections
+    are health-checked before reuse and closed after ``idle_timeout`` seconds.
+    The pragma profile is applied once per connection when it is opened.
+
+    Usage:
+        pool = get_pool()
+        conn = pool.acquire()
+        try:
+            conn.execute("SELECT 1")
+        finally:
+            pool.release(conn)
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        max_size: int = DB_POOL_MAX_SIZE,
+        timeout: float = DB_POOL_TIMEOUT,
+        idle_timeout: float = DB_POOL_IDLE_TIMEOUT,
+        pragmas: Dict[str, Any] = None,
+    ):
+        if max_size < 1:
+            raise ValueError("Pool size must be at least 1")
+
+        self.db_path = db_path
+        self.max_size = max_size
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        # Applied once when a connection is opened, not on every checkout
+        self.pragmas = get_pragma_profile() if pragmas is None else pragmas
+
+        # (connection, released_at) pairs, most recently released last
+        self._idle: Deque[Tuple[sqlite3.Connection, float]] = deque()
+        # id() of every borrowed connection
+        self._borrowed: Set[int] = set()
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    @property
+    def size(self) -> int:
+        """Number of open connections (idle + borrowed)."""
+        return self._size
+
+    @property
+    def idle_count(self) -> int:
+        """Number of connections waiting to be borrowed."""
+        return len(self._idle)
+
+    def acquire(self) -> sqlite3.Connection:
+        """
+        Borrow a connection, waiting up to ``timeout`` seconds for one.
+
+        Raises:
+            TimeoutError: if every connection stays borrowed for too long
+        """
+        deadline = time.monotonic() + self.timeout
+        conn = None
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise sqlite3.ProgrammingError("Connection pool is closed.")
+
+                self._evict_idle()
+
+                if self._idle:
+                    # LIFO: reuse the warmest connection
+                    conn = self._idle.pop()[0]
+                    break
+
+                if self._size < self.max_size:
+                    # Reserve a slot; the connection is opened outside the lock
+                    self._size += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"No database connection available within {self.timeout}s."
+                    )
+                self._cond.wait(remaining)
+
+        if conn is not None and not self._is_healthy(conn):
+            self._close_quietly(conn)
+            conn = None
+
+        if conn is None:
+            try:
+                conn = open_connection(self.db_path, self.pragmas)
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                raise
+
+        with self._cond:
+            self._borrowed.add(id(conn))
+        return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Return a borrowed connection to the pool."""
+        with self._cond:
+            if id(conn) not in self._borrowed:
+                raise ValueError("Connection was not borrowed from this pool.")
+            self._borrowed.remove(id(conn))
+
+        # Never hand out a connection with a half-finished transaction
+        healthy = True
+        if conn.in_transaction:
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                healthy = False
+
+        with self._cond:
+            if self._closed or not healthy:
+                self._size -= 1
+                self._close_quietly(conn)
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self) -> Generator[sqlite3.Connection, None, None]:
+        """Borrow a connection for the duration of a ``with`` block."""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self) -> None:
+        """Close idle connections; borrowed ones are closed on release."""
+        with self._cond:
+            self._closed = True
+            while self._idle:
+                self._close_quietly(self._idle.pop()[0])
+                self._size -= 1
+            self._cond.notify_all()
+
+    def _evict_idle(self) -> None:
+        """Close connections idle for longer than ``idle_timeout`` (lock held)."""
+        cutoff = time.monotonic() - self.idle_timeout
+        while self._idle and self._idle[0][1] < cutoff:
+            self._close_quietly(self._idle.popleft()[0])
+            self._size -= 1
+
+    @staticmethod
+    def _is_healthy(conn: sqlite3.Connection) -> bool:
+        """Cheap liveness probe run before reusing an idle connection."""
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    @staticmethod
+    def _close_quietly(conn: sqlite3.Connection) -> None:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+
+class QueryCancelled(Exception):
+    """Raised when a query is stopped through its CancelToken."""
+
+
+class CancelToken:
+    """
+    Cancellation flag that also interrupts the query running under it.
+
+    Works like a ``threading.Event`` (``set``/``is_set``), so loops can poll
+    it; queries executed with the token (see ``cancellable``) are aborted
+    with ``sqlite3.Connection.interrupt`` as soon as it is set, from any
+    thread, and raise QueryCancelled.
+
+    Usage:
+        cancel = CancelToken()
+        rows = repo.search("dell", cancel=cancel)  # worker thread
+        cancel.set()  # UI thread: a newer search replaced this one
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def set(self) -> None:
+        with self._lock:
+            self._event.set()
+            if self._conn is not None:
+                self._conn.interrupt()
+
+    def is_set(self) -> bool:
+        return self._event.is_set()
+
+    @contextmanager
+    def watch(self, conn: sqlite3.Connection) -> Generator[None, None, None]:
+        """Make ``conn`` interruptible by this token for the ``with`` block."""
+        with self._lock:
+            if self._event.is_set():
+                raise QueryCancelled()
+            self._conn = conn
+        try:
+            yield
+        except sqlite3.OperationalError as e:
+            if self._event.is_set():
+                raise QueryCancelled() from e  # "interrupted"
+            raise
+        finally:
+            # Detach before the connection goes back to the pool, so a late
+            # set() can't interrupt another borrower's query
+            with self._lock:
+                self._conn = None
+
+
+def cancellable(conn: sqlite3.Connection, cancel: Optional[CancelToken]) -> ContextManager:
+    """``cancel.watch(conn)``, or a no-op context when there is no token."""
+    return cancel.watch(conn) if cancel is not None else nullcontext()
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: str = None) -> ConnectionPool:
+    """Return the process-wide pool for a database file, creating it once."""
+    key = os.path.abspath(db_path or str(PCFORM_DB_PATH))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ConnectionPool(key)
+        return pool
+
+
+def close_all_pools() -> None:
+    """Close every pool (registered to run at interpreter exit)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_all_pools)
 
 
 class DatabaseConnection:
@@ -14,9 +330,9 @@ class DatabaseConnection:
         with DatabaseConnection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM users")
-        # Connection auto-closed!
+        # Connection returned to the pool!
 
-        # Option 2: Manual (not recommended)
+        # Option 2: Manual (not recommended, bypasses the pool)
         db = DatabaseConnection()
         conn = db.connect()
         # ... do stuff ...
@@ -26,43 +342,47 @@ class DatabaseConnection:
     def __init__(self, db_path: str = None):
         self.db_path = db_path or str(PCFORM_DB_PATH)
         self._connection = None
+        self._pool = None
 
     def connect(self) -> sqlite3.Connection:
-        """Create new database connection."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Access columns by name
-        return conn
+        """Create new, unpooled database connection."""
+        return open_connection(self.db_path)
 
     def __enter__(self) -> sqlite3.Connection:
         """Called when entering 'with' block."""
-        self._connection = self.connect()
+        self._pool = get_pool(self.db_path)
+        self._connection = self._pool.acquire()
         return self._connection
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Called when exiting 'with' block (even if error!)."""
         if self._connection:
-            if exc_type is None:
-                # No error, commit changes
-                self._connection.commit()
-            else:
-                # Error occurred, rollback changes
-                self._connection.rollback()
-            self._connection.close()
-            self._connection = None
+            try:
+                if exc_type is None:
+                    # No error, commit changes
+                    self._connection.commit()
+                else:
+                    # Error occurred, rollback changes
+                    self._connection.rollback()
+            finally:
+                self._pool.release(self._connection)
+                self._connection = None
 
 
 @contextmanager
-def get_db_connection() -> Generator[sqlite3.Connection, None, None]:
+def get_db_connection(db_path: str = None) -> Generator[sqlite3.Connection, None, None]:
     """
     Function-based context manager for database connections.
 
+    Borrows a warm connection from the pool instead of opening a new one.
+
     Usage:
         with get_db_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(...)
     """
-    conn = sqlite3.connect(str(PCFORM_DB_PATH))
-    conn.row_factory = sqlite3.Row
+    pool = get_pool(db_path)
+    conn = pool.acquire()
     try:
         yield conn
         conn.commit()
@@ -70,4 +390,4 @@ def get_db_connection() -> Generator[sqlite3.Connection, None, None]:
         conn.rollback()
         raise
     finally:
-        conn.close()
+        pool.release(conn)
@@ -0,0 +1,63 @@
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+# Change actions
+INSERT = "insert"
+UPDATE = "update"
+DELETE = "delete"
+RELOAD = "reload"  # Many records changed at once (bulk import); views reload
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """A committed change to one record."""
+
+    table: str
+    action: str  # INSERT, UPDATE, DELETE or RELOAD
+    record_id: Optional[int]  # None for RELOAD
+    changes: Optional[Dict[str, Any]] = None  # New column values (updates)
+
+
+class EventBus:
+    """
+    Minimal thread-safe publish/subscribe for change events.
+
+    Subscribers are called synchronously on the publishing thread, which can
+    be a worker thread; UI subscribers must hand the event to the Tk thread.
+
+    Usage:
+        unsubscribe = change_events.subscribe(on_change)
+        ...
+        unsubscribe()
+    """
+
+    def __init__(self):
+        self._subscribers: List[Callable[[ChangeEvent], None]] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: Callable[[ChangeEvent], None]) -> Callable[[], None]:
+        """Register a callback; returns a function that unregisters it."""
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe():
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def publish(self, event: ChangeEvent) -> None:
+        """Deliver an event to every subscriber (after the change is committed)."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"Warning: change event subscriber failed: {e}")
+
+
+# Process-wide bus for record changes made through the repositories
+change_events = EventBus()
@@ -0,0 +1,290 @@
+import json
+import re
+import sqlite3
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Deque, Dict, Generator, List, Optional
+
+from settings.config import (
+    QUERY_STATS_ENABLED,
+    QUERY_STATS_WINDOW,
+    SLOW_QUERY_EXPLAIN,
+    SLOW_QUERY_LOG_PATH,
+    SLOW_QUERY_MS,
+)
+
+# Upper bounds (ms) of the latency histogram buckets; the last one is open
+HISTOGRAM_BUCKETS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000)
+# Distinct statements tracked; later new ones are counted under OTHER
+MAX_FINGERPRINTS = 500
+OTHER = "(other statements)"
+
+_WHITESPACE = re.compile(r"\s+")
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+# A plan step reading a whole table ("SCAN pcform", not "... USING INDEX")
+_FULL_SCAN = re.compile(r"^SCAN \w+$")
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(sql: str) -> str:
+    """
+    Statement shape with literals and placeholder lists collapsed.
+
+    Usage:
+        fingerprint("SELECT * FROM pcform WHERE id IN (?, ?, ?) LIMIT 50")
+        # -> "SELECT * FROM pcform WHERE id IN (?, ...) LIMIT ?"
+    """
+    text = _LITERALS.sub("?", _WHITESPACE.sub(" ", sql).strip())
+    return _PLACEHOLDER_LISTS.sub("(?, ...)", text)
+
+
+class QueryTrace:
+    """Measurements for one statement, filled in while it runs (see track_query)."""
+
+    __slots__ = ("rows", "_paused")
+
+    def __init__(self):
+        self.rows = 0
+        self._paused = 0.0
+
+    @contextmanager
+    def paused(self) -> Generator[None, None, None]:
+        """Leave time spent outside the statement (e.g. a generator's consumer) uncounted."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._paused += time.perf_counter() - start
+
+
+class QueryStats:
+    """
+    Per-statement timings for everything the repositories run.
+
+    Statements are grouped by fingerprint (count, total/max time, rows,
+    parameters, connection wait); the latest ``window`` durations feed a
+    rolling latency histogram. Statements slower than ``slow_ms`` are
+    written to the slow-query log, with their EXPLAIN QUERY PLAN when
+    ``explain`` is set (captured once per statement shape).
+
+    Usage:
+        print(query_stats.summary())
+        for entry in query_stats.snapshot()["statements"]:
+            ...
+    """
+
+    def __init__(
+        self,
+        window: int = QUERY_STATS_WINDOW,
+        slow_ms: Optional[float] = SLOW_QUERY_MS,
+        explain: bool = SLOW_QUERY_EXPLAIN,
+        log_path: Optional[str] = SLOW_QUERY_LOG_PATH,
+        enabled: bool = QUERY_STATS_ENABLED,
+    ):
+        self.enabled = enabled
+        self.slow_ms = slow_ms
+        self.explain = explain
+        self.log_path = log_path
+        self._statements: Dict[str, Dict[str, Any]] = {}
+        self._recent: Deque[float] = deque(maxlen=window)
+        self._plans: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+        self._log_lock = threading.Lock()
+
+    def record(
+        self,
+        sql: str,
+        params: int,
+        rows: int,
+        seconds: float,
+        wait: float = 0.0,
+        failed: bool = False,
+        conn: Optional[sqlite3.Connection] = None,
+        values: tuple = (),
+        log_slow: bool = True,
+    ) -> None:
+        """
+        Add one statement's measurements.
+
+        ``conn`` and ``values`` are only used to explain a slow statement,
+        on the connection that ran it.
+        """
+        key = fingerprint(sql)
+        ms = seconds * 1000
+        with self._lock:
+            stats = self._statements.get(key)
+            if stats is None:
+                if len(self._statements) >= MAX_FINGERPRINTS:
+                    key = OTHER
+                stats = self._statements.setdefault(
+                    key,
+                    {"count": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0,
+                     "wait_ms": 0.0, "rows": 0, "params": params},
+                )
+            stats["count"] += 1
+            stats["errors"] += failed
+            stats["total_ms"] += ms
+            stats["wait_ms"] += wait * 1000
+            stats["rows"] += rows
+            if ms > stats["max_ms"]:
+                stats["max_ms"] = ms
+            self._recent.append(ms)
+
+        if log_slow and self.slow_ms is not None and ms >= self.slow_ms and not failed:
+            plan = self._plan(key, sql, values, conn) if self.explain else None
+            self._log_slow(key, ms, wait * 1000, rows, params, plan)
+
+    def _plan(
+        self, key: str, sql: str, values: tuple, conn: Optional[sqlite3.Connection]
+    ) -> Optional[List[str]]:
+        """EXPLAIN QUERY PLAN steps for a statement shape (run once per shape)."""
+        if key in self._plans or conn is None:
+            return self._plans.get(key)
+        try:
+            steps = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", values)]
+        except sqlite3.Error as e:
+            steps = [f"(no plan: {e})"]
+        self._plans[key] = steps
+        return steps
+
+    def _log_slow(self, key, ms, wait_ms, rows, params, plan) -> None:
+        entry = {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "ms": round(ms, 2),
+            "wait_ms": round(wait_ms, 2),
+            "rows": rows,
+            "params": params,
+            "sql": key,
+        }
+        if plan is not None:
+            entry["plan"] = plan
+            entry["full_scan"] = any(_FULL_SCAN.match(step) for step in plan)
+
+        if self.log_path is None:
+            print(f"Warning: slow query ({ms:.0f} ms, {rows} rows): {key}")
+            for step in plan or ():
+                print(f"    {step}")
+            return
+        try:
+            with self._log_lock, open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except OSError as e:
+            print(f"Warning: could not write the slow-query log: {e}")
+
+    def histogram(self) -> List[tuple]:
+        """(upper bound in ms or None, count) over the recent statements."""
+        counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        with self._lock:
+            recent = list(self._recent)
+        for ms in recent:
+            counts[bisect_left(HISTOGRAM_BUCKETS_MS, ms)] += 1
+        return list(zip(HISTOGRAM_BUCKETS_MS + (None,), counts))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Statements (slowest total first), recent percentiles and the histogram."""
+        with self._lock:
+            statements = [
+                {"sql": key, **stats, "plan": self._plans.get(key)}
+                for key, stats in self._statements.items()
+            ]
+            recent = sorted(self._recent)
+        statements.sort(key=lambda s: s["total_ms"], reverse=True)
+        for s in statements:
+            s["mean_ms"] = s["total_ms"] / s["count"]
+        percentiles = {
+            f"p{p}_ms": recent[min(len(recent) - 1, len(recent) * p // 100)] if recent else None
+            for p in (50, 95, 99)
+        }
+        return {
+            "statements": statements,
+            "recent": {"count": len(recent), **percentiles},
+            "histogram": [
+                {"le_ms": bound, "count": count} for bound, count in self.histogram()
+            ],
+        }
+
+    def summary(self, limit: int = 10) -> str:
+        """Readable report of the slowest statements and the latency histogram."""
+        snapshot = self.snapshot()
+        lines = [f"{'calls':>7} {'total ms':>10} {'mean ms':>9} {'max ms':>9} {'rows':>9}  statement"]
+        for s in snapshot["statements"][:limit]:
+            lines.append(
+                f"{s['count']:>7} {s['total_ms']:>10.1f} {s['mean_ms']:>9.2f} "
+                f"{s['max_ms']:>9.2f} {s['rows']:>9}  {s['sql'][:100]}"
+            )
+        recent = snapshot["recent"]
+        if recent["count"]:
+            lines.append(
+                f"\nLast {recent['count']} statements: p50 {recent['p50_ms']:.2f} ms, "
+                f"p95 {recent['p95_ms']:.2f} ms, p99 {recent['p99_ms']:.2f} ms"
+            )
+            for bucket in snapshot["histogram"]:
+                bound = f"<= {bucket['le_ms']:g} ms" if bucket["le_ms"] else "slower"
+                lines.append(f"  {bound:>12} {bucket['count']:>7}")
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._statements.clear()
+            self._recent.clear()
+            self._plans.clear()
+
+
+# Process-wide statistics, fed by the repositories
+query_stats = QueryStats()
+
+
+@contextmanager
+def track_query(
+    conn: sqlite3.Connection,
+    sql: str,
+    params: Any = (),
+    requested: float = None,
+    log_slow: bool = True,
+) -> Generator[QueryTrace, None, None]:
+    """
+    Time a statement run on ``conn`` and record it in ``query_stats``.
+
+    Set ``trace.rows`` to the rows returned (or written). ``requested`` is
+    the perf_counter time the connection was asked for, so the wait for a
+    pooled connection is recorded too. Bulk statements that are slow by
+    design pass ``log_slow=False`` to stay out of the slow-query log.
+
+    Usage:
+        requested = time.perf_counter()
+        with get_db_connection() as conn, track_query(conn, sql, params, requested) as trace:
+            rows = conn.execute(sql, params).fetchall()
+            trace.rows = len(rows)
+    """
+    trace = QueryTrace()
+    if not query_stats.enabled:
+        yield trace
+        return
+    start = time.perf_counter()
+    failed = True
+    try:
+        yield trace
+        failed = False
+    except GeneratorExit:
+        failed = False  # a streamed query (BaseRepository._iter) closed early
+        raise
+    finally:
+        elapsed = time.perf_counter() - start - trace._paused
+        values = params if isinstance(params, (tuple, list, dict)) else ()
+        query_stats.record(
+            sql,
+            len(values),
+            trace.rows,
+            elapsed,
+            start - requested if requested is not None else 0.0,
+            failed,
+            conn,
+            values,
+            log_slow,
+        )
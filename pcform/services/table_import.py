@@ -0,0 +1,295 @@
+import csv
+import gzip
+import io
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from settings.config import IMPORT_BATCH_SIZE
+
+# Columns a file may provide (ids are always assigned by the database)
+IMPORT_COLUMNS = [
+    "fullname",
+    "Device_Model",
+    "Device_Serial",
+    "ServiceMan",
+    "Device_Problem",
+    "Description",
+    "created_at",
+    "is_favorite",
+]
+TEXT_COLUMNS = IMPORT_COLUMNS[:6]
+IGNORED_COLUMNS = {"id"}
+# Lowercase header -> column (headers match case-insensitively)
+_COLUMN_NAMES = {column.lower(): column for column in IMPORT_COLUMNS}
+
+# Accepted created_at formats; stored as "YYYY-MM-DD HH:MM:SS" like the app writes
+DATE_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d")
+STORED_DATE = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+FAVORITE_VALUES = {"1": 1, "0": 0, "true": 1, "false": 0, "yes": 1, "no": 0}
+
+IMPORT_EXTENSIONS = (".csv", ".csv.gz", ".jsonl", ".jsonl.gz", ".xlsx")
+
+
+@dataclass
+class RejectedRow:
+    """A row of the import file that was not imported."""
+
+    row_number: int  # Line (CSV/JSONL) or sheet row (XLSX), header = 1 for tables
+    reason: str
+    record: Any = None
+
+
+@dataclass
+class ImportReport:
+    """Outcome of importing one file."""
+
+    path: str
+    total: int = 0
+    imported: int = 0
+    rejected: List[RejectedRow] = field(default_factory=list)
+    ignored_columns: Set[str] = field(default_factory=set)
+    seconds: float = 0.0
+
+    def summary(self, max_errors: int = 10) -> str:
+        text = f"{self.imported} of {self.total} records imported in {self.seconds:.1f}s"
+        if self.ignored_columns:
+            text += f"\nIgnored columns: {', '.join(sorted(self.ignored_columns))}"
+        if self.rejected:
+            text += f"\n{len(self.rejected)} rejected:"
+            for row in self.rejected[:max_errors]:
+                text += f"\n  row {row.row_number}: {row.reason}"
+            if len(self.rejected) > max_errors:
+                text += f"\n  ... and {len(self.rejected) - max_errors} more"
+        return text
+
+    def save_rejected(self, path: str) -> None:
+        """
+        Write the rejected rows (row number, reason, original values) to a CSV file.
+
+        Values past the end of a CSV header (csv.DictReader's ``None`` key)
+        go to a final "extra" column.
+        """
+        keys: List[str] = []
+        extra = False
+        for row in self.rejected:
+            if isinstance(row.record, dict):
+                keys.extend(k for k in row.record if k is not None and k not in keys)
+                extra = extra or None in row.record
+        with open(path, "w", newline="", encoding="utf-8-sig") as stream:
+            writer = csv.writer(stream)
+            writer.writerow(["row", "reason"] + keys + (["extra"] if extra else []))
+            for row in self.rejected:
+                record = row.record if isinstance(row.record, dict) else {}
+                values = [row.row_number, row.reason] + [record.get(k) for k in keys]
+                if extra:
+                    values.append(", ".join(str(v) for v in record.get(None) or ()))
+                writer.writerow(values)
+
+
+def import_file(
+    repo,
+    path: str,
+    batch_size: int = IMPORT_BATCH_SIZE,
+    progress: Optional[Callable[[str], None]] = None,
+) -> ImportReport:
+    """
+    Import contracts from a CSV, JSON Lines or Excel file.
+
+    The file is read as a stream and every row checked against the record
+    columns; valid rows go to PCFormRepository.insert_many in batches,
+    invalid ones are listed in the report instead of stopping the import.
+
+    Args:
+        repo: PCFormRepository to insert into
+        path: .csv, .jsonl or .xlsx file (.csv.gz / .jsonl.gz compressed);
+            the first row (or every JSON object) names the columns
+        batch_size: Records per transaction
+        progress: Called with a status message after each batch
+
+    Returns:
+        ImportReport with counts and rejected rows
+
+    Usage:
+        report = import_file(PCFormRepository(), "legacy.xlsx")
+        print(report.summary())
+    """
+    report = ImportReport(path)
+    start = time.perf_counter()
+
+    def valid_records():
+        for row_number, record in read_rows(path):
+            report.total += 1
+            clean, error = clean_record(record, report.ignored_columns)
+            if error:
+                report.rejected.append(RejectedRow(row_number, error, record))
+            else:
+                yield clean
+
+    def batch_done(inserted):
+        if progress is not None:
+            progress(f"Imported {inserted} records ({len(report.rejected)} rejected)")
+
+    try:
+        report.imported = repo.insert_many(valid_records(), batch_size, batch_done)
+    finally:
+        report.seconds = time.perf_counter() - start
+    return report
+
+
+def read_rows(path: str) -> Iterator[Tuple[int, Any]]:
+    """
+    Yield (row number, record dict) for each data row of an import file.
+
+    A row that can't be parsed (e.g. broken JSON) is yielded as the
+    ValueError describing it, so the import can report it and go on.
+    """
+    name = path.lower()
+    if name.endswith(".xlsx"):
+        yield from _read_xlsx(path)
+    elif name.endswith((".csv", ".csv.gz")):
+        with _open_text(path) as stream:
+            reader = csv.DictReader(stream)
+            for record in reader:
+                yield reader.line_num, record
+    elif name.endswith((".jsonl", ".jsonl.gz")):
+        with _open_text(path) as stream:
+            for line_number, line in enumerate(stream, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield line_number, json.loads(line)
+                except ValueError as e:
+                    yield line_number, ValueError(f"invalid JSON ({e})")
+    else:
+        raise ValueError(
+            f"Unsupported import file type (use {', '.join(IMPORT_EXTENSIONS)}): {path}"
+        )
+
+
+def clean_record(record: Any, ignored_columns: Optional[Set[str]] = None) -> tuple:
+    """
+    Validate one imported row and convert it to record columns.
+
+    Column names match IMPORT_COLUMNS case-insensitively; other names are
+    skipped (and added to ``ignored_columns``).
+
+    Returns:
+        (record dict, None) when valid, otherwise (None, reason)
+    """
+    if isinstance(record, Exception):
+        return None, str(record)
+    if not isinstance(record, dict):
+        return None, "not a record (expected an object with column names)"
+
+    columns, ignored = _map_columns(tuple(record))
+    if ignored and ignored_columns is not None:
+        ignored_columns.update(ignored)
+    if any(v not in (None, "") for v in record.get(None) or ()):
+        return None, "more values than columns"  # CSV row longer than the header
+
+    clean: Dict[str, Any] = {}
+    for key, column in columns:
+        value = record[key]
+        if column == "created_at":
+            value = _parse_date(value)
+            if value is False:
+                return None, f"invalid created_at: {record[key]!r} (use YYYY-MM-DD [HH:MM:SS])"
+        elif column == "is_favorite":
+            value = _parse_favorite(value)
+            if value is False:
+                return None, f"invalid is_favorite: {record[key]!r} (use 0/1)"
+        else:
+            value = _text(value)
+        clean[column] = value
+
+    if not any(clean.get(column) for column in TEXT_COLUMNS):
+        return None, "no contract data (empty row or no known columns)"
+    return clean, None
+
+
+@lru_cache(maxsize=64)
+def _map_columns(keys: tuple) -> tuple:
+    """(key, column) pairs and ignored keys for a row's keys (files repeat them)"""
+    columns, ignored = [], []
+    for key in keys:
+        if key is None:
+            continue  # csv.DictReader's extra values
+        column = _COLUMN_NAMES.get(str(key).strip().lower())
+        if column is not None:
+            columns.append((key, column))
+        elif str(key).strip().lower() not in IGNORED_COLUMNS:
+            ignored.append(str(key))
+    return tuple(columns), tuple(ignored)
+
+
+def _text(value: Any) -> Optional[str]:
+    """Text column value: stripped string, None when empty"""
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)  # spreadsheet numbers, e.g. serials
+    text = str(value).strip()
+    return text or None
+
+
+def _parse_date(value: Any):
+    """created_at as "YYYY-MM-DD HH:MM:SS"; None if empty, False if invalid"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value.strftime(DATE_FORMATS[0])
+    if isinstance(value, date):
+        return value.strftime("%Y-%m-%d 00:00:00")
+    text = str(value).strip()
+    if STORED_DATE.fullmatch(text):
+        try:
+            datetime.fromisoformat(text)  # fast path: already in the stored format
+            return text
+        except ValueError:
+            return False
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).strftime(DATE_FORMATS[0])
+        except ValueError:
+            continue
+    return False
+
+
+def _parse_favorite(value: Any):
+    """is_favorite as 0/1; None if empty, False if invalid"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (bool, int, float)) and value in (0, 1):
+        return int(value)
+    return FAVORITE_VALUES.get(str(value).strip().lower(), False)
+
+
+def _open_text(path: str):
+    """Open a UTF-8 text file (a BOM is skipped), gunzipping .gz files"""
+    if path.lower().endswith(".gz"):
+        return io.TextIOWrapper(gzip.open(path, "rb"), encoding="utf-8-sig", newline="")
+    return open(path, encoding="utf-8-sig", newline="")
+
+
+def _read_xlsx(path: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Rows of the first sheet as dicts keyed by the header row (streamed)"""
+    from openpyxl import load_workbook  # only needed for Excel files
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        header = [str(h).strip() if h is not None else None for h in header]
+        for row_number, values in enumerate(rows, 2):
+            if all(v is None for v in values):
+                continue
+            yield row_number, {h: v for h, v in zip(header, values) if h is not None}
+    finally:
+        wb.close()
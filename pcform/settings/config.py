@@ -1,4 +1,5 @@
 import os
+import sys
 import ctypes
 
 
@@ -21,6 +22,48 @@ PDF_TERMS_AND_CONDITIONS = """Terms & Conditions:
 - Payment due upon completion
 - 30-day warranty on parts"""
 
+# PDF export backend:
+#   "native" - render PDFs directly in Python (needs reportlab, plus
+#              arabic-reshaper and python-bidi for Persian text); runs headless
+#   "word"   - build a DOCX and convert it with Microsoft Word (Windows only)
+#   "auto"   - "native" when reportlab is installed, otherwise "word"
+PDF_BACKEND = "auto"
+# TrueType fonts for native PDFs (None = auto-detect PERSIAN_FONT, then DejaVu Sans)
+PDF_FONT_PATH = None
+PDF_BOLD_FONT_PATH = None
+
+# DOCX -> PDF converter used by the "word" backend. One engine instance is
+# started on first use, reused for every conversion and closed at exit.
+#   "word"        - Microsoft Word over COM (Windows only)
+#   "libreoffice" - LibreOffice running headless
+#   "standin"     - plain-text rendering with reportlab, no office suite needed
+#   "auto"        - "word" on Windows, otherwise "libreoffice" if installed,
+#                   else "standin" (with a warning: no contract layout)
+PDF_CONVERTER_ENGINE = "auto"
+PDF_CONVERTER_TIMEOUT = 60  # Seconds before a hung conversion restarts the engine
+LIBREOFFICE_PATH = None  # soffice executable (None = search PATH)
+
+# Background jobs (saving, exporting) run off the UI thread
+BACKGROUND_WORKERS = 4  # Worker threads for background jobs
+BACKGROUND_POLL_MS = 50  # How often the UI checks for finished jobs
+
+# Startup: the search window and export modules load on first use; with
+# pre-warming they are imported in the background once the main window is up
+PREWARM_AFTER_LOGIN = True
+PREWARM_DELAY_MS = 500  # Wait after the main window opens before pre-warming
+
+# Bulk export from the search window
+BATCH_EXPORT_FORMAT = "pdf"  # "pdf" or "docx"
+BATCH_EXPORT_WORKERS = None  # Worker processes (None = one per CPU core)
+
+# Contract export timing (exports/timing.py): every export's stages are timed
+# and kept for the search window's "Timings" view
+EXPORT_TIMING_LOG = False  # Also print each export's stage timings
+EXPORT_TIMING_LOG_PATH = None  # Also append them to this JSON Lines file
+EXPORT_TIMING_HISTORY = 20  # Exports kept for the Timings view
+EXPORT_PROFILE = None  # "cprofile", "tracemalloc" or "both": profile every export (slow)
+EXPORT_PROFILE_DIR = None  # Folder for cProfile data (None = system temp folder)
+
 # Theme preference (light, dark, or system)
 THEME_MODE = "system"
 
@@ -29,17 +72,69 @@ PERSIAN_FONT = "Tahoma"
 
 # database path settings
 db_folder = os.path.join(BASE_DIR, "db")
-PCFORM_DB_PATH = os.path.join(db_folder, "pcform_db.db")
+# The PCFORM_DB_PATH environment variable points scripts (cli.py) at another database
+PCFORM_DB_PATH = os.environ.get("PCFORM_DB_PATH") or os.path.join(db_folder, "pcform_db.db")
 
 if not os.path.exists(db_folder):
     os.makedirs(db_folder)
 
+# Database connection pool
+DB_POOL_MAX_SIZE = 5  # Max open connections per database file
+DB_POOL_TIMEOUT = 10  # Seconds to wait for a free connection
+DB_POOL_IDLE_TIMEOUT = 300  # Seconds before an idle connection is closed
+DB_ITER_BATCH_SIZE = 500  # Rows per batch when streaming query results
+IMPORT_BATCH_SIZE = 50000  # Rows per transaction when bulk importing records
+
+# SQLite pragmas applied once to every new connection.
+# WAL lets search windows keep reading while a form is being saved.
+# "durable" fsyncs every commit; "fast" may lose the last commits on power loss
+# (never corrupts the database) in exchange for much cheaper writes.
+DB_PRAGMA_PROFILES = {
+    "durable": {
+        "busy_timeout": 10000,  # ms to wait on a locked database
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -16000,  # negative = KiB, i.e. 16 MB page cache
+        "mmap_size": 0,
+        "temp_store": "MEMORY",
+    },
+    "fast": {
+        "busy_timeout": 5000,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -64000,  # 64 MB page cache
+        "mmap_size": 268435456,  # 256 MB memory-mapped I/O
+        "temp_store": "MEMORY",
+    },
+}
+DB_PRAGMA_PROFILE = "fast"  # "durable" or "fast"
+
+# Query instrumentation: every repository statement is timed and grouped by
+# its shape (see services/query_stats.py and query_stats.summary())
+QUERY_STATS_ENABLED = True
+QUERY_STATS_WINDOW = 2000  # Recent statements kept for the latency histogram
+SLOW_QUERY_MS = 250  # Log statements slower than this (None = no slow-query log)
+SLOW_QUERY_LOG_PATH = None  # Append slow queries to this JSON Lines file (None = print them)
+SLOW_QUERY_EXPLAIN = False  # Add EXPLAIN QUERY PLAN output to slow-query entries
+
+
+# Search window results grid
+# Virtual scrolling keeps only a window of rows in the grid and fetches
+# pages from the database while scrolling; False loads every row up front.
+SEARCH_VIRTUAL_SCROLL = True
+SEARCH_PAGE_SIZE = 200  # Rows fetched per page
+SEARCH_MAX_LOADED_ROWS = 1000  # Rows kept in the grid (visible + buffer)
+SEARCH_LOAD_BATCH_SIZE = 500  # Rows per batch when loading the grid in the background
+SEARCH_DEBOUNCE_MS = 200  # Pause in typing before the search runs (search-as-you-type)
+SEARCH_NARROW_MAX_ROWS = 10000  # Filter up to this many results in memory when a query grows
+
 
 # Security
 MIN_PASSWORD_LENGTH = 6
 USERNAME_PATTERN = r"^[a-zA-Z0-9_]+$"
 
 
-# Generate a unique AppID for your program
+# Generate a unique AppID for your program (taskbar grouping, Windows only)
 myappid = "amirdzh.pcform.config.v2.0"
-ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
+if sys.platform == "win32":
+    ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
@@ -0,0 +1,165 @@
+import atexit
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from settings.config import BACKGROUND_POLL_MS, BACKGROUND_WORKERS
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the shared worker pool for slow, non-UI jobs (created once)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=BACKGROUND_WORKERS, thread_name_prefix="pcform-bg"
+            )
+        return _executor
+
+
+def shutdown_executor() -> None:
+    """Wait for running jobs and stop the pool (registered at exit)."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+atexit.register(shutdown_executor)
+
+
+class TkDispatcher:
+    """
+    Thread-safe queue of callbacks that run on the Tk main thread.
+
+    Tk widgets may only be touched from the thread running mainloop, so
+    workers post() callbacks here and the root drains them with after().
+    Polling only runs while callbacks are expected, and each poll stops after
+    ``TIME_BUDGET`` seconds so a fast producer can't starve user input.
+    """
+
+    TIME_BUDGET = 0.03
+
+    def __init__(self, root):
+        # Created on the Tk thread (see get_dispatcher)
+        self.root = root
+        self._tk_thread = threading.get_ident()
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._pending = 0  # jobs that will still post a completion
+        self._lock = threading.Lock()
+        self._polling = False
+
+    def post(self, callback: Callable, *args) -> None:
+        """
+        Schedule ``callback(*args)`` on the Tk thread (any thread).
+
+        Other threads can't start polling themselves (after() is not thread
+        safe), so posts from a worker are delivered while a background job
+        is running - which is where workers post from.
+        """
+        self._queue.put((callback, args))
+        if threading.get_ident() == self._tk_thread:
+            self._ensure_polling()
+
+    def job_started(self) -> None:
+        with self._lock:
+            self._pending += 1
+        self._ensure_polling()
+
+    def job_finished(self) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def _ensure_polling(self) -> None:
+        # Called on the Tk thread (job submission)
+        if not self._polling:
+            self._polling = True
+            self.root.after(BACKGROUND_POLL_MS, self._poll)
+
+    def _poll(self) -> None:
+        deadline = time.monotonic() + self.TIME_BUDGET
+        while time.monotonic() < deadline:
+            try:
+                callback, args = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"Warning: background callback failed: {e}")
+
+        with self._lock:
+            idle = self._pending == 0 and self._queue.empty()
+        if idle:
+            self._polling = False
+            return
+        try:
+            self.root.after(BACKGROUND_POLL_MS, self._poll)
+        except Exception:
+            self._polling = False  # root destroyed
+
+
+def get_dispatcher(widget) -> TkDispatcher:
+    """Return the dispatcher of the widget's Tk root (created once per root)."""
+    root = widget._root()
+    dispatcher = getattr(root, "_pcform_dispatcher", None)
+    if dispatcher is None:
+        dispatcher = root._pcform_dispatcher = TkDispatcher(root)
+    return dispatcher
+
+
+def run_in_background(
+    widget,
+    func: Callable,
+    *args,
+    on_success: Optional[Callable] = None,
+    on_error: Optional[Callable[[Exception], None]] = None,
+    on_progress: Optional[Callable[[Any], None]] = None,
+    **kwargs,
+) -> Future:
+    """
+    Run ``func(*args, **kwargs)`` on the worker pool, report back on the Tk thread.
+
+    Call from the Tk thread. ``on_success(result)`` / ``on_error(exception)``
+    run on the Tk thread once the job ends. With ``on_progress`` the job is
+    also passed ``progress=`` - a function the worker can call with a value
+    (status text, a batch of rows...) delivered to ``on_progress`` on the
+    Tk thread, in order.
+
+    Usage:
+        run_in_background(
+            self, export_contract, record, path,
+            on_success=self._export_done, on_error=self._export_failed,
+        )
+    """
+    dispatcher = get_dispatcher(widget)
+
+    if on_progress is not None:
+        kwargs["progress"] = lambda message: dispatcher.post(on_progress, message)
+
+    def job():
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            if on_error is not None:
+                dispatcher.post(on_error, e)
+            raise
+        else:
+            if on_success is not None:
+                dispatcher.post(on_success, result)
+            return result
+        finally:
+            dispatcher.job_finished()
+
+    dispatcher.job_started()
+    try:
+        return get_executor().submit(job)
+    except Exception:
+        dispatcher.job_finished()
+        raise
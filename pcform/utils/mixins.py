@@ -1,5 +1,3 @@
-from create_form.form import FormDialog
-from search_form.search import SearchMainFrame
 from utils.widget_utils import center_dialog
 
 
@@ -12,9 +10,11 @@ class FormDialogMixin:
 
     def dialog_create_form(self):
         """Open the create form dialog"""
-        dialog = FormDialog(
-            self, title="Create Form", on_success_callback=self.refresh_search_windows
-        )
+        # Loaded on first use (or pre-warmed, see utils/prewarm.py) for a fast start
+        from create_form.form import FormDialog
+
+        # Open search windows update themselves from repository change events
+        dialog = FormDialog(self, title="Create Form")
         center_dialog(dialog, 700, 750)
         dialog.transient(self)  # Make it appear above parent
         dialog.lift()  # Bring to front
@@ -29,6 +29,8 @@ class FormDialogMixin:
 
     def dialog_search(self):
         """Open the search forms main frame"""
+        from search_form.search import SearchMainFrame
+
         main_frame = SearchMainFrame(self, title="Search Forms", app_ref=self)
         center_dialog(main_frame, 1200, 850)
         # Make it a transient window (appears above parent)
@@ -51,10 +53,3 @@ class FormDialogMixin:
         if window in self.open_search_windows:
             self.open_search_windows.remove(window)
         window.destroy()
-
-    def refresh_search_windows(self):
-        """Refresh any open search windows"""
-        # This will be called after form creation to refresh search results
-        for search_window in self.open_search_windows:
-            if search_window.winfo_exists():
-                search_window.database_frame.populate_treeview()
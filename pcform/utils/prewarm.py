@@ -0,0 +1,53 @@
+import importlib
+import threading
+from typing import Iterable, Optional, Tuple
+
+# Modules the main window imports on first use, slowest first
+PREWARM_MODULES = (
+    "search_form.search",  # search window, repositories, token index
+    "create_form.form",
+    "search_form.bulk_export",  # batch export, multiprocessing
+    "exports.table_export",
+    "services.table_import",
+    "openpyxl",  # Excel export and import
+)
+
+
+def pdf_modules() -> Tuple[str, ...]:
+    """Modules the configured PDF backend imports when a contract is exported."""
+    from exports.pdf_converter import get_pdf_backend
+
+    if get_pdf_backend() == "native":
+        return ("exports.pdf_renderer",)  # reportlab
+    return ("exports.document_generator",)  # python-docx, jdatetime
+
+
+def prewarm_modules(modules: Optional[Iterable[str]] = None) -> threading.Thread:
+    """
+    Import modules on a background thread so their first use doesn't wait.
+
+    Import-time work only: nothing here may touch Tk. A module the UI asks
+    for while it is still loading just waits for it (Python's import lock).
+    A module that fails to import is skipped; using the feature reports
+    the error as usual.
+
+    Usage:
+        root.after(500, prewarm_modules)
+    """
+
+    def run():
+        names = list(modules or PREWARM_MODULES)
+        if modules is None:
+            try:
+                names += pdf_modules()
+            except Exception as e:
+                print(f"Warning: PDF modules not pre-loaded: {e}")
+        for name in names:
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                print(f"Warning: could not pre-load {name}: {e}")
+
+    thread = threading.Thread(target=run, name="pcform-prewarm", daemon=True)
+    thread.start()
+    return thread
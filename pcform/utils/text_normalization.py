@@ -0,0 +1,56 @@
+import re
+import unicodedata
+from typing import Any
+
+# Arabic code points that have a Persian twin (or are the same letter
+# written another way), mapped to the Persian form
+PERSIAN_LETTERS = {
+    "ي": "ی",  # ي Arabic yeh -> ی
+    "ى": "ی",  # ى alef maksura -> ی
+    "ك": "ک",  # ك Arabic kaf -> ک
+    "ة": "ه",  # ة teh marbuta -> ه
+    "ۀ": "ه",  # ۀ heh with yeh -> ه
+    "أ": "ا",  # أ alef with hamza above -> ا
+    "إ": "ا",  # إ alef with hamza below -> ا
+    "آ": "ا",  # آ alef with madda -> ا
+    "ٱ": "ا",  # ٱ alef wasla -> ا
+    "ؤ": "و",  # ؤ waw with hamza -> و
+    "ئ": "ی",  # ئ yeh with hamza -> ی
+}
+
+# Persian (۰-۹) and Arabic-Indic (٠-٩) digits -> ASCII
+DIGITS = {
+    **{chr(0x06F0 + i): str(i) for i in range(10)},
+    **{chr(0x0660 + i): str(i) for i in range(10)},
+}
+
+# Dropped entirely: ZWNJ, ZWJ, direction marks, soft hyphen, BOM and tatweel (ـ)
+REMOVED = "\u200c\u200d\u200e\u200f\u00ad\ufeff\u0640"
+# Arabic diacritics: harakat, tanwin, shadda, sukun, superscript alef, Quranic marks
+ARABIC_DIACRITICS = re.compile("[\u064b-\u065f\u0670\u06d6-\u06ed]")
+
+_TRANSLATION = str.maketrans({**PERSIAN_LETTERS, **DIGITS, **{ch: None for ch in REMOVED}})
+
+
+def normalize_text(value: Any) -> str:
+    """
+    Normalize text so spelling variants compare equal.
+
+    Applied when records are written (the normalized copies are what the
+    search index holds) and to every search query, so a single lookup
+    finds all variants:
+
+    - presentation forms and other compatibility characters (NFKC)
+    - Arabic ي/ك/ة... -> Persian ی/ک/ه..., hamza-carrying alefs -> ا
+    - Persian and Arabic-Indic digits -> 0-9
+    - ZWNJ, tatweel and Arabic diacritics removed
+    - lowercase
+
+    Usage:
+        normalize_text("كيبورد  ۱۲")  # -> "کیبورد  12"
+    """
+    text = str(value or "")
+    if text.isascii():
+        return text.lower()  # fast path: nothing to map
+    text = unicodedata.normalize("NFKC", text).translate(_TRANSLATION)
+    return ARABIC_DIACRITICS.sub("", text).lower()
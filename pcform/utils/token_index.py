@@ -0,0 +1,170 @@
+from array import array
+from bisect import bisect_left, insort
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from repositories.pcform_repo import PCFormRepository
+
+
+class TokenIndex:
+    """
+    In-memory inverted index over records already loaded in the client.
+
+    Each column maps every word to a sorted array of record ids; a sorted
+    vocabulary per column gives prefix lookups with bisect. Matching follows
+    the full-text index rules: every query token must match the start of a
+    word (multi-word tokens as a phrase within one column), so a search costs
+    in proportion to the matches, not to the number of records.
+
+    Not thread-safe: build it on one thread, then use it only on another.
+
+    Usage:
+        index = TokenIndex()
+        index.add_many(rows)
+        results = index.search("dell ali")
+        index.add(record)  # after a change event
+    """
+
+    CACHE_SIZE = 64  # Prefix lookups remembered between searches
+
+    def __init__(self, columns: Optional[List[str]] = None):
+        self.columns = list(columns or PCFormRepository.SEARCHABLE_COLUMNS)
+        self._records: Dict[int, Dict[str, Any]] = {}
+        # Per column: word -> sorted ids, and the sorted words
+        self._postings: List[Dict[str, array]] = [{} for _ in self.columns]
+        self._vocabulary: List[List[str]] = [[] for _ in self.columns]
+        self._prefix_cache: Dict[tuple, Set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, record_id) -> bool:
+        return record_id in self._records
+
+    def add_many(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Index a batch of records (much faster than calling add for each)."""
+        new_words: List[Dict[str, List[int]]] = [defaultdict(list) for _ in self.columns]
+        for record in records:
+            record_id = record["id"]
+            if record_id in self._records:
+                self.remove(record_id)
+            self._records[record_id] = record
+            for words, column_words in zip(new_words, self._record_words(record)):
+                for word in column_words:
+                    words[word].append(record_id)
+
+        for postings, vocabulary, words in zip(self._postings, self._vocabulary, new_words):
+            for word, ids in words.items():
+                existing = postings.get(word)
+                if existing is not None:
+                    ids.extend(existing)
+                postings[word] = array("q", sorted(ids))
+            if words:
+                vocabulary[:] = sorted(postings)
+        self._prefix_cache.clear()
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Index one record (replaces its previous version)."""
+        record_id = record["id"]
+        if record_id in self._records:
+            self.remove(record_id)
+        self._records[record_id] = record
+        for postings, vocabulary, words in zip(
+            self._postings, self._vocabulary, self._record_words(record)
+        ):
+            for word in words:
+                ids = postings.get(word)
+                if ids is None:
+                    postings[word] = array("q", [record_id])
+                    insort(vocabulary, word)
+                else:
+                    ids.insert(bisect_left(ids, record_id), record_id)
+        self._prefix_cache.clear()
+
+    def remove(self, record_id) -> None:
+        """Drop a record from the index (no-op if it isn't indexed)."""
+        record = self._records.pop(record_id, None)
+        if record is None:
+            return
+        for postings, vocabulary, words in zip(
+            self._postings, self._vocabulary, self._record_words(record)
+        ):
+            for word in words:
+                ids = postings.get(word)
+                if ids is None:
+                    continue
+                position = bisect_left(ids, record_id)
+                if position < len(ids) and ids[position] == record_id:
+                    del ids[position]
+                if not ids:
+                    del postings[word]
+                    del vocabulary[bisect_left(vocabulary, word)]
+        self._prefix_cache.clear()
+
+    def _record_words(self, record: Dict[str, Any]) -> List[Set[str]]:
+        """Distinct words of each indexed column (folded once for the whole record)"""
+        text = PCFormRepository.fold_text("\0".join(str(record.get(c) or "") for c in self.columns))
+        return [set(PCFormRepository.WORD_PATTERN.findall(value)) for value in text.split("\0")]
+
+    def search(self, query: str, columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Records matching every token of ``query``, newest first.
+
+        Args:
+            query: Search text; an empty query returns every record
+            columns: Restrict matching to these columns (default: all indexed)
+        """
+        column_indexes = [
+            i for i, column in enumerate(self.columns) if columns is None or column in columns
+        ]
+        matches: Optional[Set[int]] = None
+        for words in PCFormRepository.query_phrases(query):
+            token_ids: Set[int] = set()
+            for i in column_indexes:
+                token_ids |= self._phrase_ids(i, words)
+            matches = token_ids if matches is None else matches & token_ids
+            if not matches:
+                return []
+
+        ids = self._records.keys() if matches is None else matches
+        return [self._records[record_id] for record_id in sorted(ids, reverse=True)]
+
+    def _phrase_ids(self, column_index: int, words: List[str]) -> Set[int]:
+        """Ids whose column holds the words in a row, the last one as a prefix"""
+        *whole, last = words
+        ids = set(self._prefix_ids(column_index, last))
+        if not whole:
+            return ids
+        postings = self._postings[column_index]
+        for word in whole:
+            ids.intersection_update(postings.get(word, ()))
+            if not ids:
+                return ids
+        # Every word is there; check they are adjacent and in order
+        column = self.columns[column_index]
+        pattern = PCFormRepository.phrase_pattern(words)
+        return {
+            record_id
+            for record_id in ids
+            if pattern.search(PCFormRepository.fold_text(self._records[record_id].get(column)))
+        }
+
+    def _prefix_ids(self, column_index: int, prefix: str) -> Set[int]:
+        """Ids with a word starting with ``prefix`` in the column (cached)"""
+        key = (column_index, prefix)
+        ids = self._prefix_cache.get(key)
+        if ids is not None:
+            return ids
+
+        postings = self._postings[column_index]
+        vocabulary = self._vocabulary[column_index]
+        ids = set()
+        position = bisect_left(vocabulary, prefix)
+        while position < len(vocabulary) and vocabulary[position].startswith(prefix):
+            ids.update(postings[vocabulary[position]])
+            position += 1
+
+        if len(self._prefix_cache) >= self.CACHE_SIZE:
+            self._prefix_cache.pop(next(iter(self._prefix_cache)))
+        self._prefix_cache[key] = ids
+        return ids